@@ -10,6 +10,7 @@ from .prediction_engine import PredictionEngineAgent
 from .value_identifier import ValueIdentifierAgent
 from .reporting_agent import ReportingAgent
 from .qa_agent import QAAgent
+from .conductor import ProjectConductor
 
 # Define public interface for the agents module
 __all__ = [
@@ -20,7 +21,8 @@ __all__ = [
     'PredictionEngineAgent',
     'ValueIdentifierAgent',
     'ReportingAgent',
-    'QAAgent'
+    'QAAgent',
+    'ProjectConductor'
 ]
 
 # Agent registry for dynamic creation
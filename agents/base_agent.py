@@ -1,10 +1,14 @@
 import abc
 import json
 import git
+import numpy as np
 from datetime import datetime
 from config import Config
 
 class BaseAgent(abc.ABC):
+    # Budget an agent of this type is expected to spend; 0 means free work
+    budget_cost = 0.0
+    
     def __init__(self, agent_id, conductor):
         self.agent_id = agent_id
         self.conductor = conductor
@@ -31,6 +35,13 @@ class BaseAgent(abc.ABC):
         })
         return self.conductor.create_agent(agent_type, task_spec)
     
+    def get_upstream_result(self):
+        """Merged results of the agents that handed off to this one"""
+        merged = {}
+        for result in self.conductor.get_upstream_results(self.agent_id).values():
+            merged.update(result)
+        return merged
+        
     def create_version_snapshot(self, message):
         try:
             repo = git.Repo('sports_betting_ai')
@@ -46,14 +57,19 @@ class BaseAgent(abc.ABC):
             print(f"Version control error: {str(e)}")
             return False
     
-    def log_performance(self, result, confidence):
-        self.conductor.performance_log.append({
-            "agent": self.agent_id,
-            "timestamp": datetime.now(),
-            "result": result,
-            "confidence": confidence,
-            "cost": self.cost
-        })
+    def log_performance(self, result, confidence, profit=None):
+        # Without a settled stake, profit falls back to the +/- 10x cost estimate
+        if profit is None:
+            profit = self.cost * 10 if result == "win" else -self.cost * 10
+        self.conductor.performance_log.append(self.agent_id, result, confidence, self.cost, profit)
+        
+    def log_performance_batch(self, results, confidences, profits=None, stakes=None):
+        """Log many settled bets at once"""
+        if profits is None:
+            profits = np.where(np.asarray(results) == "win", self.cost * 10, -self.cost * 10)
+        self.conductor.performance_log.extend(
+            self.agent_id, results, confidences, self.cost, profits, stakes=stakes
+        )
     
     def request_human_approval(self, reason):
         # In production, would trigger notification
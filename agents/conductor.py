@@ -0,0 +1,277 @@
+import time
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from config import Config
+from utils.odds_book import OddsBook
+from utils.prediction_ledger import PredictionLedger
+from utils.performance_log import PerformanceLog
+from utils.shadow_log import ShadowLog
+from models.production_model import ProductionModel
+from models.shadow_scoring import ShadowScorer
+
+class ProjectConductor:
+    """
+    Owns shared pipeline state and schedules agents as a DAG
+    
+    Every agent is a node. When a running agent hands off work
+    (`create_sub_agent`), the new agent becomes a child of the running
+    one and only starts once all of its parents have finished. Nodes
+    whose parents are done run concurrently on a bounded worker pool,
+    and each one reads its inputs from its parents' results rather than
+    from whatever happened to finish last.
+    
+    Budget is a resource: agents declare a `budget_cost`, which is
+    reserved when they start. Paid agents that would take the budget
+    below Config.BUDGET_RESERVE are deferred; free agents keep running,
+    and deferred work is dispatched as soon as budget is replenished.
+    """
+    
+    def __init__(self, initial_budget=Config.INITIAL_BUDGET, max_workers=None):
+        self.budget = initial_budget
+        self.reserved = 0.0
+        self.budget_reserve = Config.BUDGET_RESERVE
+        self.max_workers = max_workers or Config.MAX_CONCURRENT_AGENTS
+        
+        # Shared state read and written by the agents
+        self.agent_pool = {}
+        self.model_registry = {}  # name -> ProductionModel
+        self.performance_log = PerformanceLog(Config.PERFORMANCE_LOG_DIR)
+        # Rows in the partial chunk are only on disk once flushed
+        atexit.register(self.performance_log.flush)
+        self.prediction_log = PredictionLedger()
+        self.shadow_log = ShadowLog()
+        self.shadow_scorer = ShadowScorer(self.shadow_log)
+        self.task_history = []
+        self.version_snapshots = {}
+        self.current_predictions = None
+        self.odds_book = OddsBook()
+        
+        # DAG bookkeeping
+        self.nodes = {}
+        self.agent_metrics = {}
+        self.lock = threading.RLock()
+        self._local = threading.local()
+        self._counter = 0
+        self._wake = threading.Event()
+        self._deferred = set()
+        
+    def create_agent(self, agent_type, task_spec=None, parents=None):
+        """
+        Create an agent node and return its id
+        
+        The agent currently executing on this thread (if any) becomes the
+        node's parent, so handoffs turn into DAG edges automatically.
+        Unknown agent types are reported and skipped, returning None.
+        """
+        from . import create_agent as build_agent
+        
+        with self.lock:
+            self._counter += 1
+            agent_id = f"{agent_type}_{self._counter}"
+            
+        try:
+            agent = build_agent(agent_type, agent_id, self, task_spec)
+        except ValueError as e:
+            print(f"Skipping agent {agent_id}: {str(e)}")
+            return None
+        if not hasattr(agent, "task_spec"):
+            agent.task_spec = {}
+            
+        if parents is None:
+            current = getattr(self._local, "agent_id", None)
+            parents = [current] if current else []
+            
+        with self.lock:
+            self.nodes[agent_id] = {
+                "agent": agent,
+                "type": agent_type,
+                "parents": set(parents),
+                "children": set(),
+                "status": "pending",
+                "result": None,
+                "created_at": time.perf_counter(),
+                "ready_at": None
+            }
+            for parent_id in parents:
+                self.nodes[parent_id]["children"].add(agent_id)
+            self.agent_pool[agent_id] = agent
+            self._mark_ready_if_unblocked(agent_id)
+        return agent_id
+        
+    def model_slot(self, name):
+        """The ProductionModel serving a model name, created on first use"""
+        with self.lock:
+            if name not in self.model_registry:
+                self.model_registry[name] = ProductionModel(name)
+            return self.model_registry[name]
+            
+    def add_dependency(self, agent_id, parent_id):
+        """Add an explicit edge so agent_id also waits for parent_id"""
+        with self.lock:
+            node = self.nodes[agent_id]
+            if node["status"] != "pending":
+                raise ValueError(f"Cannot add dependency to {node['status']} agent {agent_id}")
+            node["parents"].add(parent_id)
+            self.nodes[parent_id]["children"].add(agent_id)
+            node["ready_at"] = None
+            self._mark_ready_if_unblocked(agent_id)
+            
+    def replenish_budget(self, amount):
+        """Add budget and wake the scheduler so deferred agents can start"""
+        with self.lock:
+            self.budget += amount
+        print(f"Budget replenished by {amount:.2f} to {self.budget:.2f}")
+        self._wake.set()
+        
+    def available_budget(self):
+        with self.lock:
+            return self.budget - self.reserved - self.budget_reserve
+            
+    def _try_reserve(self, agent_id):
+        """Reserve an agent's declared cost; False if it must wait for budget"""
+        cost = self.nodes[agent_id]["agent"].budget_cost
+        with self.lock:
+            if cost > 0 and self.budget - self.reserved - cost < self.budget_reserve:
+                if agent_id not in self._deferred:
+                    self._deferred.add(agent_id)
+                    print(f"Budget low - deferring {agent_id} until budget is replenished")
+                return False
+            self.reserved += cost
+            self._deferred.discard(agent_id)
+            return True
+            
+    def get_upstream_results(self, agent_id):
+        """Results of an agent's parents, keyed by parent id"""
+        with self.lock:
+            return {
+                parent_id: self.nodes[parent_id]["result"]
+                for parent_id in self.nodes[agent_id]["parents"]
+            }
+            
+    def _mark_ready_if_unblocked(self, agent_id):
+        node = self.nodes[agent_id]
+        if node["status"] != "pending" or node["ready_at"] is not None:
+            return
+        if all(self.nodes[p]["status"] == "done" for p in node["parents"]):
+            node["ready_at"] = time.perf_counter()
+            
+    def _ready_nodes(self):
+        with self.lock:
+            ready = [
+                (node["ready_at"], agent_id)
+                for agent_id, node in self.nodes.items()
+                if node["status"] == "pending" and node["ready_at"] is not None
+            ]
+        return [agent_id for _, agent_id in sorted(ready)]
+        
+    def _execute_node(self, agent_id):
+        node = self.nodes[agent_id]
+        started = time.perf_counter()
+        self._local.agent_id = agent_id
+        try:
+            result = node["agent"].execute()
+            status = "done"
+        except Exception as e:
+            print(f"Agent {agent_id} failed: {str(e)}")
+            result = {"status": "error", "message": str(e)}
+            status = "failed"
+        finally:
+            self._local.agent_id = None
+        finished = time.perf_counter()
+        
+        self.agent_metrics[agent_id] = {
+            "type": node["type"],
+            "queue_wait": started - node["ready_at"],
+            "wall_time": finished - started,
+            "status": status
+        }
+        return status, result
+        
+    def _complete(self, agent_id, status, result):
+        with self.lock:
+            node = self.nodes[agent_id]
+            node["status"] = status
+            node["result"] = result or {}
+            agent = self.agent_pool.pop(agent_id, None)
+            if agent is not None:
+                self.reserved -= agent.budget_cost
+                self.budget -= agent.cost
+            self.task_history.append({
+                "agent_id": agent_id,
+                "agent_type": node["type"],
+                "timestamp": datetime.now(),
+                "result": node["result"]
+            })
+            for child_id in node["children"]:
+                if status == "done":
+                    self._mark_ready_if_unblocked(child_id)
+                else:
+                    self._skip(child_id)
+                    
+    def _skip(self, agent_id):
+        node = self.nodes[agent_id]
+        if node["status"] != "pending":
+            return
+        node["status"] = "skipped"
+        self.agent_pool.pop(agent_id, None)
+        for child_id in node["children"]:
+            self._skip(child_id)
+            
+    def _skip_deferred(self):
+        with self.lock:
+            for agent_id in sorted(self._deferred):
+                print(f"Budget not replenished - skipping {agent_id}")
+                self._skip(agent_id)
+            self._deferred.clear()
+            
+    def run(self, on_complete=None, wait_for_budget=True, budget_timeout=None):
+        """
+        Execute the DAG until no runnable agents remain
+        
+        Args:
+            on_complete (callable): Called as on_complete(agent_id, result)
+                on the scheduling thread after each agent finishes
+            wait_for_budget (bool): When only budget-deferred agents are
+                left, wait for replenish_budget() instead of returning
+            budget_timeout (float): Seconds to wait for a top-up before the
+                deferred agents are reported as skipped (defaults to
+                Config.BUDGET_WAIT_TIMEOUT)
+        """
+        budget_timeout = Config.BUDGET_WAIT_TIMEOUT if budget_timeout is None else budget_timeout
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="agent") as executor:
+            while True:
+                for agent_id in self._ready_nodes():
+                    if len(running) >= self.max_workers:
+                        break
+                    if not self._try_reserve(agent_id):
+                        continue
+                    with self.lock:
+                        self.nodes[agent_id]["status"] = "running"
+                    future = executor.submit(self._execute_node, agent_id)
+                    future.add_done_callback(lambda _: self._wake.set())
+                    running[future] = agent_id
+                    
+                if not running and not (self._deferred and wait_for_budget):
+                    break
+                    
+                # Woken by a finished agent or by replenish_budget(); with
+                # nothing running only a top-up can wake us, so give up on
+                # the deferred agents after budget_timeout
+                woken = self._wake.wait(None if running else budget_timeout)
+                self._wake.clear()
+                if not woken and not running:
+                    self._skip_deferred()
+                    break
+                done = [future for future in running if future.done()]
+                for future in done:
+                    agent_id = running.pop(future)
+                    status, result = future.result()
+                    self._complete(agent_id, status, result)
+                    if on_complete:
+                        on_complete(agent_id, self.nodes[agent_id]["result"])
+                        
+        self.performance_log.flush()
+        return self.agent_metrics
@@ -2,33 +2,21 @@ import requests
 import pandas as pd
 from datetime import datetime, timedelta
 from .base_agent import BaseAgent
-from utils.api_clients import HollywoodbetsClient, BetwayClient
+from utils.api_clients import create_client, collect_odds_concurrently
 from config import Config
 
 class DataCollectorAgent(BaseAgent):
+    budget_cost = Config.DATA_COLLECTION_COST_ESTIMATE
+    
+    # Clients are shared across cycles so they keep their pooled connections
+    _clients = {}
+    
     def execute(self):
         print(f"[{self.agent_id}] Collecting data from {Config.BOOKMAKERS}")
-        all_data = []
-        
-        # Collect from primary sources
-        for bookmaker in Config.BOOKMAKERS:
-            try:
-                if bookmaker == "Hollywoodbets":
-                    client = HollywoodbetsClient(Config.HOLLYWOODBETS_API_KEY)
-                else:
-                    client = BetwayClient(Config.BETWAY_API_KEY)
-                
-                data = client.get_dc_btts_odds()
-                all_data.append(data)
-                self.log_success(bookmaker, len(data))
-                self.cost += 0.01 * len(data)  # Simulate API cost
-            except Exception as e:
-                print(f"Error collecting {bookmaker} data: {str(e)}")
-                self.handle_error(bookmaker, str(e))
-                # Self-healing: Try historical data
-                historical_data = self.get_historical_data(bookmaker)
-                if historical_data is not None:
-                    all_data.append(historical_data)
+        if Config.COLLECTION_MODE == "concurrent":
+            all_data = self.collect_concurrently(Config.BOOKMAKERS)
+        else:
+            all_data = self.collect_sequentially(Config.BOOKMAKERS)
         
         # Create feature engineering sub-agent
         feature_agent_id = self.create_sub_agent(
@@ -41,9 +29,72 @@ class DataCollectorAgent(BaseAgent):
         return {
             "status": "success", 
             "data_points": sum(len(d) for d in all_data),
+            "data": all_data,
             "next_agent": feature_agent_id
         }
     
+    def get_client(self, bookmaker):
+        """Return the cached client for a bookmaker, creating it on first use"""
+        client = self._clients.get(bookmaker)
+        if client is None:
+            client = create_client(bookmaker)
+            DataCollectorAgent._clients[bookmaker] = client
+        return client
+        
+    def supported(self, bookmakers):
+        """Bookmakers with an API client; the rest are reported and skipped"""
+        known = []
+        for bookmaker in bookmakers:
+            try:
+                self.get_client(bookmaker)
+                known.append(bookmaker)
+            except ValueError as e:
+                print(f"Skipping {bookmaker}: {str(e)}")
+        return known
+        
+    def collect_sequentially(self, bookmakers):
+        all_data = []
+        for bookmaker in self.supported(bookmakers):
+            try:
+                data = self.get_client(bookmaker).get_dc_btts_odds()
+                self.record_source(bookmaker, data)
+                all_data.append(data)
+            except Exception as e:
+                self.recover_source(bookmaker, str(e), all_data)
+        return all_data
+        
+    def collect_concurrently(self, bookmakers):
+        """Fetch every bookmaker in parallel, merging frames as they arrive"""
+        all_data = []
+        clients = {bookmaker: self.get_client(bookmaker) for bookmaker in self.supported(bookmakers)}
+        
+        def on_result(bookmaker, data, elapsed):
+            self.record_source(bookmaker, data)
+            all_data.append(data)
+            
+        _, errors = collect_odds_concurrently(
+            clients,
+            timeout=Config.SOURCE_TIMEOUT,
+            on_result=on_result
+        )
+        
+        for bookmaker, error in errors.items():
+            self.recover_source(bookmaker, error, all_data)
+        return all_data
+        
+    def record_source(self, bookmaker, data):
+        self.conductor.odds_book.update_frame(data, bookmaker=bookmaker)
+        self.log_success(bookmaker, len(data))
+        self.cost += 0.01 * len(data)  # Simulate API cost
+        
+    def recover_source(self, bookmaker, error, all_data):
+        print(f"Error collecting {bookmaker} data: {error}")
+        self.handle_error(bookmaker, error)
+        # Self-healing: Try historical data
+        historical_data = self.get_historical_data(bookmaker)
+        if historical_data is not None:
+            all_data.append(historical_data)
+            
     def get_historical_data(self, bookmaker):
         """Fallback to historical data when API fails"""
         try:
@@ -2,20 +2,25 @@ import pandas as pd
 import numpy as np
 from .base_agent import BaseAgent
 from config import Config
-from utils.data_utils import calculate_form_index, calculate_injury_impact
+from utils.feature_store import get_feature_store
+from utils.data_utils import form_index_columns, injury_impact_columns
 
 class FeatureEngineerAgent(BaseAgent):
     def execute(self):
         print(f"[{self.agent_id}] Engineering features")
         # Get data from previous agent
-        raw_data = self.conductor.task_history[-1]["result"]["data"]
+        raw_data = self.get_upstream_result()["data"]
         
-        # Process features
+        # Process features, reusing stored rows for unchanged fixtures
+        feature_store = get_feature_store()
         processed_data = []
         for bookmaker_data in raw_data:
-            df = self.process_features(bookmaker_data)
+            df = feature_store.compute(bookmaker_data, self.process_features)
             processed_data.append(df)
         
+        stats = feature_store.stats()
+        print(f"Feature store: {stats['hits']} hits, {stats['misses']} misses")
+        
         # Create model training sub-agent
         model_agent_id = self.create_sub_agent(
             "model_trainer",
@@ -29,15 +34,28 @@ class FeatureEngineerAgent(BaseAgent):
         return {
             "status": "success", 
             "feature_count": len(Config.REQUIRED_FEATURES),
+            "feature_store": stats,
+            "data": processed_data,
             "next_agent": model_agent_id
         }
     
     def process_features(self, df):
-        # Calculate complex features
-        df["player_form"] = df.apply(lambda x: calculate_form_index(x['home_players'], x['away_players']), axis=1)
-        df["team_form"] = df.apply(lambda x: np.mean([x['home_form'], x['away_form']]), axis=1)
-        df["coach_form"] = df.apply(lambda x: (x['home_coach_rating'] + x['away_coach_rating']) / 2, axis=1)
-        df["injury_impact"] = df.apply(lambda x: calculate_injury_impact(x['home_injuries'], x['away_injuries']), axis=1)
+        """
+        Columnar feature path: nested lists are flattened once, then NumPy ops
+        
+        Per-side values are kept as numeric home_/away_ columns and, like
+        team_form and coach_form, averaged into the scalar feature.
+        """
+        home_form, away_form = form_index_columns(df["home_players"], df["away_players"])
+        df["home_player_form"] = home_form
+        df["away_player_form"] = away_form
+        df["player_form"] = (home_form + away_form) / 2
+        df["team_form"] = (df["home_form"].to_numpy(dtype=float) + df["away_form"].to_numpy(dtype=float)) / 2
+        df["coach_form"] = (df["home_coach_rating"] + df["away_coach_rating"]) / 2
+        home_injury, away_injury = injury_impact_columns(df["home_injuries"], df["away_injuries"])
+        df["home_injury_impact"] = home_injury
+        df["away_injury_impact"] = away_injury
+        df["injury_impact"] = (home_injury + away_injury) / 2
         df["home_advantage"] = df["home_win_pct"] - df["away_win_pct"]
         
         # Weather impact
@@ -48,8 +66,11 @@ class FeatureEngineerAgent(BaseAgent):
         )
         
         # Pitch condition
-        df["pitch_quality"] = df["pitch_rating"].apply(
-            lambda x: 1.0 if x > 7 else 0.7 if x > 5 else 0.5
+        pitch_rating = df["pitch_rating"].to_numpy(dtype=float)
+        df["pitch_quality"] = np.select(
+            [pitch_rating > 7, pitch_rating > 5],
+            [1.0, 0.7],
+            default=0.5
         )
         
         # Select required features
@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 import joblib
 from tensorflow.keras.models import Sequential, load_model
 from tensorflow.keras.layers import LSTM, Dense, Dropout
@@ -6,21 +7,45 @@ from sklearn.ensemble import GradientBoostingClassifier
 from sklearn.model_selection import train_test_split
 from .base_agent import BaseAgent
 from models.hybrid_model import HybridModel
+from models.training_budget import successive_halving
 from config import Config
 
 class ModelTrainerAgent(BaseAgent):
     def execute(self):
         print(f"[{self.agent_id}] Training model")
-        # Get processed data from feature engineer
-        all_data = self.conductor.task_history[-1]["result"]["data"]
-        combined_data = pd.concat(all_data, ignore_index=True)
+        # QA passes training data explicitly; otherwise use the feature engineer's output
+        all_data = self.task_spec.get("data")
+        if all_data is None:
+            all_data = self.get_upstream_result().get("data")
+        if all_data is None:
+            print("No training data available - triggering data collection")
+            collector_id = self.create_sub_agent(
+                "data_collector",
+                {"sources": Config.BOOKMAKERS}
+            )
+            return {"status": "pending", "next_agent": collector_id}
+        combined_data = pd.concat(all_data, ignore_index=True) if isinstance(all_data, list) else all_data
         
-        # Train model
-        model = HybridModel()
-        model.train(combined_data, target="dc_btts")
+        # Train model: one early-stopped fit, or a hyperparameter search when
+        # requested (it costs several fixed-schedule fits)
+        search = self.task_spec.get("search", self.task_spec.get("retrain") and Config.HYPERPARAMETER_SEARCH)
+        if search:
+            model, report = successive_halving(combined_data, target="dc_btts")
+            accuracy = model.training_report["val_accuracy"]
+            print(
+                f"Hyperparameter search used {report['compute_vs_fixed']:.1f}x the compute of one fixed-schedule fit "
+                f"({report['compute_saved_vs_exhaustive']:.0%} less than training every candidate fully)"
+            )
+        else:
+            model = HybridModel()
+            accuracy = model.train(combined_data, target="dc_btts")
+            report = model.training_report
+            print(
+                f"Early stopping used {report['gbm_estimators']}/{Config.HYBRID_PARAMS['gbm_n_estimators']} estimators "
+                f"and {report['lstm_epochs']}/{Config.HYBRID_PARAMS['lstm_epochs']} epochs, "
+                f"saving {report['compute_saved_vs_fixed']:.0%} of fixed-schedule compute"
+            )
         
-        # Validate model
-        accuracy = model.validate()
         print(f"Model accuracy: {accuracy:.2%}")
         
         # Self-healing if performance is low
@@ -35,8 +60,13 @@ class ModelTrainerAgent(BaseAgent):
                 }
             )
         
-        # Register model
-        self.conductor.model_registry["dc_btts_predictor"] = model
+        # Promote the model; while one is serving, warmup runs in the background
+        slot = self.conductor.model_slot("dc_btts_predictor")
+        if self.task_spec.get("shadow"):
+            slot.add_candidate(self.task_spec.get("label", self.agent_id), model)
+        else:
+            canary = combined_data.tail(Config.MODEL_CANARY_ROWS)
+            slot.promote(model, canary=canary)
         
         # Create prediction agent
         prediction_agent_id = self.create_sub_agent(
@@ -3,14 +3,18 @@ import numpy as np
 from .base_agent import BaseAgent
 from config import Config
 from utils.data_utils import preprocess_prediction_data
+from utils.feature_store import get_feature_store
+from models.feature_schema import DEFAULT_FEATURE_SCHEMA
+from models.shadow_scoring import positive_proba
 
 class PredictionEngineAgent(BaseAgent):
     def execute(self):
         print(f"[{self.agent_id}] Generating predictions")
         min_confidence = self.task_spec.get("min_confidence", 0.65)
         
-        # Get trained model
-        model = self.conductor.model_registry.get("dc_btts_predictor")
+        # Pin the serving version for this whole batch
+        slot = self.conductor.model_registry.get("dc_btts_predictor")
+        model = slot.acquire() if slot else None
         if not model:
             print("No model found - creating model training sub-agent")
             trainer_id = self.create_sub_agent(
@@ -22,14 +26,19 @@ class PredictionEngineAgent(BaseAgent):
         # Get latest data
         raw_data = self.get_latest_data()
         
-        # Preprocess data
-        prediction_data = preprocess_prediction_data(raw_data)
+        # Preprocess data, reusing stored features for unchanged fixtures
+        prediction_data = preprocess_prediction_data(raw_data, feature_store=get_feature_store())
         
         # Generate predictions
         predictions = self.generate_predictions(model, prediction_data, min_confidence)
         
-        # Store predictions
+        # Store predictions and queue them for result verification
         self.conductor.current_predictions = predictions
+        # Ledger row ids travel with the predictions so staking can fill them in
+        predictions["ledger_row"] = self.conductor.prediction_log.record_frame(predictions)
+        
+        # Candidates score the same fixtures off the production path
+        self.conductor.shadow_scorer.submit(model, slot.candidates, prediction_data, predictions)
         
         # Create QA sub-agent
         qa_agent_id = self.create_sub_agent(
@@ -67,8 +76,9 @@ class PredictionEngineAgent(BaseAgent):
             return pd.DataFrame()
         
         # Make predictions
-        features = data[Config.REQUIRED_FEATURES]
-        probabilities = model.predict_proba(features)[:, 1]
+        schema = getattr(model, "feature_schema", None) or DEFAULT_FEATURE_SCHEMA
+        features = schema.select(data)
+        probabilities = positive_proba(model.predict_proba(features))
         
         # Create prediction results
         predictions = data[["match_id", "home_team", "away_team"]].copy()
@@ -80,13 +90,12 @@ class PredictionEngineAgent(BaseAgent):
             1 - probabilities
         )
         
-        # Add bookmaker odds
-        bookmaker_odds = self.get_bookmaker_odds()
-        predictions = predictions.merge(
-            bookmaker_odds,
-            on="match_id",
-            how="left"
-        )
+        # Add the best available price across bookmakers
+        best = self.conductor.odds_book.best_prices(predictions["match_id"].tolist())
+        if not best:
+            sample = self.get_bookmaker_odds()
+            best = dict(zip(sample["match_id"], sample["bookmaker_odds"]))
+        predictions["bookmaker_odds"] = predictions["match_id"].map(best)
         
         # Calculate value score
         predictions["implied_prob"] = 1 / predictions["bookmaker_odds"]
@@ -94,9 +103,36 @@ class PredictionEngineAgent(BaseAgent):
         
         return predictions
     
+    def apply_odds_deltas(self, deltas, tracker):
+        """
+        Apply streamed odds deltas to the current predictions
+        
+        Model probabilities do not depend on price, so only the odds,
+        implied probability and value score of fixtures whose price moved
+        are recomputed. Fixtures without a prediction yet are left to the
+        regular pipeline.
+        
+        Returns:
+            pd.DataFrame: The updated prediction rows, or None if none moved
+        """
+        predictions = self.conductor.current_predictions
+        if predictions is None or predictions.empty:
+            return None
+            
+        best = tracker.best_prices({delta["match_id"] for delta in deltas})
+        mask = predictions["match_id"].isin(list(best.keys()))
+        if not mask.any():
+            return None
+            
+        odds = predictions.loc[mask, "match_id"].map(best)
+        predictions.loc[mask, "bookmaker_odds"] = odds
+        predictions.loc[mask, "implied_prob"] = 1 / odds
+        predictions.loc[mask, "value_score"] = predictions.loc[mask, "prediction_prob"] - predictions.loc[mask, "implied_prob"]
+        return predictions.loc[mask]
+        
     def get_bookmaker_odds(self):
-        """Get latest odds from bookmakers"""
-        # In production, this would be real-time API calls
+        """Sample odds used when the odds book has no prices yet"""
+        # In production, prices come from the conductor's odds book
         # For demo, we'll use sample data
         return pd.DataFrame({
             "match_id": [101, 102, 103],
@@ -105,10 +141,4 @@ class PredictionEngineAgent(BaseAgent):
     
     def log_prediction(self, match_id, prediction, confidence):
         """Log prediction for future verification"""
-        self.conductor.prediction_log.append({
-            "timestamp": pd.Timestamp.now(),
-            "match_id": match_id,
-            "prediction": prediction,
-            "confidence": confidence,
-            "verified": False
-        })
+        self.conductor.prediction_log.record(match_id, prediction, confidence)
@@ -1,9 +1,10 @@
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import KFold
 from .base_agent import BaseAgent
 from config import Config
 from utils.data_utils import calculate_accuracy
+from utils.cross_validation import parallel_cross_validate
+from utils.feature_store import get_feature_store
 
 class QAAgent(BaseAgent):
     def execute(self):
@@ -28,8 +29,8 @@ class QAAgent(BaseAgent):
     def cross_validate_model(self):
         """Perform cross-validation on the model"""
         print("Performing cross-validation")
-        model = self.conductor.model_registry.get("dc_btts_predictor")
-        if not model:
+        slot = self.conductor.model_registry.get("dc_btts_predictor")
+        if not slot or not slot.acquire():
             return {"status": "error", "message": "No model available for validation"}
         
         # Get training data
@@ -37,23 +38,14 @@ class QAAgent(BaseAgent):
         if data is None:
             return {"status": "error", "message": "No training data available"}
         
-        # Prepare for cross-validation
-        X = data.drop(columns=[Config.TARGET])
-        y = data[Config.TARGET]
-        
-        kf = KFold(n_splits=5, shuffle=True)
-        accuracies = []
-        
-        # Perform k-fold cross validation
-        for train_index, test_index in kf.split(X):
-            X_train, X_test = X.iloc[train_index], X.iloc[test_index]
-            y_train, y_test = y.iloc[train_index], y.iloc[test_index]
-            
-            # Train and validate
-            model.fit(X_train, y_train)
-            preds = model.predict(X_test)
-            accuracy = calculate_accuracy(y_test, preds)
-            accuracies.append(accuracy)
+        # Each fold trains a fresh model in its own process
+        accuracies = parallel_cross_validate(
+            data,
+            target=Config.TARGET,
+            n_splits=self.task_spec.get("n_splits", Config.CV_FOLDS),
+            splitter=self.task_spec.get("splitter", Config.CV_SPLITTER),
+            time_column=Config.CV_TIME_COLUMN
+        )
         
         # Calculate average accuracy
         avg_accuracy = np.mean(accuracies)
@@ -68,6 +60,8 @@ class QAAgent(BaseAgent):
                     "model_type": "hybrid",
                     "target": "dc_btts",
                     "retrain": True,
+                    "shadow": Config.SHADOW_RETRAINS,
+                    "data": data,
                     "validation_accuracy": avg_accuracy
                 }
             )
@@ -137,42 +131,36 @@ class QAAgent(BaseAgent):
     def verify_results(self):
         """Verify actual results against predictions"""
         print("Verifying results")
-        # Get unverified predictions
-        unverified = [p for p in self.conductor.prediction_log if not p["verified"]]
-        
-        if not unverified:
+        ledger = self.conductor.prediction_log
+        if not ledger.unsettled:
             return {"status": "success", "message": "No unverified predictions"}
         
         # Get actual results (in production, this would be from a data source)
         actual_results = self.get_actual_results()
         
-        # Verify predictions
-        verified = []
-        for prediction in unverified:
-            match_result = actual_results.get(prediction["match_id"])
-            if match_result:
-                prediction["actual"] = match_result["result"]
-                prediction["btss"] = match_result["both_scored"]
-                prediction["verified"] = True
-                
-                # Determine if prediction was correct
-                if match_result["result"] in ["home_win", "away_win", "draw"] and match_result["both_scored"]:
-                    prediction["correct"] = prediction["prediction"]
-                else:
-                    prediction["correct"] = not prediction["prediction"]
-                
-                # Log performance
-                self.log_performance(
-                    "win" if prediction["correct"] else "loss",
-                    prediction["confidence"]
-                )
-                verified.append(prediction)
-        
-        # Update performance metrics
-        if verified:
-            wins = sum(1 for p in verified if p["correct"])
-            total = len(verified)
-            win_rate = wins / total
+        # Settle every open prediction with a result in one pass
+        verified = ledger.settle(actual_results)
+        self.conductor.shadow_log.settle(actual_results)
+        
+        if not verified.empty:
+            correct = verified["correct"].to_numpy()
+            stake = verified["stake"].to_numpy()
+            profit = np.where(correct, stake * (verified["bookmaker_odds"].to_numpy() - 1), -stake)
+            self.log_performance_batch(
+                np.where(correct, "win", "loss"),
+                verified["confidence"].to_numpy(),
+                np.nan_to_num(profit),
+                stake
+            )
+            
+            # Make the settlements durable before dropping their features
+            self.conductor.performance_log.flush()
+            
+            # Settled fixtures will not be scored again
+            get_feature_store().evict(set(verified["match_id"]))
+            
+            # Update performance metrics
+            win_rate = float(correct.mean())
             
             # Create performance report
             report_agent_id = self.create_sub_agent(
@@ -200,11 +188,11 @@ class QAAgent(BaseAgent):
     def get_actual_results(self):
         """Retrieve actual match results (demo implementation)"""
         # In production, this would be from a sports data API
-        return {
-            101: {"result": "home_win", "both_scored": True},
-            102: {"result": "draw", "both_scored": False},
-            103: {"result": "away_win", "both_scored": True}
-        }
+        return pd.DataFrame({
+            "match_id": [101, 102, 103],
+            "result": ["home_win", "draw", "away_win"],
+            "both_scored": [True, False, True]
+        })
     
     def handle_issues(self, result):
         """Handle issues found during QA"""
@@ -225,6 +213,8 @@ class QAAgent(BaseAgent):
                     "model_type": "hybrid",
                     "target": "dc_btts",
                     "retrain": True,
+                    "shadow": Config.SHADOW_RETRAINS,
+                    "data": self.get_training_data(),
                     "reason": "QA performance issues"
                 }
             )
@@ -1,30 +1,17 @@
 import os
 import pandas as pd
-import telegram
 from .base_agent import BaseAgent
 from config import Config
-from utils.visualization import create_performance_plot
-from dash_app.app import run_dashboard
+from dash_app.app import ensure_dashboard_process
+from utils.report_store import get_report_store
+from utils.notifications import get_telegram_notifier
 from utils.visualization import create_performance_history, create_win_loss_pie
 
-def send_telegram_report(self, report):
-    # ... existing code ...
-    
-    # Send performance chart
-    perf_fig = create_performance_history(self.conductor.performance_log)
-    perf_img = perf_fig.to_image(format="png")
-    self.bot.send_photo(chat_id=Config.TELEGRAM_CHAT_ID, photo=perf_img)
-    
-    # Send win/loss chart
-    pie_fig = create_win_loss_pie(self.conductor.performance_log)
-    pie_img = pie_fig.to_image(format="png")
-    self.bot.send_photo(chat_id=Config.TELEGRAM_CHAT_ID, photo=pie_img)
-
 class ReportingAgent(BaseAgent):
     def __init__(self, agent_id, conductor):
         super().__init__(agent_id, conductor)
         if Config.TELEGRAM_TOKEN:
-            self.bot = telegram.Bot(token=Config.TELEGRAM_TOKEN)
+            self.notifier = get_telegram_notifier()
     
     def execute(self):
         print(f"[{self.agent_id}] Generating reports")
@@ -43,32 +30,24 @@ class ReportingAgent(BaseAgent):
     
     def compile_report(self):
         # Get value bets from previous agent
-        value_bets = self.conductor.task_history[-1]["result"]["value_bets"]
+        value_bets = self.get_upstream_result().get("value_bets", [])
         
         # Calculate performance metrics
         win_rate, roi = self.calculate_performance()
         
-        # Prepare visualization
-        perf_plot = create_performance_plot(self.conductor.performance_log)
-        
         return {
             "value_bets": value_bets,
             "performance": {
                 "win_rate": win_rate,
-                "roi": roi,
-                "plot": perf_plot
+                "roi": roi
             },
             "timestamp": pd.Timestamp.now()
         }
     
     def calculate_performance(self):
-        wins = sum(1 for log in self.conductor.performance_log if log['result'] == 'win')
-        total = len(self.conductor.performance_log)
-        win_rate = wins / total if total > 0 else 0
-        
-        initial_budget = Config.INITIAL_BUDGET
-        current_budget = self.conductor.budget
-        roi = (current_budget - initial_budget) / initial_budget
+        summary = self.conductor.performance_log.summary()
+        win_rate = summary["win_rate"]
+        roi = summary["profit"] / summary["staked"] if summary["staked"] > 0 else 0.0
         
         return win_rate, roi
     
@@ -84,22 +63,22 @@ class ReportingAgent(BaseAgent):
                 message += (
                     f"{status} {bet['home_team']} vs {bet['away_team']}\n"
                     f"Type: {bet['bet_type']} | Confidence: {bet['confidence']:.0%}\n"
-                    f"Odds: {bet['bookmaker_odds']} | Value: {bet['value_score']:.3f}\n\n"
+                    f"Odds: {bet['bookmaker_odds']} | Value: {bet['value_score']:.3f}\n"
+                    f"Stake: {bet.get('stake', 0):.2f}\n\n"
                 )
             
-            self.bot.send_message(
-                chat_id=Config.TELEGRAM_CHAT_ID, 
-                text=message
-            )
+            # Queued for the background sender; charts render there too
+            self.notifier.send_message(message)
             
-            # Send performance plot
-            if report['performance']['plot']:
-                self.bot.send_photo(
-                    chat_id=Config.TELEGRAM_CHAT_ID,
-                    photo=open(report['performance']['plot'], 'rb')
-                )
+            # Performance and win/loss charts go out as one media group
+            self.notifier.send_chart(create_performance_history(self.conductor.performance_log))
+            self.notifier.send_chart(create_win_loss_pie(self.conductor.performance_log))
         except Exception as e:
             print(f"Telegram error: {str(e)}")
     
     def update_dashboard(self, report):
-        run_dashboard(report)
+        # The dashboard runs in its own process and picks up new versions
+        version = get_report_store().publish(report)
+        print(f"[{self.agent_id}] Published report version {version}")
+        if Config.DASHBOARD_AUTOSTART:
+            ensure_dashboard_process()
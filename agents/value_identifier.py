@@ -1,30 +1,31 @@
 import pandas as pd
 from .base_agent import BaseAgent
 from config import Config
+from utils.value_engine import find_value
+from utils.staking import size_stakes
 
 class ValueIdentifierAgent(BaseAgent):
     def execute(self):
         print(f"[{self.agent_id}] Identifying value bets")
         # Get predictions from previous agent
-        predictions = self.conductor.task_history[-1]["result"]["predictions"]
+        predictions = self.task_spec.get("predictions")
+        if predictions is None:
+            predictions = self.get_upstream_result()["predictions"]
         
-        # Calculate value scores
-        value_bets = []
-        for _, row in predictions.iterrows():
-            implied_prob = 1 / row['bookmaker_odds']
-            value_score = row['prediction_prob'] - implied_prob
-            
-            if abs(value_score) > Config.VALUE_THRESHOLD:
-                value_bets.append({
-                    "match_id": row['match_id'],
-                    "home_team": row['home_team'],
-                    "away_team": row['away_team'],
-                    "prediction": row['prediction'],
-                    "confidence": row['confidence'],
-                    "bookmaker_odds": row['bookmaker_odds'],
-                    "value_score": value_score,
-                    "bet_type": "UNDERVALUE" if value_score > 0 else "OVERVALUE"
-                })
+        # Calculate value scores in one columnar pass
+        thresholds = self.task_spec.get("thresholds", [self.task_spec.get("threshold", Config.VALUE_THRESHOLD)])
+        value_frame = self.find_value_bets(predictions, thresholds=thresholds)
+        
+        # Size every stake jointly across the slate
+        value_frame = size_stakes(value_frame, bankroll=self.task_spec.get("bankroll", Config.BANKROLL))
+        
+        # Settlement profit comes from the ledger, so record the sized stakes there
+        if "ledger_row" in predictions.columns and not value_frame.empty:
+            self.conductor.prediction_log.set_stakes(
+                predictions.loc[value_frame.index, "ledger_row"],
+                value_frame["stake"]
+            )
+        value_bets = value_frame.to_dict("records")
         
         # Create sub-agents for deep analysis
         if value_bets:
@@ -42,5 +43,10 @@ class ValueIdentifierAgent(BaseAgent):
         return {
             "status": "success", 
             "value_bets": value_bets,
+            "value_frame": value_frame,
             "next_agent": reporting_agent_id
         }
+        
+    def find_value_bets(self, predictions, thresholds=None, bet_types=None):
+        """Value bets among the given prediction rows as a DataFrame (also used per odds delta)"""
+        return find_value(predictions, thresholds=thresholds, bet_types=bet_types)
@@ -0,0 +1,5 @@
+"""
+benchmarks package - Runnable performance and parity checks, one script per optimisation
+
+Run from the repository root, e.g. python -m benchmarks.bench_staking
+"""
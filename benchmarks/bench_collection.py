@@ -0,0 +1,105 @@
+"""
+Odds collection latency against a local mock bookmaker API
+
+Each fake source answers after a fixed delay. Sequential collection
+grows linearly with the number of sources; concurrent collection over
+the pooled session should stay close to a single request's delay.
+
+    python -m benchmarks.bench_collection --delay-ms 100
+"""
+import json
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from utils.api_clients import BetwayClient, collect_odds_concurrently, get_shared_session
+from .common import print_table
+
+def _make_handler(delay, events):
+    payload = json.dumps({"data": [
+        {
+            "id": match_id,
+            "competitors": [{"name": f"Home {match_id}"}, {"name": f"Away {match_id}"}],
+            "odds": {"double_chance_btts": 2.0 + match_id / 1000}
+        }
+        for match_id in range(events)
+    ]}).encode()
+    
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def do_GET(self):
+            time.sleep(delay)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+            
+        def log_message(self, format, *args):
+            pass
+            
+    return Handler
+
+def start_mock_server(delay, events):
+    """Serve Betway-shaped odds on an ephemeral local port"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(delay, events))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="mock-bookmaker", daemon=True).start()
+    return server
+
+def make_clients(base_url, n_sources):
+    clients = {}
+    for index in range(n_sources):
+        client = BetwayClient("bench-key", session=get_shared_session())
+        client.base_url = base_url
+        clients[f"source_{index}"] = client
+    return clients
+
+def collect_sequentially(clients):
+    return {name: client.get_dc_btts_odds() for name, client in clients.items()}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--delay-ms", type=float, default=100.0, help="Server-side delay per request")
+    parser.add_argument("--events", type=int, default=200, help="Fixtures per response")
+    parser.add_argument("--sources", type=int, nargs="+", default=[2, 5, 10, 20])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    server = start_mock_server(args.delay_ms / 1000.0, args.events)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    rows = []
+    try:
+        for n_sources in args.sources:
+            clients = make_clients(base_url, n_sources)
+            # Warm the keep-alive pool so both modes start from open connections
+            collect_odds_concurrently(clients)
+            
+            sequential = []
+            concurrent = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                collect_sequentially(clients)
+                sequential.append(time.perf_counter() - started)
+                
+                started = time.perf_counter()
+                results, errors = collect_odds_concurrently(clients)
+                concurrent.append(time.perf_counter() - started)
+                if errors:
+                    raise RuntimeError(f"Concurrent collection failed: {errors}")
+                    
+            rows.append({
+                "sources": n_sources,
+                "sequential_ms": min(sequential) * 1000.0,
+                "concurrent_ms": min(concurrent) * 1000.0,
+                "speedup": min(sequential) / min(concurrent)
+            })
+    finally:
+        server.shutdown()
+        
+    print(f"Mock source delay {args.delay_ms:.0f}ms, {args.events} fixtures per response")
+    print_table(rows, ["sources", "sequential_ms", "concurrent_ms", "speedup"])
+
+if __name__ == "__main__":
+    main()
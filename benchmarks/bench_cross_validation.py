@@ -0,0 +1,57 @@
+"""
+Cross-validation wall time and speedup against the number of workers
+
+Runs parallel_cross_validate on the same synthetic frame with 1, 2, 4,
+... worker processes up to the core count. Each worker's thread pools
+are capped so that workers x threads never exceeds the cores. Reports
+wall time, speedup over one worker and parallel efficiency
+(speedup / workers).
+
+    python -m benchmarks.bench_cross_validation --rows 20000 --folds 8
+"""
+import os
+import time
+import argparse
+from utils.cross_validation import parallel_cross_validate
+from .common import training_frame, print_table
+
+def worker_counts(cores, folds):
+    """1, 2, 4, ... up to min(cores, folds), always including the maximum"""
+    limit = max(1, min(cores, folds))
+    counts = []
+    n_workers = 1
+    while n_workers < limit:
+        counts.append(n_workers)
+        n_workers *= 2
+    return counts + [limit]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--folds", type=int, default=8)
+    parser.add_argument("--workers", type=int, nargs="+", default=None, help="Worker counts to sweep (1 is always included)")
+    args = parser.parse_args()
+    
+    cores = os.cpu_count() or 1
+    data = training_frame(args.rows)
+    rows = []
+    for n_workers in sorted(set(args.workers or worker_counts(cores, args.folds)) | {1}):
+        threads = max(1, cores // n_workers)
+        started = time.perf_counter()
+        scores = parallel_cross_validate(data, n_splits=args.folds, n_workers=n_workers, threads_per_fold=threads)
+        rows.append({
+            "workers": n_workers,
+            "threads_each": threads,
+            "wall_s": time.perf_counter() - started,
+            "mean_accuracy": sum(scores) / len(scores)
+        })
+        
+    baseline = rows[0]["wall_s"]
+    for row in rows:
+        row["speedup"] = baseline / row["wall_s"]
+        row["efficiency"] = row["speedup"] / row["workers"]
+    print(f"{args.folds} folds over {args.rows} rows on {cores} cores")
+    print_table(rows, ["workers", "threads_each", "wall_s", "speedup", "efficiency", "mean_accuracy"])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Dashboard callback latency and server CPU with many connected clients
+
+Starts the dashboard on a scratch report store and emulates browsers:
+every client fires the interval callback each poll period and, when it
+receives a new report version, the layout callback the browser would
+chain after it. A publisher adds a new report every --publish-s seconds.
+Reports per-callback p50/p99 latency and the server's CPU use.
+
+    python -m benchmarks.bench_dashboard --clients 50 --duration 30
+"""
+import os
+import time
+import argparse
+import threading
+import multiprocessing
+import numpy as np
+import requests
+from config import Config
+from utils.report_store import ReportStore
+from .common import use_scratch_paths, print_table
+
+def serve(store_path, port):
+    """Child process: the dashboard on a scratch report store"""
+    Config.REPORT_STORE_PATH = store_path
+    Config.DASHBOARD_HOST = "127.0.0.1"
+    Config.DASHBOARD_PORT = port
+    from dash_app.app import run_dashboard
+    run_dashboard()
+
+def sample_report(index, n_bets=20):
+    rng = np.random.default_rng(index)
+    return {
+        "timestamp": f"2026-01-01T12:{index % 60:02d}:00",
+        "performance": {"win_rate": float(rng.uniform(0.4, 0.7)), "roi": float(rng.uniform(-0.1, 0.2))},
+        "value_bets": [
+            {
+                "home_team": f"Home {i}",
+                "away_team": f"Away {i}",
+                "bet_type": "UNDERVALUE",
+                "bookmaker_odds": float(rng.uniform(1.5, 4.0)),
+                "confidence": float(rng.uniform(0.5, 0.9)),
+                "value_score": float(rng.uniform(0.15, 0.3))
+            }
+            for i in range(n_bets)
+        ]
+    }
+
+def _outputs(*specs):
+    return {
+        # Dash's key for multi-output callbacks: "..a.prop...b.prop.."
+        "output": "..{}..".format("...".join(f"{id_}.{prop}" for id_, prop in specs)),
+        "outputs": [{"id": id_, "property": prop} for id_, prop in specs]
+    }
+
+POLL_OUTPUTS = _outputs(("report-data-store", "data"), ("report-version-store", "data"))
+LAYOUT_OUTPUTS = _outputs(
+    ("performance-cards", "children"),
+    ("value-bets-table", "children"),
+    ("performance-graph", "figure")
+)
+
+def client(url, poll_interval, stop, latencies, errors):
+    session = requests.Session()
+    version = None
+    n_intervals = 0
+    while not stop.is_set():
+        n_intervals += 1
+        started = time.perf_counter()
+        response = session.post(url, json={
+            **POLL_OUTPUTS,
+            "inputs": [{"id": "interval-component", "property": "n_intervals", "value": n_intervals}],
+            "state": [{"id": "report-version-store", "property": "data", "value": version}],
+            "changedPropIds": ["interval-component.n_intervals"]
+        })
+        latencies["poll"].append(time.perf_counter() - started)
+        if response.status_code == 200:
+            payload = response.json()["response"]
+            report = payload["report-data-store"]["data"]
+            version = payload["report-version-store"]["data"]
+            started = time.perf_counter()
+            layout = session.post(url, json={
+                **LAYOUT_OUTPUTS,
+                "inputs": [{"id": "report-data-store", "property": "data", "value": report}],
+                "changedPropIds": ["report-data-store.data"]
+            })
+            latencies["layout"].append(time.perf_counter() - started)
+            if layout.status_code != 200:
+                errors.append(layout.status_code)
+        elif response.status_code != 204:
+            errors.append(response.status_code)
+        stop.wait(poll_interval)
+
+def cpu_seconds(pid):
+    """User + system CPU seconds of a process (Linux /proc)"""
+    with open(f"/proc/{pid}/stat") as stat:
+        fields = stat.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of load")
+    parser.add_argument("--poll-ms", type=float, default=Config.DASHBOARD_POLL_MS)
+    parser.add_argument("--publish-s", type=float, default=5.0, help="Seconds between new reports")
+    parser.add_argument("--port", type=int, default=8051)
+    args = parser.parse_args()
+    
+    root = use_scratch_paths()
+    store_path = os.path.join(root, "data", "reports.sqlite")
+    store = ReportStore(store_path)
+    store.publish(sample_report(0))
+    
+    server = multiprocessing.get_context("spawn").Process(target=serve, args=(store_path, args.port), daemon=True)
+    server.start()
+    url = f"http://127.0.0.1:{args.port}/_dash-update-component"
+    deadline = time.time() + 60
+    while True:
+        try:
+            requests.get(f"http://127.0.0.1:{args.port}/", timeout=1)
+            break
+        except requests.ConnectionError:
+            if time.time() > deadline:
+                raise RuntimeError("Dashboard did not start")
+            time.sleep(0.2)
+            
+    latencies = {"poll": [], "layout": []}
+    errors = []
+    stop = threading.Event()
+    threads = [
+        threading.Thread(target=client, args=(url, args.poll_ms / 1000.0, stop, latencies, errors), daemon=True)
+        for _ in range(args.clients)
+    ]
+    cpu_before = cpu_seconds(server.pid)
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    published = 1
+    while time.perf_counter() - started < args.duration:
+        stop.wait(args.publish_s)
+        store.publish(sample_report(published))
+        published += 1
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    cpu = cpu_seconds(server.pid) - cpu_before
+    server.terminate()
+    server.join()
+    
+    rows = []
+    for name, values in latencies.items():
+        values = np.array(values) * 1000.0
+        rows.append({
+            "callback": name,
+            "requests": len(values),
+            "p50_ms": float(np.percentile(values, 50)) if len(values) else 0.0,
+            "p99_ms": float(np.percentile(values, 99)) if len(values) else 0.0
+        })
+    print(f"{args.clients} clients polling every {args.poll_ms:.0f}ms for {elapsed:.0f}s, {published} reports published")
+    print_table(rows, ["callback", "requests", "p50_ms", "p99_ms"])
+    print(f"Server CPU: {cpu:.1f}s over {elapsed:.0f}s ({cpu / elapsed:.0%} of one core); {len(errors)} failed requests")
+
+if __name__ == "__main__":
+    main()
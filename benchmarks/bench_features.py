@@ -0,0 +1,109 @@
+"""
+Columnar feature engineering versus the old row-wise path
+
+Checks that FeatureEngineerAgent.process_features matches a row-wise
+reference built on calculate_form_index / calculate_injury_impact, then
+times both at each size. The row-wise reference is skipped above
+--max-rowwise rows, where it takes minutes.
+
+    python -m benchmarks.bench_features --sizes 1000 100000 1000000
+"""
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+from config import Config
+from agents.feature_engineer import FeatureEngineerAgent
+from utils.data_utils import calculate_form_index, calculate_injury_impact
+from .common import timed, print_table
+
+def raw_fixtures(n_rows, seed=0):
+    """Synthetic collector output with nested player and injury lists"""
+    rng = np.random.default_rng(seed)
+    
+    def squads():
+        sizes = rng.integers(0, 15, size=n_rows)
+        forms = rng.random(int(sizes.sum()))
+        offsets = np.concatenate([[0], np.cumsum(sizes)])
+        return [
+            [{"form": float(form)} for form in forms[offsets[i]:offsets[i + 1]]]
+            for i in range(n_rows)
+        ]
+        
+    def injuries():
+        return [["knock"] * int(count) for count in rng.integers(0, 12, size=n_rows)]
+        
+    return pd.DataFrame({
+        "match_id": np.arange(n_rows),
+        "home_team": [f"Home {i % 500}" for i in range(n_rows)],
+        "away_team": [f"Away {i % 500}" for i in range(n_rows)],
+        "home_players": squads(),
+        "away_players": squads(),
+        "home_form": rng.random(n_rows),
+        "away_form": rng.random(n_rows),
+        "home_coach_rating": rng.uniform(1, 10, n_rows),
+        "away_coach_rating": rng.uniform(1, 10, n_rows),
+        "home_injuries": injuries(),
+        "away_injuries": injuries(),
+        "home_win_pct": rng.random(n_rows),
+        "away_win_pct": rng.random(n_rows),
+        "weather_condition": rng.choice(["Clear", "Rain", "Snow", "Cloudy"], n_rows),
+        "pitch_rating": rng.uniform(0, 10, n_rows),
+        # Columns the selection at the end of process_features expects
+        **{feature: rng.random(n_rows) for feature in Config.REQUIRED_FEATURES}
+    })
+
+def process_features_rowwise(df):
+    """The pre-vectorisation per-row path, reduced to the engineered columns"""
+    forms = df.apply(lambda x: calculate_form_index(x["home_players"], x["away_players"]), axis=1)
+    injuries = df.apply(lambda x: calculate_injury_impact(x["home_injuries"], x["away_injuries"]), axis=1)
+    return pd.DataFrame({
+        "home_player_form": [home for home, _ in forms],
+        "away_player_form": [away for _, away in forms],
+        "team_form": df.apply(lambda x: np.mean([x["home_form"], x["away_form"]]), axis=1),
+        "coach_form": df.apply(lambda x: (x["home_coach_rating"] + x["away_coach_rating"]) / 2, axis=1),
+        "home_injury_impact": [home for home, _ in injuries],
+        "away_injury_impact": [away for _, away in injuries],
+        "pitch_quality": df["pitch_rating"].apply(lambda x: 1.0 if x > 7 else 0.7 if x > 5 else 0.5)
+    })
+
+def columnar(agent, raw):
+    df = raw.copy()
+    agent.process_features(df)
+    return df
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000])
+    parser.add_argument("--max-rowwise", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    # process_features does not touch the conductor
+    agent = FeatureEngineerAgent("bench_features", conductor=None)
+    rows = []
+    mismatches = 0
+    for n_rows in args.sizes:
+        raw = raw_fixtures(n_rows)
+        columnar_s, engineered = timed(columnar, agent, raw, repeat=args.repeat)
+        row = {"rows": n_rows, "columnar_ms": columnar_s * 1000.0, "rowwise_ms": "-", "speedup": "-", "max_abs_diff": "-"}
+        
+        if n_rows <= args.max_rowwise:
+            rowwise_s, expected = timed(process_features_rowwise, raw, repeat=1)
+            max_diff = max(
+                float(np.max(np.abs(engineered[column].to_numpy(dtype=float) - expected[column].to_numpy(dtype=float))))
+                for column in expected.columns
+            )
+            row.update(rowwise_ms=rowwise_s * 1000.0, speedup=rowwise_s / columnar_s, max_abs_diff=max_diff)
+            if max_diff > 1e-9:
+                mismatches += 1
+        rows.append(row)
+        
+    print_table(rows, ["rows", "columnar_ms", "rowwise_ms", "speedup", "max_abs_diff"])
+    if mismatches:
+        print(f"Parity check failed at {mismatches} size(s)")
+        sys.exit(1)
+    print("Parity check passed")
+
+if __name__ == "__main__":
+    main()
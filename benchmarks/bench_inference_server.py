@@ -0,0 +1,87 @@
+"""
+Micro-batched InferenceServer versus one predict_proba call per request
+
+Client threads each send single-fixture requests back to back. The
+direct mode scores every request with its own model call; the server
+mode goes through InferenceServer, which groups concurrent requests.
+Reports p50/p99 request latency and throughput for both.
+
+    python -m benchmarks.bench_inference_server --clients 1 8 32
+"""
+import time
+import argparse
+import threading
+import numpy as np
+from models.inference_server import InferenceServer
+from .common import fitted_model, feature_rows, print_table
+
+def drive(clients, requests_per_client, call):
+    """Run `call(row)` from client threads; returns (latencies in s, elapsed s)"""
+    latencies = [[] for _ in range(clients)]
+    
+    def client(index, rows):
+        for row in rows:
+            started = time.perf_counter()
+            call(row)
+            latencies[index].append(time.perf_counter() - started)
+            
+    threads = [
+        threading.Thread(target=client, args=(index, rows))
+        for index, rows in enumerate(requests_per_client)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return np.concatenate([np.array(values) for values in latencies]), time.perf_counter() - started
+
+def summarise(mode, clients, latencies, elapsed, batch=None):
+    latencies = latencies * 1000.0
+    return {
+        "mode": mode,
+        "clients": clients,
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p99_ms": float(np.percentile(latencies, 99)),
+        "requests_per_s": len(latencies) / elapsed,
+        "mean_batch": batch if batch is not None else 1.0
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=200, help="Requests per client")
+    parser.add_argument("--max-batch", type=int, default=None)
+    parser.add_argument("--max-wait-ms", type=float, default=None)
+    args = parser.parse_args()
+    
+    model, features = fitted_model()
+    rows = []
+    for clients in args.clients:
+        requests = [
+            [frame.iloc[[i]] for i in range(len(frame))]
+            for frame in (feature_rows(features, args.requests, seed=seed) for seed in range(clients))
+        ]
+        
+        # Keras is not safe to call from many threads at once, so direct calls are serialised
+        lock = threading.Lock()
+        
+        def direct(row):
+            with lock:
+                return model.predict_proba(row)
+                
+        latencies, elapsed = drive(clients, requests, direct)
+        rows.append(summarise("direct", clients, latencies, elapsed))
+        
+        server = InferenceServer(model, max_batch=args.max_batch, max_wait_ms=args.max_wait_ms).start()
+        try:
+            latencies, elapsed = drive(clients, requests, server.predict_proba)
+            stats = server.stats()
+        finally:
+            server.stop()
+        rows.append(summarise("server", clients, latencies, elapsed, stats["mean_batch_size"]))
+        
+    print_table(rows, ["mode", "clients", "p50_ms", "p99_ms", "requests_per_s", "mean_batch"])
+
+if __name__ == "__main__":
+    main()
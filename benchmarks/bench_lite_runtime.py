@@ -0,0 +1,46 @@
+"""
+Cold start, memory and parity of the lite runtime against the full model
+
+Saves a fitted model into a scratch registry, then loads it in a fresh
+process per runtime and scores a batch. Reports time to load, time of
+the first scoring call, peak RSS and private memory; the lite scores
+must match the full model within Config.LITE_PARITY_TOLERANCE.
+
+    python -m benchmarks.bench_lite_runtime
+"""
+import sys
+import argparse
+import numpy as np
+from config import Config
+from models.model_registry import ModelRegistry, ModelCache
+from .common import use_scratch_paths, fitted_model, feature_rows, cold_start, print_table
+
+MODEL_NAME = "bench_predictor"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000, help="Training rows")
+    parser.add_argument("--sample", type=int, default=256, help="Rows scored after loading")
+    args = parser.parse_args()
+    
+    root = use_scratch_paths()
+    model, features = fitted_model(n_rows=args.rows)
+    sample = feature_rows(features, args.sample)
+    expected = model.predict_proba(sample)
+    ModelRegistry(cache=ModelCache()).save_model(MODEL_NAME, model, "v1")
+    
+    rows = []
+    for runtime in ["full", "lite"]:
+        result = cold_start(root, MODEL_NAME, runtime, sample)
+        proba = np.asarray(result.pop("proba"))
+        rows.append({"runtime": runtime, **result, "max_abs_diff": float(np.max(np.abs(proba - expected)))})
+        
+    print_table(rows, ["runtime", "load_ms", "first_score_ms", "peak_rss_mb", "anon_mb", "max_abs_diff"])
+    lite = rows[-1]
+    if lite["max_abs_diff"] > Config.LITE_PARITY_TOLERANCE:
+        print(f"Parity check failed: {lite['max_abs_diff']:.2e} (tolerance {Config.LITE_PARITY_TOLERANCE:.0e})")
+        sys.exit(1)
+    print("Parity check passed")
+
+if __name__ == "__main__":
+    main()
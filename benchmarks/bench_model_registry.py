@@ -0,0 +1,84 @@
+"""
+Model registry lookup, warm cache and eager versus lazy cold load
+
+Saves one fitted model into a scratch registry and pads the manifest
+with --versions more entries. In-process it times opening the registry,
+resolving "latest", best-by-metric lookup and a warm cache hit. It then
+loads the full runtime eagerly and lazily in fresh processes; with lazy
+loading the halves are read on the first scoring call instead.
+
+    python -m benchmarks.bench_model_registry --versions 1000
+"""
+import json
+import time
+import random
+import argparse
+from models.model_registry import ModelRegistry, ModelCache
+from .common import use_scratch_paths, fitted_model, feature_rows, cold_start, print_table
+
+MODEL_NAME = "bench_predictor"
+
+def pad_manifest(registry, n_versions, seed=0):
+    """Add manifest rows that reuse v1's artifacts with random metrics"""
+    rng = random.Random(seed)
+    artifacts = json.dumps(registry.artifact_paths(MODEL_NAME, "v1"))
+    with registry.lock:
+        registry.conn.executemany(
+            "INSERT INTO versions (model_name, version, created_at, artifacts, metrics) VALUES (?, ?, ?, ?, ?)",
+            [
+                (MODEL_NAME, f"v{index}", f"2026-01-01T00:00:{index:06d}", artifacts,
+                 json.dumps({"val_accuracy": rng.random(), "val_log_loss": rng.random()}))
+                for index in range(2, n_versions + 2)
+            ]
+        )
+        registry.conn.commit()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--versions", type=int, default=1000, help="Extra manifest entries")
+    parser.add_argument("--lookups", type=int, default=100000)
+    args = parser.parse_args()
+    
+    root = use_scratch_paths()
+    model, features = fitted_model()
+    sample = feature_rows(features, 16)
+    registry = ModelRegistry(cache=ModelCache())
+    registry.save_model(MODEL_NAME, model, "v1")
+    pad_manifest(registry, args.versions)
+    
+    started = time.perf_counter()
+    registry = ModelRegistry(cache=ModelCache())
+    open_ms = (time.perf_counter() - started) * 1000.0
+    
+    started = time.perf_counter()
+    for _ in range(args.lookups):
+        registry.resolve_version(MODEL_NAME)
+    resolve_us = (time.perf_counter() - started) * 1e6 / args.lookups
+    
+    started = time.perf_counter()
+    for _ in range(args.lookups):
+        registry.best[MODEL_NAME]["val_accuracy"]
+    best_us = (time.perf_counter() - started) * 1e6 / args.lookups
+    
+    registry.load_model(MODEL_NAME, "v1", runtime="full")
+    started = time.perf_counter()
+    registry.load_model(MODEL_NAME, "v1", runtime="full")
+    warm_ms = (time.perf_counter() - started) * 1000.0
+    
+    print(f"Manifest with {args.versions + 1} versions")
+    print_table([{
+        "open_ms": open_ms,
+        "resolve_latest_us": resolve_us,
+        "best_lookup_us": best_us,
+        "warm_load_ms": warm_ms
+    }], ["open_ms", "resolve_latest_us", "best_lookup_us", "warm_load_ms"])
+    
+    rows = []
+    for lazy in [False, True]:
+        result = cold_start(root, MODEL_NAME, "full", sample, lazy=lazy)
+        result.pop("proba")
+        rows.append({"load": "lazy" if lazy else "eager", **result})
+    print_table(rows, ["load", "load_ms", "first_score_ms", "peak_rss_mb", "anon_mb"])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Telegram delivery throughput against a local fake Bot API server
+
+The fake server answers sendMessage, sendPhoto and sendMediaGroup after
+a fixed delay and counts calls. The same burst of report messages and
+chart images is sent two ways: one awaited API call per item, as the
+pipeline used to, and through TelegramNotifier, which merges texts and
+groups photos. Reports wall time, items/s, API calls and the time
+callers spend enqueueing.
+
+    python -m benchmarks.bench_notifications --messages 200 --photos 50
+"""
+import json
+import time
+import asyncio
+import argparse
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from config import Config
+from utils.notifications import TelegramNotifier, ChartRenderer, bot_base_url
+from .common import print_table
+
+TOKEN = "123456:bench"
+CHAT_ID = "1"
+PHOTO = b"\x89PNG\r\n\x1a\n" + bytes(20000)
+
+def _message(message_id):
+    return {"message_id": message_id, "date": int(time.time()), "chat": {"id": int(CHAT_ID), "type": "private"}}
+
+def _make_handler(delay, calls):
+    lock = threading.Lock()
+    
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            method = self.path.rsplit("/", 1)[-1]
+            with lock:
+                calls[method] += 1
+                message_id = sum(calls.values())
+            time.sleep(delay)
+            if method == "getMe":
+                result = {"id": 123456, "is_bot": True, "first_name": "Bench", "username": "bench_bot"}
+            elif method == "sendMediaGroup":
+                result = [_message(message_id)]
+            else:
+                result = _message(message_id)
+            payload = json.dumps({"ok": True, "result": result}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+            
+        def log_message(self, format, *args):
+            pass
+            
+    return Handler
+
+def start_fake_bot_api(delay):
+    """Fake Bot API on an ephemeral local port; returns (server, call counter)"""
+    calls = Counter()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(delay, calls))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-bot-api", daemon=True).start()
+    return server, calls
+
+def make_bot(server):
+    import telegram
+    return telegram.Bot(token=TOKEN, base_url=bot_base_url(f"http://127.0.0.1:{server.server_address[1]}"))
+
+def report_messages(n_messages):
+    return [f"Value bet {index}: Home {index} vs Away {index} @ 2.{index % 100:02d}" for index in range(n_messages)]
+
+def send_synchronously(bot, texts, photos):
+    """One awaited call per item, as the pipeline did before the queue"""
+    async def send_all():
+        async with bot:
+            for text in texts:
+                await bot.send_message(chat_id=CHAT_ID, text=text)
+            for photo in photos:
+                await bot.send_photo(chat_id=CHAT_ID, photo=photo)
+    asyncio.run(send_all())
+
+def send_queued(bot, texts, photos):
+    """Enqueue everything, then wait for the worker to drain; returns seconds spent enqueueing"""
+    notifier = TelegramNotifier(bot=bot, chat_id=CHAT_ID, renderer=ChartRenderer())
+    started = time.perf_counter()
+    for text in texts:
+        notifier.send_message(text)
+    for photo in photos:
+        notifier.send_photo(photo)
+    enqueue_s = time.perf_counter() - started
+    notifier.stop(timeout=None)
+    return enqueue_s
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--photos", type=int, default=50)
+    parser.add_argument("--delay-ms", type=float, default=50.0, help="Server-side delay per API call")
+    parser.add_argument("--min-interval", type=float, default=0.0, help="Seconds between queued sends")
+    parser.add_argument("--batch-window", type=float, default=0.2, help="Seconds the worker gathers a batch")
+    args = parser.parse_args()
+    
+    Config.TELEGRAM_MIN_INTERVAL = args.min_interval
+    Config.TELEGRAM_BATCH_WINDOW = args.batch_window
+    texts = report_messages(args.messages)
+    photos = [PHOTO] * args.photos
+    items = len(texts) + len(photos)
+    
+    rows = []
+    for mode in ["synchronous", "queued"]:
+        server, calls = start_fake_bot_api(args.delay_ms / 1000.0)
+        bot = make_bot(server)
+        started = time.perf_counter()
+        if mode == "synchronous":
+            send_synchronously(bot, texts, photos)
+            blocked_s = time.perf_counter() - started
+        else:
+            blocked_s = send_queued(bot, texts, photos)
+        elapsed = time.perf_counter() - started
+        server.shutdown()
+        rows.append({
+            "mode": mode,
+            "wall_s": elapsed,
+            "items_per_s": items / elapsed,
+            "api_calls": sum(count for method, count in calls.items() if method.startswith("send")),
+            "caller_blocked_ms": blocked_s * 1000.0
+        })
+        
+    print(f"{args.messages} messages and {args.photos} photos, {args.delay_ms:.0f}ms per API call")
+    print_table(rows, ["mode", "wall_s", "items_per_s", "api_calls", "caller_blocked_ms"])
+
+if __name__ == "__main__":
+    main()
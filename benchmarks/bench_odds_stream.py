@@ -0,0 +1,85 @@
+"""
+Streaming odds ingestion throughput and end-to-end latency
+
+Records a synthetic JSON replay (several bookmakers, a share of prices
+moving between snapshots), or uses --replay to load a real recording in
+the ReplaySource format. It then replays the file through OddsStream and
+StreamingPipeline with real PredictionEngineAgent / ValueIdentifierAgent
+instances, as fast as possible, and reports events per second and
+delta-to-value-check latency.
+
+    python -m benchmarks.bench_odds_stream --fixtures 2000 --snapshots 50
+"""
+import os
+import json
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+from agents.conductor import ProjectConductor
+from agents.prediction_engine import PredictionEngineAgent
+from agents.value_identifier import ValueIdentifierAgent
+from utils.odds_stream import replay
+from .common import print_table
+
+def record_replay(path, fixtures, snapshots, bookmakers, move_share, seed=0):
+    """Write a ReplaySource JSON file; returns the number of price changes in it"""
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp("2026-01-01 12:00:00")
+    records = []
+    changes = 0
+    for bookmaker in bookmakers:
+        prices = np.round(rng.uniform(1.5, 4.0, fixtures), 2)
+        for index in range(snapshots):
+            if index:
+                moved = rng.random(fixtures) < move_share
+                prices = np.where(moved, np.round(prices * rng.uniform(0.9, 1.1, fixtures), 2), prices)
+                changes += int(moved.sum())
+            records.append({
+                "timestamp": (start + pd.Timedelta(seconds=2 * index)).isoformat(),
+                "bookmaker": bookmaker,
+                "odds": [
+                    {"match_id": int(match_id), "dc_btts_odds": float(price)}
+                    for match_id, price in enumerate(prices)
+                ]
+            })
+    with open(path, "w") as f:
+        json.dump(records, f)
+    return changes
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--replay", help="Existing recording to replay instead of a synthetic one")
+    parser.add_argument("--fixtures", type=int, default=2000)
+    parser.add_argument("--snapshots", type=int, default=50)
+    parser.add_argument("--bookmakers", nargs="+", default=["Hollywoodbets", "Betway"])
+    parser.add_argument("--move-share", type=float, default=0.05, help="Share of prices moving per snapshot")
+    args = parser.parse_args()
+    
+    path = args.replay
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(prefix="sba-bench-"), "odds_replay.json")
+        changes = record_replay(path, args.fixtures, args.snapshots, args.bookmakers, args.move_share)
+        print(f"Recorded {args.snapshots} snapshots x {args.fixtures} fixtures x {len(args.bookmakers)} bookmakers ({changes} price moves) to {path}")
+    with open(path) as f:
+        match_ids = sorted({odds["match_id"] for record in json.load(f) for odds in record["odds"]})
+        
+    conductor = ProjectConductor()
+    rng = np.random.default_rng(1)
+    prob = rng.uniform(0.2, 0.8, len(match_ids))
+    odds = rng.uniform(1.5, 4.0, len(match_ids))
+    conductor.current_predictions = pd.DataFrame({
+        "match_id": match_ids,
+        "prediction_prob": prob,
+        "bookmaker_odds": odds,
+        "implied_prob": 1 / odds,
+        "value_score": prob - 1 / odds
+    })
+    prediction_agent = PredictionEngineAgent("bench_prediction", conductor)
+    value_agent = ValueIdentifierAgent("bench_value", conductor)
+    
+    stats = replay(path, prediction_agent, value_agent)
+    print_table([stats], ["events", "events_per_s", "p50_latency_ms", "p99_latency_ms", "value_bets"])
+
+if __name__ == "__main__":
+    main()
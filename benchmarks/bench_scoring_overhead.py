@@ -0,0 +1,55 @@
+"""
+Per-call HybridModel scoring overhead for batch sizes 1 to 100k
+
+Compares the pre-change DataFrame path (importances re-filtered, columns
+copied and reshaped on every call, LSTM through Keras predict), the
+current predict_proba on a DataFrame, and predict_proba_array on a
+schema-ordered float32 matrix.
+
+    python -m benchmarks.bench_scoring_overhead --sizes 1 10 100 1000 10000 100000
+"""
+import argparse
+import numpy as np
+from .common import timed, fitted_model, feature_rows, print_table
+
+def legacy_predict_proba(model, X):
+    """predict_proba as it was before important positions were cached"""
+    important = model.feature_importances[model.feature_importances > 0.01].index.tolist()
+    X_important = X[important]
+    X_seq = X_important.values.reshape((X_important.shape[0], X_important.shape[1], 1))
+    gbm_proba = model.gbm.predict_proba(X.to_numpy())[:, 1]
+    lstm_proba = model.lstm.predict(X_seq, verbose=0).flatten()
+    return model.gbm_weight * gbm_proba + (1 - model.gbm_weight) * lstm_proba
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    model, features = fitted_model()
+    rows = []
+    for n_rows in args.sizes:
+        frame = feature_rows(features, n_rows)
+        matrix = model.feature_schema.to_array(frame)
+        # One untimed call each so Keras tracing is not counted
+        legacy_predict_proba(model, frame)
+        model.predict_proba(frame)
+        
+        legacy_s, expected = timed(legacy_predict_proba, model, frame, repeat=args.repeat)
+        frame_s, _ = timed(model.predict_proba, frame, repeat=args.repeat)
+        array_s, actual = timed(model.predict_proba_array, matrix, repeat=args.repeat)
+        rows.append({
+            "rows": n_rows,
+            "legacy_ms": legacy_s * 1000.0,
+            "dataframe_ms": frame_s * 1000.0,
+            "array_ms": array_s * 1000.0,
+            "array_us_per_row": array_s * 1e6 / n_rows,
+            "speedup": legacy_s / array_s,
+            "max_abs_diff": float(np.max(np.abs(expected - actual)))
+        })
+        
+    print_table(rows, ["rows", "legacy_ms", "dataframe_ms", "array_ms", "array_us_per_row", "speedup", "max_abs_diff"])
+
+if __name__ == "__main__":
+    main()
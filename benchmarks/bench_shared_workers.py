@@ -0,0 +1,86 @@
+"""
+Per-worker load time and memory of the shared model runtime
+
+Packs a fitted model once with ModelRegistry.share_model, then starts
+1..N worker processes that each load it and score a batch, either with
+their own copy (runtime="lite") or by mapping the shared pack read-only
+(runtime="shared"). Private (anonymous) memory per worker should stay
+flat for the shared runtime; the mapped pages show up as file-backed
+memory shared by every worker.
+
+    python -m benchmarks.bench_shared_workers --workers 1 4 8
+"""
+import time
+import argparse
+import multiprocessing
+import numpy as np
+from models.model_registry import ModelRegistry, ModelCache
+from .common import use_scratch_paths, fitted_model, feature_rows, memory_usage, print_table
+
+MODEL_NAME = "bench_predictor"
+
+def worker(root, runtime, sample, ready, go, results):
+    use_scratch_paths(root)
+    before = memory_usage()
+    started = time.perf_counter()
+    model = ModelRegistry(cache=ModelCache()).load_model(MODEL_NAME, runtime=runtime)
+    load_ms = (time.perf_counter() - started) * 1000.0
+    model.predict_proba(sample)
+    after = memory_usage()
+    results.put({
+        "load_ms": load_ms,
+        "anon_mb": after.get("anon", np.nan) - before.get("anon", np.nan),
+        "file_mb": after.get("file", np.nan) - before.get("file", np.nan)
+    })
+    # Stay alive until every worker has measured, so all mappings coexist
+    ready.release()
+    go.wait()
+
+def run_workers(context, root, runtime, n_workers, sample):
+    results = context.Queue()
+    ready = context.Semaphore(0)
+    go = context.Event()
+    processes = [
+        context.Process(target=worker, args=(root, runtime, sample, ready, go, results))
+        for _ in range(n_workers)
+    ]
+    for process in processes:
+        process.start()
+    measured = [results.get() for _ in processes]
+    for _ in processes:
+        ready.acquire()
+    go.set()
+    for process in processes:
+        process.join()
+    return {
+        "runtime": runtime,
+        "workers": n_workers,
+        "load_ms_mean": float(np.mean([m["load_ms"] for m in measured])),
+        "anon_mb_per_worker": float(np.mean([m["anon_mb"] for m in measured])),
+        "file_mb_per_worker": float(np.mean([m["file_mb"] for m in measured]))
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--rows", type=int, default=20000, help="Training rows (drives model size)")
+    args = parser.parse_args()
+    
+    root = use_scratch_paths()
+    model, features = fitted_model(n_rows=args.rows, budget=1.0)
+    registry = ModelRegistry(cache=ModelCache())
+    registry.save_model(MODEL_NAME, model, "v1")
+    path = registry.share_model(MODEL_NAME)
+    sample = feature_rows(features, 256)
+    print(f"Shared pack: {path}")
+    
+    context = multiprocessing.get_context("spawn")
+    rows = [
+        run_workers(context, root, runtime, n_workers, sample)
+        for runtime in ["lite", "shared"]
+        for n_workers in args.workers
+    ]
+    print_table(rows, ["runtime", "workers", "load_ms_mean", "anon_mb_per_worker", "file_mb_per_worker"])
+
+if __name__ == "__main__":
+    main()
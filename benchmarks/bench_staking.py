@@ -0,0 +1,56 @@
+"""
+Slate-wide Kelly stake sizing time
+
+Sizes synthetic slates of value bets (several selections per fixture,
+so the correlated per-fixture solve is exercised) with size_stakes and
+checks that a 5,000-selection slate solves in under a second.
+
+    python -m benchmarks.bench_staking --sizes 500 5000 50000
+"""
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+from utils.staking import size_stakes
+from .common import timed, print_table
+
+TARGET_SIZE = 5000
+TARGET_SECONDS = 1.0
+
+def value_slate(n_selections, per_fixture=3, seed=0):
+    rng = np.random.default_rng(seed)
+    odds = rng.uniform(1.5, 6.0, n_selections)
+    edge = rng.uniform(0.0, 0.2, n_selections)
+    return pd.DataFrame({
+        "match_id": np.arange(n_selections) // per_fixture,
+        "bookmaker_odds": odds,
+        "prediction_prob": np.minimum((1 + edge) / odds, 0.99)
+    })
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, TARGET_SIZE, 50000])
+    parser.add_argument("--per-fixture", type=int, default=3, help="Selections per fixture")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    rows = []
+    for n_selections in sorted(set(args.sizes) | {TARGET_SIZE}):
+        slate = value_slate(n_selections, args.per_fixture)
+        seconds, staked = timed(size_stakes, slate, repeat=args.repeat)
+        rows.append({
+            "selections": n_selections,
+            "solve_ms": seconds * 1000.0,
+            "staked_bets": int((staked["stake"] > 0).sum()),
+            "total_stake": float(staked["stake"].sum())
+        })
+        
+    print_table(rows, ["selections", "solve_ms", "staked_bets", "total_stake"])
+    target = next(row for row in rows if row["selections"] == TARGET_SIZE)
+    if target["solve_ms"] >= TARGET_SECONDS * 1000.0:
+        print(f"{TARGET_SIZE}-selection slate took {target['solve_ms']:.0f}ms (target < {TARGET_SECONDS:.0f}s)")
+        sys.exit(1)
+    print(f"{TARGET_SIZE}-selection slate solved in {target['solve_ms']:.1f}ms")
+
+if __name__ == "__main__":
+    main()
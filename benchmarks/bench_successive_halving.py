@@ -0,0 +1,79 @@
+"""
+Training compute of early stopping and successive halving
+
+Times the old fixed schedule (one fit of Config.HYBRID_PARAMS at the full
+estimator/epoch budget, early stopping disabled) against one early-stopped
+fit and the successive-halving search, on the same synthetic data.
+Compute is reported both as wall time and in the units successive_halving
+uses (fractions of a full-budget fit).
+
+    python -m benchmarks.bench_successive_halving --rows 5000
+"""
+import time
+import argparse
+from config import Config
+from models.hybrid_model import HybridModel
+from models.training_budget import successive_halving
+from .common import training_frame, print_table
+
+def fixed_schedule_fit(data):
+    """The pre-change schedule: every estimator and every epoch, no early stopping"""
+    patience, no_change = Config.LSTM_PATIENCE, Config.GBM_N_ITER_NO_CHANGE
+    Config.LSTM_PATIENCE = Config.HYBRID_PARAMS["lstm_epochs"] + 1
+    Config.GBM_N_ITER_NO_CHANGE = None
+    try:
+        model = HybridModel("bench_predictor")
+        model.train(data)
+    finally:
+        Config.LSTM_PATIENCE, Config.GBM_N_ITER_NO_CHANGE = patience, no_change
+    return model
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--candidates", type=int, default=None)
+    args = parser.parse_args()
+    
+    data = training_frame(args.rows)
+    rows = []
+    
+    started = time.perf_counter()
+    fixed = fixed_schedule_fit(data)
+    fixed_s = time.perf_counter() - started
+    rows.append({
+        "schedule": "fixed",
+        "wall_s": fixed_s,
+        "compute": fixed.training_report["compute_fraction"],
+        "val_log_loss": fixed.training_report["val_log_loss"]
+    })
+    
+    started = time.perf_counter()
+    early = HybridModel("bench_predictor")
+    early.train(data)
+    rows.append({
+        "schedule": "early_stopping",
+        "wall_s": time.perf_counter() - started,
+        "compute": early.training_report["compute_fraction"],
+        "val_log_loss": early.training_report["val_log_loss"]
+    })
+    
+    started = time.perf_counter()
+    _, report = successive_halving(data, n_candidates=args.candidates)
+    rows.append({
+        "schedule": "successive_halving",
+        "wall_s": time.perf_counter() - started,
+        "compute": report["compute_used"],
+        "val_log_loss": report["best_log_loss"]
+    })
+    
+    for row in rows:
+        row["wall_vs_fixed"] = row["wall_s"] / fixed_s
+    print_table(rows, ["schedule", "wall_s", "wall_vs_fixed", "compute", "val_log_loss"])
+    print(
+        f"Search compute {report['compute_vs_fixed']:.2f}x one fixed fit; "
+        f"saved {report['compute_saved_vs_exhaustive']:.0%} versus training all "
+        f"{report['exhaustive_cost']:.0f} candidates in full"
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Columnar value detection against the row-by-row loop it replaced
+
+Prices --rows synthetic selections and runs find_value over them, once
+with a single threshold and once with several thresholds and a bet-type
+filter in the same pass. The old iterrows loop is timed on a --legacy-rows
+sample (it is far too slow for a million rows) and projected to the full
+size. Both must select the same rows with the same value scores.
+
+    python -m benchmarks.bench_value_engine --rows 1000000
+"""
+import sys
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from config import Config
+from utils.value_engine import find_value
+from .common import timed, print_table
+
+def priced_selections(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    odds = rng.uniform(1.2, 8.0, n_rows)
+    prob = np.clip(1.0 / odds + rng.normal(scale=0.12, size=n_rows), 0.01, 0.99)
+    return pd.DataFrame({
+        "match_id": np.arange(n_rows),
+        "home_team": "Home",
+        "away_team": "Away",
+        "prediction": (prob > 0.5).astype(int),
+        "confidence": np.maximum(prob, 1 - prob),
+        "bookmaker_odds": odds,
+        "prediction_prob": prob
+    })
+
+def iterrows_value(predictions, threshold=Config.VALUE_THRESHOLD):
+    """The loop ValueIdentifierAgent.execute used before find_value"""
+    value_bets = []
+    for _, row in predictions.iterrows():
+        implied_prob = 1 / row['bookmaker_odds']
+        value_score = row['prediction_prob'] - implied_prob
+        if abs(value_score) > threshold:
+            value_bets.append({
+                "match_id": row['match_id'],
+                "home_team": row['home_team'],
+                "away_team": row['away_team'],
+                "prediction": row['prediction'],
+                "confidence": row['confidence'],
+                "bookmaker_odds": row['bookmaker_odds'],
+                "value_score": value_score,
+                "bet_type": "UNDERVALUE" if value_score > 0 else "OVERVALUE"
+            })
+    return value_bets
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--legacy-rows", type=int, default=50000, help="Sample size for the iterrows loop")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    predictions = priced_selections(args.rows)
+    thresholds = [Config.VALUE_THRESHOLD, 0.2, 0.3]
+    
+    single_s, single = timed(find_value, predictions, repeat=args.repeat)
+    multi_s, multi = timed(
+        find_value, predictions, thresholds=thresholds, bet_types=["UNDERVALUE"], repeat=args.repeat
+    )
+    
+    sample = predictions.iloc[:min(args.legacy_rows, args.rows)]
+    started = time.perf_counter()
+    legacy = iterrows_value(sample)
+    legacy_s = (time.perf_counter() - started) * args.rows / len(sample)
+    
+    rows = [
+        {"method": "iterrows (projected)", "seconds": legacy_s, "selected": round(len(legacy) * args.rows / len(sample))},
+        {"method": "find_value", "seconds": single_s, "selected": len(single)},
+        {"method": f"find_value {len(thresholds)} thresholds, UNDERVALUE", "seconds": multi_s, "selected": len(multi)}
+    ]
+    for row in rows:
+        row["rows_per_s"] = args.rows / row["seconds"]
+        row["speedup"] = legacy_s / row["seconds"]
+    print(f"{args.rows} priced selections; iterrows timed on {len(sample)} and scaled")
+    print_table(rows, ["method", "seconds", "rows_per_s", "speedup", "selected"])
+    
+    expected = pd.DataFrame(legacy, columns=["match_id", "value_score"])
+    actual = find_value(sample)[["match_id", "value_score"]]
+    if (
+        len(expected) != len(actual)
+        or not np.array_equal(expected["match_id"].to_numpy(), actual["match_id"].to_numpy())
+        or not np.allclose(expected["value_score"].to_numpy(), actual["value_score"].to_numpy())
+    ):
+        print(f"Parity check failed: iterrows selected {len(expected)} rows, find_value {len(actual)}")
+        sys.exit(1)
+    print("Parity check passed")
+
+if __name__ == "__main__":
+    main()
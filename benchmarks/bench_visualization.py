@@ -0,0 +1,127 @@
+"""
+Performance chart build time and JSON payload size against history length
+
+Fills a PerformanceLog with 10k/100k/1M settled bets and times the first
+render of the history and ROI figures, then a re-render after appending
+--append new bets, and the JSON size of each figure. With LTTB
+downsampling the payload stays bounded by Config.CHART_POINT_BUDGET
+points per trace. The full rebuild the charts used before (one point
+per bet, per-row hover text) is timed up to --legacy-max bets.
+
+    python -m benchmarks.bench_visualization --sizes 10000 100000 1000000
+"""
+import time
+import argparse
+from datetime import datetime, timedelta
+import numpy as np
+import plotly.graph_objects as go
+from config import Config
+from utils.performance_log import PerformanceLog
+from utils.visualization import PerformanceCharts
+from .common import print_table
+
+INITIAL_BUDGET = 1000.0
+
+def settled_bets(n_bets, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        "results": np.where(rng.random(n_bets) < 0.55, "win", "loss"),
+        "confidences": rng.uniform(0.5, 0.95, n_bets),
+        "profits": rng.normal(0.5, 10.0, n_bets)
+    }
+
+def fill_log(log, bets, start, batch=100):
+    """Log bets in batches, one timestamp per batch as the pipeline does"""
+    for offset in range(0, len(bets["results"]), batch):
+        rows = slice(offset, offset + batch)
+        log.extend(
+            "bench_agent",
+            bets["results"][rows],
+            bets["confidences"][rows],
+            profits=bets["profits"][rows],
+            timestamp=start + timedelta(minutes=(offset // batch))
+        )
+
+def legacy_history_figure(df):
+    """The pre-change full rebuild: every bet drawn, hover text built per row"""
+    df = df.copy()
+    df['win'] = df['result'] == 'win'
+    df['win_rate'] = df['win'].cumsum() / np.arange(1, len(df) + 1)
+    colors = ['#2EFE2E' if res == 'win' else '#FE2E2E' for res in df['result']]
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=df['timestamp'], y=df['win_rate'], mode='lines+markers', name='Win Rate'))
+    fig.add_trace(go.Scatter(
+        x=[df['timestamp'].min(), df['timestamp'].max()], y=[0.55, 0.55], mode='lines', name='Profit Threshold'
+    ))
+    fig.add_trace(go.Scatter(
+        x=df['timestamp'],
+        y=[0.05] * len(df),
+        mode='markers',
+        name='Bets',
+        marker=dict(color=colors),
+        hovertext=df.apply(lambda row: f"{row['result'].upper()} - Confidence: {row['confidence']:.0%}", axis=1),
+        hoverinfo='text'
+    ))
+    fig.update_layout(title='Performance History', template='plotly_dark')
+    return fig
+
+def json_mb(fig):
+    return len(fig.to_json()) / 1e6
+
+def render_both(charts):
+    return charts.history_figure(), charts.roi_figure(INITIAL_BUDGET)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--append", type=int, default=100, help="Bets appended before the incremental render")
+    parser.add_argument("--legacy-max", type=int, default=100000, help="Largest history for the full rebuild")
+    args = parser.parse_args()
+    
+    start = datetime(2026, 1, 1)
+    rows = []
+    for n_bets in args.sizes:
+        bets = settled_bets(n_bets + args.append)
+        log = PerformanceLog()
+        fill_log(log, {name: values[:n_bets] for name, values in bets.items()}, start)
+        charts = PerformanceCharts(log)
+        
+        started = time.perf_counter()
+        history, roi = render_both(charts)
+        first_ms = (time.perf_counter() - started) * 1000.0
+        
+        fill_log(
+            log,
+            {name: values[n_bets:] for name, values in bets.items()},
+            start + timedelta(minutes=n_bets // 100 + 1)
+        )
+        started = time.perf_counter()
+        history, roi = render_both(charts)
+        incremental_ms = (time.perf_counter() - started) * 1000.0
+        
+        row = {
+            "bets": n_bets,
+            "first_render_ms": first_ms,
+            "incremental_ms": incremental_ms,
+            "points_per_trace": len(history.data[0].x),
+            "history_mb": json_mb(history),
+            "roi_mb": json_mb(roi),
+            "legacy_ms": float("nan"),
+            "legacy_mb": float("nan")
+        }
+        if n_bets <= args.legacy_max:
+            frame = log.to_frame()
+            started = time.perf_counter()
+            legacy = legacy_history_figure(frame)
+            row["legacy_ms"] = (time.perf_counter() - started) * 1000.0
+            row["legacy_mb"] = json_mb(legacy)
+        rows.append(row)
+        
+    print(f"Point budget {Config.CHART_POINT_BUDGET} per trace; incremental render after {args.append} new bets")
+    print_table(rows, [
+        "bets", "first_render_ms", "incremental_ms", "points_per_trace",
+        "history_mb", "roi_mb", "legacy_ms", "legacy_mb"
+    ])
+
+if __name__ == "__main__":
+    main()
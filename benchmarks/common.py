@@ -0,0 +1,145 @@
+import os
+import time
+import tempfile
+import resource
+import multiprocessing
+import numpy as np
+import pandas as pd
+from config import Config
+
+def timed(fn, *args, repeat=5, **kwargs):
+    """
+    Best-of-`repeat` wall time of fn(*args, **kwargs)
+    
+    Returns:
+        tuple: (best seconds, result of the last call)
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+def print_table(rows, columns):
+    """Print a list of dicts as an aligned text table"""
+    widths = {
+        column: max(len(column), *(len(_format(row[column])) for row in rows))
+        for column in columns
+    }
+    print("  ".join(column.rjust(widths[column]) for column in columns))
+    for row in rows:
+        print("  ".join(_format(row[column]).rjust(widths[column]) for column in columns))
+
+def _format(value):
+    if isinstance(value, float):
+        return f"{value:.4g}"
+    return str(value)
+
+def memory_usage():
+    """
+    Resident memory of this process in MB (Linux /proc)
+    
+    Returns:
+        dict: rss, anon (private heap) and file (mapped files, shareable
+            between processes) in MB; empty where /proc is unavailable
+    """
+    fields = {"VmRSS": "rss", "RssAnon": "anon", "RssFile": "file"}
+    usage = {}
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                name, _, value = line.partition(":")
+                if name in fields:
+                    usage[fields[name]] = int(value.split()[0]) / 1024.0
+    except OSError:
+        pass
+    return usage
+
+def use_scratch_paths(root=None):
+    """
+    Point model storage at a scratch directory so benchmarks never touch
+    the real registry
+    
+    Returns:
+        str: The scratch directory
+    """
+    root = root or tempfile.mkdtemp(prefix="sba-bench-")
+    Config.MODEL_PATH = os.path.join(root, "models") + os.sep
+    Config.MODEL_MANIFEST = os.path.join(root, "models", "registry.sqlite")
+    Config.MODEL_ARTIFACT_PATH = os.path.join(root, "models", "artifacts") + os.sep
+    Config.MODEL_SHARED_PATH = os.path.join(root, "models", "shared") + os.sep
+    Config.DATA_PATH = os.path.join(root, "data") + os.sep
+    os.makedirs(Config.MODEL_PATH, exist_ok=True)
+    os.makedirs(Config.DATA_PATH, exist_ok=True)
+    return root
+
+def training_frame(n_rows, seed=0, target=Config.TARGET):
+    """
+    Synthetic numeric training frame over Config.REQUIRED_FEATURES
+    
+    The target depends on a few of the features plus noise, so models
+    have something to learn and early stopping behaves as on real data.
+    """
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame(
+        rng.normal(size=(n_rows, len(Config.REQUIRED_FEATURES))),
+        columns=Config.REQUIRED_FEATURES
+    )
+    signal = data["player_form"] + 0.5 * data["team_form"] - 0.5 * data["injuries"]
+    data[target] = (signal + rng.normal(scale=1.0, size=n_rows) > 0).astype(int)
+    return data
+
+def fitted_model(n_rows=2000, budget=0.2, seed=0):
+    """
+    A small HybridModel fitted on synthetic data
+    
+    Returns:
+        tuple: (HybridModel, feature frame without the target)
+    """
+    from models.hybrid_model import HybridModel
+    data = training_frame(n_rows, seed=seed)
+    model = HybridModel("bench_predictor")
+    model.train(data, budget=budget)
+    return model, data.drop(columns=[Config.TARGET])
+
+def feature_rows(features, n_rows, seed=0):
+    """n_rows rows resampled from a feature frame"""
+    rng = np.random.default_rng(seed)
+    return features.iloc[rng.integers(0, len(features), size=n_rows)].reset_index(drop=True)
+
+def _cold_start_child(root, model_name, runtime, lazy, sample, results):
+    use_scratch_paths(root)
+    from models.model_registry import ModelRegistry, ModelCache
+    started = time.perf_counter()
+    model = ModelRegistry(cache=ModelCache()).load_model(model_name, runtime=runtime, lazy=lazy)
+    loaded = time.perf_counter()
+    proba = model.predict_proba(sample)
+    scored = time.perf_counter()
+    results.put({
+        "load_ms": (loaded - started) * 1000.0,
+        "first_score_ms": (scored - loaded) * 1000.0,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0,
+        "anon_mb": memory_usage().get("anon", float("nan")),
+        "proba": np.asarray(proba).tolist()
+    })
+
+def cold_start(root, model_name, runtime, sample, lazy=False):
+    """
+    Load the latest saved version in a fresh process and score `sample`
+    
+    Returns:
+        dict: load_ms, first_score_ms, peak_rss_mb, anon_mb and the
+            probabilities ("proba") the fresh process produced
+    """
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(
+        target=_cold_start_child,
+        args=(root, model_name, runtime, lazy, sample, results)
+    )
+    process.start()
+    result = results.get()
+    process.join()
+    return result
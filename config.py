@@ -13,6 +13,13 @@ class Config:
     # Telegram
     TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
     TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
+    TELEGRAM_API_URL = os.getenv("TELEGRAM_API_URL")  # Bot API server override (e.g. http://127.0.0.1:8081); "/bot" is appended if missing
+    TELEGRAM_QUEUE_SIZE = 1000  # Outbound items buffered; further items are dropped
+    TELEGRAM_BATCH_WINDOW = 2.0  # Seconds to gather queued items into one batch
+    TELEGRAM_MIN_INTERVAL = 1.0  # Seconds between sends to the chat
+    TELEGRAM_MAX_RETRIES = 5
+    TELEGRAM_BACKOFF = 1.0  # Base seconds for exponential retry backoff
+    CHART_CACHE_SIZE = 64  # Rendered chart images kept in memory
     
     # Paths
     DATA_PATH = "data/"
@@ -30,12 +37,123 @@ class Config:
         "pitch_condition"
     ]
     
+    # Added by utils.data_utils.create_features
+    ENGINEERED_FEATURES = [
+        "form_differential",
+        "injury_impact",
+        "coach_exp_diff",
+        "weather_impact",
+        "pitch_impact"
+    ]
+    
+    # Agent scheduling
+    MAX_CONCURRENT_AGENTS = int(os.getenv("MAX_CONCURRENT_AGENTS", 4))
+    BUDGET_RESERVE = float(os.getenv("BUDGET_RESERVE", 1000))  # Paid agents wait below this
+    BUDGET_WAIT_TIMEOUT = float(os.getenv("BUDGET_WAIT_TIMEOUT", 300))  # Seconds to wait for a top-up before skipping deferred agents
+    DATA_COLLECTION_COST_ESTIMATE = 10.0  # Budget reserved per collection run
+    
+    # Streaming odds ingestion
+    STREAM_POLL_INTERVAL = float(os.getenv("STREAM_POLL_INTERVAL", 2))  # Seconds between polls per bookmaker
+    STREAM_MAX_QUEUE = 100000  # Deltas buffered before pollers block
+    STREAM_BATCH_SIZE = 1000  # Deltas processed per pipeline step
+    ODDS_HISTORY_SIZE = 50  # Price updates kept per fixture in the odds book
+    
+    # Performance log
+    PERFORMANCE_LOG_DIR = os.getenv("PERFORMANCE_LOG_DIR")  # Segment directory; unset keeps the log in memory
+    PERFORMANCE_CHUNK_SIZE = 4096  # Events per chunk / on-disk segment
+    CHART_POINT_BUDGET = 2000  # Max points per chart trace (LTTB downsampled)
+    
+    # Dashboard
+    REPORT_STORE_PATH = f"{DATA_PATH}reports.sqlite"
+    REPORT_STORE_KEEP = 20  # Report versions retained
+    DASHBOARD_HOST = os.getenv("DASHBOARD_HOST", "0.0.0.0")
+    DASHBOARD_PORT = int(os.getenv("DASHBOARD_PORT", 8050))
+    DASHBOARD_POLL_MS = 5000  # How often clients check for a new report version
+    DASHBOARD_AUTOSTART = os.getenv("DASHBOARD_AUTOSTART", "true").lower() == "true"  # ReportingAgent starts a detached server if none is listening; set false when running `python -m dash_app.app` as a service
+    
+    # Feature store
+    FEATURE_STORE_IGNORED_COLUMNS = ["bookmaker", "dc_btts_odds", "bookmaker_odds"]  # Not hashed
+    FEATURE_VERSION = 1  # Bump when feature semantics change outside the feature functions
+    
     # Bookmaker sources
     BOOKMAKERS = ["Hollywoodbets", "Betway"]
     
+    # Odds collection
+    COLLECTION_MODE = os.getenv("COLLECTION_MODE", "concurrent")  # "concurrent" or "sequential"
+    SOURCE_TIMEOUT = float(os.getenv("SOURCE_TIMEOUT", 10))  # Seconds per bookmaker
+    MAX_COLLECTION_WORKERS = 32
+    HTTP_POOL_CONNECTIONS = 32  # Hosts kept in the keep-alive pool
+    HTTP_POOL_MAXSIZE = 32  # Connections per host
+    
     # Prediction settings
     TARGET = "dc_btts"  # Double chance + both teams to score
     
+    # Staking
+    BANKROLL = float(os.getenv("BANKROLL", 10000))  # Betting bankroll, separate from the agent budget
+    KELLY_FRACTION = float(os.getenv("KELLY_FRACTION", 0.25))  # Multiplier on full Kelly
+    KELLY_CORRELATION = 0.5  # Assumed outcome correlation of selections on the same fixture
+    MAX_FIXTURE_EXPOSURE = 0.05  # Max fraction of bankroll on one fixture
+    MAX_BANKROLL_EXPOSURE = 0.5  # Max fraction of bankroll across the slate
+    
+    # Inference server
+    INFERENCE_HOST = os.getenv("INFERENCE_HOST", "127.0.0.1")
+    INFERENCE_PORT = int(os.getenv("INFERENCE_PORT", 8765))
+    INFERENCE_MAX_BATCH = 256  # Rows per micro-batch
+    INFERENCE_MAX_WAIT_MS = 5  # Longest a request waits for batch-mates
+    INFERENCE_REQUEST_TIMEOUT = 30  # Seconds
+    
+    # Lite (TensorFlow-free) runtime
+    MODEL_RUNTIME = os.getenv("MODEL_RUNTIME", "full")  # "full", "lite" or "shared"
+    LITE_PARITY_TOLERANCE = 1e-4  # Max abs difference vs the full model
+    
+    # Model registry
+    MODEL_MANIFEST = f"{MODEL_PATH}registry.sqlite"
+    MODEL_ARTIFACT_PATH = f"{MODEL_PATH}artifacts/"  # Content-addressed artifact store
+    MODEL_CACHE_MAX_MB = int(os.getenv("MODEL_CACHE_MAX_MB", 2048))  # Loaded models kept per process
+    MODEL_LAZY_LOAD = os.getenv("MODEL_LAZY_LOAD", "true").lower() == "true"  # Load each half on first use
+    MODEL_CANARY_ROWS = 256  # Rows scored to warm a model before promotion
+    MODEL_LATENCY_WINDOW = 1000  # Scoring calls kept per version for latency stats
+    SHADOW_RETRAINS = os.getenv("SHADOW_RETRAINS", "false").lower() == "true"  # QA retrains go to shadow scoring instead of production
+    SHADOW_CALIBRATION_BINS = 10  # Probability bins for online calibration of shadow models
+    SHADOW_OUTCOME_RETENTION = 10000  # Settled outcomes kept for late candidate scores; oldest dropped first
+    MODEL_SHARED_PATH = os.getenv("MODEL_SHARED_PATH", f"{MODEL_PATH}shared/")  # Packed models mapped by workers; /dev/shm/... for tmpfs
+    
+    # Cross-validation
+    CV_FOLDS = 5
+    CV_SPLITTER = os.getenv("CV_SPLITTER", "kfold")  # "kfold" or "time_series"
+    CV_WORKERS = int(os.getenv("CV_WORKERS", 0)) or None  # Defaults to min(folds, cores)
+    CV_TIME_COLUMN = "match_date"
+    
+    # Backtesting
+    BACKTEST_SEASON_COLUMN = "season"  # Derived from the match date when missing
+    BACKTEST_RETRAIN_FREQ = os.getenv("BACKTEST_RETRAIN_FREQ", "M")  # Walk-forward retrain period (pandas period alias)
+    BACKTEST_MIN_TRAIN_ROWS = 200  # Periods with less history before them are skipped
+    BACKTEST_WORKERS = int(os.getenv("BACKTEST_WORKERS", 0)) or None  # Defaults to min(seasons, cores)
+    
+    # Hybrid model training
+    HYBRID_PARAMS = {
+        "gbm_n_estimators": 200,  # Upper bound; early stopping may use fewer
+        "gbm_learning_rate": 0.05,
+        "gbm_max_depth": 5,
+        "lstm_units": (128, 64),
+        "lstm_dropout": 0.3,
+        "lstm_epochs": 50,  # Upper bound; early stopping may use fewer
+        "gbm_weight": 0.6  # LSTM gets 1 - gbm_weight
+    }
+    GBM_N_ITER_NO_CHANGE = 10
+    LSTM_DIRECT_BATCH = 4096  # Larger batches go through Keras predict in chunks
+    LSTM_PATIENCE = 5
+    HYBRID_SEARCH_SPACE = {
+        "gbm_learning_rate": [0.03, 0.05, 0.1],
+        "gbm_max_depth": [3, 5, 7],
+        "lstm_units": [(64, 32), (128, 64)],
+        "lstm_dropout": [0.2, 0.3],
+        "gbm_weight": [0.4, 0.5, 0.6, 0.7]
+    }
+    HYPERPARAMETER_SEARCH = os.getenv("HYPERPARAMETER_SEARCH", "false").lower() == "true"  # Retrains run successive halving instead of one early-stopped fit
+    SEARCH_CANDIDATES = 9
+    SEARCH_ETA = 3  # Keep the best 1/eta candidates per rung
+    
     # QA thresholds
     DATA_QUALITY_THRESHOLD = 0.95  # Minimum valid data percentage
     MODEL_PERFORMANCE_THRESHOLD = 0.65  # Minimum accuracy before retraining
@@ -3,12 +3,22 @@ import dash_bootstrap_components as dbc
 from .layout import create_layout
 from .callbacks import register_callbacks
 import os
+import sys
 import json
+import socket
+import subprocess
 import pandas as pd
 import plotly.express as px
+from config import Config
+from utils.report_store import get_report_store
 
-def create_app(report_data=None):
+_dashboard_process = None
+
+def create_app(store=None):
     """Create and configure the Dash application."""
+    store = store or get_report_store()
+    version, report_data = store.latest()
+    
     app = Dash(
         __name__,
         external_stylesheets=[dbc.themes.DARKLY],
@@ -16,17 +26,52 @@ def create_app(report_data=None):
     )
     
     app.title = "Sports Betting AI Dashboard"
-    app.layout = create_layout(report_data)
+    app.layout = create_layout(report_data, version)
     
-    # Register callbacks
-    register_callbacks(app)
-    
-    # Store report data in app config
-    app.report_data = report_data
+    # Register callbacks; they poll the shared report store
+    register_callbacks(app, store)
     
     return app
 
-def run_dashboard(report_data=None):
-    """Run the dashboard application."""
-    app = create_app(report_data)
-    app.run_server(host='0.0.0.0', port=8050, debug=False)
+def run_dashboard():
+    """Run the dashboard server (blocks; meant for its own process)."""
+    app = create_app()
+    app.run_server(host=Config.DASHBOARD_HOST, port=Config.DASHBOARD_PORT, debug=False)
+
+def dashboard_listening(timeout=0.5):
+    """Whether something already accepts connections on the dashboard port."""
+    host = "127.0.0.1" if Config.DASHBOARD_HOST in ("0.0.0.0", "") else Config.DASHBOARD_HOST
+    try:
+        with socket.create_connection((host, Config.DASHBOARD_PORT), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+def ensure_dashboard_process():
+    """
+    Start the dashboard as a detached server unless one is already running.
+    
+    The server runs as `python -m dash_app.app` in its own session, so it
+    outlives the pipeline process that started it; later runs find it
+    listening and reuse it. Output goes to dashboard.log in DATA_PATH.
+    """
+    global _dashboard_process
+    if _dashboard_process is not None and _dashboard_process.poll() is None:
+        return _dashboard_process
+    if dashboard_listening():
+        return None
+    os.makedirs(Config.DATA_PATH, exist_ok=True)
+    with open(f"{Config.DATA_PATH}dashboard.log", "ab") as log:
+        _dashboard_process = subprocess.Popen(
+            [sys.executable, "-m", "dash_app.app"],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True
+        )
+    print(f"Dashboard started (pid {_dashboard_process.pid}) on port {Config.DASHBOARD_PORT}")
+    return _dashboard_process
+
+if __name__ == "__main__":
+    run_dashboard()
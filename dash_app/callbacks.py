@@ -1,3 +1,4 @@
+from dash import no_update
 from dash.dependencies import Input, Output, State
 import dash_core_components as dcc
 import dash_html_components as html
@@ -6,24 +7,22 @@ import plotly.graph_objects as go
 from datetime import datetime
 import pandas as pd
 
-def register_callbacks(app):
+def register_callbacks(app, store):
     """Register all callbacks for the Dash application."""
     
     @app.callback(
-        Output('report-data-store', 'data'),
-        [Input('interval-component', 'n_intervals')]
+        [Output('report-data-store', 'data'),
+         Output('report-version-store', 'data')],
+        [Input('interval-component', 'n_intervals')],
+        [State('report-version-store', 'data')]
     )
-    def load_report_data(n_intervals):
-        """Load the report data from the app's config or from a file."""
-        # In a real app, we might fetch from an API or database
-        # For now, we'll use the data passed when starting the app
-        if hasattr(app, 'config') and 'report_data' in app.config:
-            return app.config['report_data']
-        # Otherwise, try to load from file (for demonstration)
-        try:
-            return pd.read_json("sports_betting_report.json").to_dict()
-        except:
-            return None
+    def load_report_data(n_intervals, client_version):
+        """Send the latest report only when the client's version is stale."""
+        version = store.latest_version()
+        if version is None or version == client_version:
+            return no_update, no_update
+        version, report_data = store.latest()
+        return report_data, version
     
     @app.callback(
         [Output('performance-cards', 'children'),
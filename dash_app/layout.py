@@ -1,21 +1,12 @@
 from dash import html, dcc, dash_table
 import dash_bootstrap_components as dbc
 from datetime import datetime
+import pandas as pd
 import plotly.graph_objects as go
+from config import Config
 from utils.visualization import create_performance_history, create_value_bets_plot
 
-# In the layout:
-dcc.Graph(
-    id='performance-history',
-    figure=create_performance_history(performance_log)
-),
-
-dcc.Graph(
-    id='value-bets-plot',
-    figure=create_value_bets_plot(value_bets)
-)
-
-def create_layout(report_data=None):
+def create_layout(report_data=None, version=None):
     """Create the layout for the Dash application."""
     # Default values if no report data
     win_rate = report_data['performance']['win_rate'] if report_data else 0.0
@@ -83,6 +74,7 @@ def create_layout(report_data=None):
                         dbc.CardHeader("Value Bet Recommendations", className="text-center"),
                         dbc.CardBody(
                             create_value_bets_table(value_bets)
+                        )
                     ]),
                     width=12
                 )
@@ -97,6 +89,7 @@ def create_layout(report_data=None):
                             dcc.Graph(
                                 id='performance-graph',
                                 figure=create_performance_graph(report_data)
+                            )
                         )
                     ]),
                     width=12
@@ -114,7 +107,7 @@ def create_layout(report_data=None):
                             dbc.Button("Manual Approval", id="approval-button", color="success"),
                             dcc.Interval(
                                 id='interval-component',
-                                interval=15*60*1000,  # 15 minutes
+                                interval=Config.DASHBOARD_POLL_MS,  # Cheap version check
                                 n_intervals=0
                             )
                         ], className="d-flex justify-content-center")
@@ -125,6 +118,7 @@ def create_layout(report_data=None):
             
             # Hidden div for storing report data
             dcc.Store(id='report-data-store', data=report_data),
+            dcc.Store(id='report-version-store', data=version),
             
             # Status alerts
             html.Div(id='status-alert')
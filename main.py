@@ -1,5 +1,4 @@
 import os
-import time
 from dotenv import load_dotenv
 from agents import DataCollectorAgent, ProjectConductor
 
@@ -18,26 +17,22 @@ if __name__ == "__main__":
         {"sources": ["Hollywoodbets", "Betway"]}
     )
     
-    # Execute workflow
-    while conductor.agent_pool:
-        current_agent_id = list(conductor.agent_pool.keys())[0]
-        agent = conductor.agent_pool[current_agent_id]
-        
-        print(f"\n=== Executing {current_agent_id} ===")
-        result = agent.execute()
-        
+    def on_complete(agent_id, result):
         # Handle next agent
         if "next_agent" in result:
-            print(f"Passing to next agent: {result['next_agent']}")
+            print(f"{agent_id} passed to next agent: {result['next_agent']}")
         else:
-            print(f"Completed {current_agent_id}")
-        
-        # Remove completed agent
-        del conductor.agent_pool[current_agent_id]
-        
-        # Budget check
-        if conductor.budget <= 1000:
-            print("Budget critically low - pausing operations")
-            time.sleep(60 * 60)  # Sleep for 1 hour
-            
+            print(f"Completed {agent_id}")
+    
+    # Execute workflow: independent agents run in parallel. Paid agents
+    # (API collection) wait while budget is low; everything else keeps
+    # running. Deferred work resumes on conductor.replenish_budget(), or is
+    # skipped after Config.BUDGET_WAIT_TIMEOUT seconds without a top-up.
+    metrics = conductor.run(on_complete=on_complete)
+    
+    for agent_id, stats in metrics.items():
+        print(
+            f"{agent_id}: {stats['status']} in {stats['wall_time']:.2f}s "
+            f"(queued {stats['queue_wait']:.2f}s)"
+        )
     print("All tasks completed!")
@@ -1,4 +1,7 @@
 from .hybrid_model import HybridModel
 from .model_registry import ModelRegistry
+from .feature_schema import FeatureSchema, DEFAULT_FEATURE_SCHEMA
+from .inference_server import InferenceServer, serve_http
+from .production_model import ProductionModel
 
-__all__ = ['HybridModel', 'ModelRegistry']
+__all__ = ['HybridModel', 'ModelRegistry', 'FeatureSchema', 'DEFAULT_FEATURE_SCHEMA', 'InferenceServer', 'serve_http', 'ProductionModel']
@@ -0,0 +1,102 @@
+import json
+import hashlib
+from dataclasses import dataclass, field
+import numpy as np
+import pandas as pd
+from config import Config
+
+@dataclass(frozen=True)
+class FeatureSchema:
+    """
+    Immutable, versioned description of a model's input columns
+    
+    Holds the ordered column names, their dtypes and each column's integer
+    position, so every consumer selects exactly the columns the model was
+    fitted on, in the same order.
+    """
+    columns: tuple
+    dtypes: tuple
+    version: int = 1
+    _positions: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if len(self.columns) != len(self.dtypes):
+            raise ValueError("FeatureSchema needs one dtype per column")
+        if len(set(self.columns)) != len(self.columns):
+            raise ValueError("FeatureSchema columns must be unique")
+            
+    @classmethod
+    def from_frame(cls, df, columns=None, version=1):
+        """Build a schema from a frame's columns (or a subset, in the given order)"""
+        columns = tuple(columns if columns is not None else df.columns)
+        dtypes = tuple(str(df[c].dtype) for c in columns)
+        return cls(columns, dtypes, version)
+        
+    @classmethod
+    def from_config(cls, version=1):
+        """Schema of the configured base plus engineered features, all float64"""
+        columns = tuple(dict.fromkeys(Config.REQUIRED_FEATURES + Config.ENGINEERED_FEATURES))
+        return cls(columns, ("float64",) * len(columns), version)
+        
+    @property
+    def index(self):
+        """Column name -> integer position in the schema"""
+        return {name: i for i, name in enumerate(self.columns)}
+        
+    @property
+    def fingerprint(self):
+        payload = json.dumps([self.version, self.columns, self.dtypes])
+        return hashlib.sha1(payload.encode()).hexdigest()[:12]
+        
+    def positions(self, source_columns):
+        """Integer positions of the schema columns inside source_columns"""
+        key = tuple(source_columns)
+        positions = self._positions.get(key)
+        if positions is None:
+            positions = pd.Index(key).get_indexer(self.columns)
+            missing = [c for c, p in zip(self.columns, positions) if p < 0]
+            if missing:
+                raise KeyError(f"Missing feature columns: {', '.join(missing)}")
+            self._positions[key] = positions
+        return positions
+        
+    def select(self, df):
+        """
+        Select the schema columns from df
+        
+        Frames whose columns already match the schema are returned as-is,
+        without a copy; otherwise columns are taken by cached position.
+        """
+        if tuple(df.columns) == self.columns:
+            return df
+        return df.iloc[:, self.positions(df.columns)]
+        
+    def to_array(self, df, dtype=np.float32):
+        """Schema columns of df as a contiguous 2-D array"""
+        if isinstance(df, np.ndarray):
+            return np.ascontiguousarray(df, dtype=dtype)
+        return np.ascontiguousarray(self.select(df).to_numpy(dtype=dtype))
+        
+    def to_dict(self):
+        return {
+            "version": self.version,
+            "columns": list(self.columns),
+            "dtypes": list(self.dtypes),
+            "fingerprint": self.fingerprint
+        }
+        
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+            
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            spec = json.load(f)
+        schema = cls(tuple(spec["columns"]), tuple(spec["dtypes"]), spec.get("version", 1))
+        if spec.get("fingerprint") and spec["fingerprint"] != schema.fingerprint:
+            raise ValueError(f"Feature schema at {path} failed its fingerprint check")
+        return schema
+
+# Built once per process; never mutated
+DEFAULT_FEATURE_SCHEMA = FeatureSchema.from_config()
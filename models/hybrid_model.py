@@ -1,73 +1,198 @@
 import numpy as np
 import pandas as pd
-import joblib
-from tensorflow.keras.models import Sequential, load_model
-from tensorflow.keras.layers import LSTM, Dense, Dropout
-from sklearn.ensemble import GradientBoostingClassifier
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score
-import plotly.graph_objects as go
 from config import Config
+from .feature_schema import FeatureSchema
+from .lite_runtime import LiteHybridModel, export_lite
 import os
+import threading
+
+# TensorFlow, scikit-learn and plotly are imported where they are used so
+# that the "lite" runtime can load and score without any of them.
 
 class HybridModel:
-    def __init__(self, model_name="dc_btts_predictor"):
+    # Artifact role -> file name inside a saved version directory
+    ARTIFACT_FILES = {
+        "gbm": "gbm_model.pkl",
+        "lstm": "lstm_model.keras",
+        "feature_importances": "feature_importances.csv",
+        "feature_schema": "feature_schema.json",
+        "lite": "lite.npz"
+    }
+    
+    def __init__(self, model_name="dc_btts_predictor", params=None):
         self.model_name = model_name
+        self.params = {**Config.HYBRID_PARAMS, **(params or {})}
+        self._artifacts = {}
+        self._load_lock = threading.Lock()
         self.gbm = None
         self.lstm = None
         self.feature_importances = None
         self.input_shape = None
+        self.feature_schema = None
+        self.gbm_weight = self.params["gbm_weight"]
+        self.lite = None
+        self.training_report = {}
+        self.important_features = None
+        self.important_positions = None
+        self._important_cache = {}
+        self._buffers = threading.local()
         
-    def train(self, data, target="dc_btts", validation_split=0.2):
+    def train(self, data, target="dc_btts", validation_split=0.2, budget=1.0):
+        """
+        Fit both halves and return validation accuracy
+        
+        `budget` scales the maximum GBM estimators and LSTM epochs (used by
+        successive halving); early stopping can end either half sooner.
+        """
+        from sklearn.model_selection import train_test_split
+        from sklearn.metrics import log_loss
         X = data.drop(columns=[target])
         y = data[target]
+        self.feature_schema = FeatureSchema.from_frame(X)
         
         X_train, X_val, y_train, y_val = train_test_split(
             X, y, test_size=validation_split, random_state=42
         )
         
-        self.train_gbm(X_train, y_train)
+        max_estimators = max(10, int(round(self.params["gbm_n_estimators"] * budget)))
+        max_epochs = max(1, int(round(self.params["lstm_epochs"] * budget)))
+        
+        self.train_gbm(X_train, y_train, n_estimators=max_estimators)
         
         important_features = self.get_important_features(threshold=0.01)
         X_train_important = X_train[important_features]
         X_val_important = X_val[important_features]
         
-        self.train_lstm(X_train_important, y_train, X_val_important, y_val)
+        epochs_run = self.train_lstm(X_train_important, y_train, X_val_important, y_val, epochs=max_epochs)
         
-        val_accuracy = self.evaluate(X_val, y_val)
+        val_proba = self.predict_proba(X_val)
+        val_accuracy = float(np.mean((val_proba >= 0.5).astype(int) == y_val.to_numpy()))
         print(f"Hybrid model validation accuracy: {val_accuracy:.2%}")
         
+        # Cost relative to the fixed schedule (all estimators, all epochs)
+        gbm_fraction = self.gbm.n_estimators_ / Config.HYBRID_PARAMS["gbm_n_estimators"]
+        lstm_fraction = epochs_run / Config.HYBRID_PARAMS["lstm_epochs"]
+        self.training_report = {
+            "gbm_estimators": int(self.gbm.n_estimators_),
+            "lstm_epochs": epochs_run,
+            "compute_fraction": (gbm_fraction + lstm_fraction) / 2,
+            "compute_saved_vs_fixed": 1.0 - (gbm_fraction + lstm_fraction) / 2,
+            "val_accuracy": val_accuracy,
+            "val_log_loss": log_loss(y_val, np.clip(val_proba, 1e-7, 1 - 1e-7), labels=[0, 1])
+        }
+        
         return val_accuracy
     
-    def train_gbm(self, X_train, y_train):
+    def train_gbm(self, X_train, y_train, n_estimators=None):
+        from sklearn.ensemble import GradientBoostingClassifier
+        # n_iter_no_change holds out validation_fraction and stops adding
+        # trees once the held-out loss stops improving
         self.gbm = GradientBoostingClassifier(
-            n_estimators=200,
-            learning_rate=0.05,
-            max_depth=5,
+            n_estimators=n_estimators or self.params["gbm_n_estimators"],
+            learning_rate=self.params["gbm_learning_rate"],
+            max_depth=self.params["gbm_max_depth"],
             random_state=42,
-            subsample=0.8
+            subsample=0.8,
+            n_iter_no_change=Config.GBM_N_ITER_NO_CHANGE,
+            validation_fraction=0.1
         )
-        self.gbm.fit(X_train, y_train)
+        # Fitted on a plain float32 matrix so scoring can skip pandas entirely
+        self.gbm.fit(X_train.to_numpy(dtype=np.float32), y_train)
         
         self.feature_importances = pd.Series(
             self.gbm.feature_importances_,
             index=X_train.columns
         ).sort_values(ascending=False)
+        self._prepare_scoring()
     
+    @property
+    def gbm(self):
+        if self._gbm is None and "gbm" in self._artifacts:
+            self._load_half("gbm")
+        return self._gbm
+        
+    @gbm.setter
+    def gbm(self, value):
+        self._gbm = value
+        
+    @property
+    def lstm(self):
+        if self._lstm is None and "lstm" in self._artifacts:
+            self._load_half("lstm")
+        return self._lstm
+        
+    @lstm.setter
+    def lstm(self, value):
+        self._lstm = value
+        
+    def _load_half(self, role):
+        """
+        Read a deferred GBM or LSTM artifact on first use
+        
+        The path stays in _artifacts until the load succeeds, so a thread
+        arriving mid-load also takes this path and waits on the lock
+        rather than seeing neither a model nor a pending artifact.
+        """
+        with self._load_lock:
+            attribute = "_gbm" if role == "gbm" else "_lstm"
+            if getattr(self, attribute) is not None:
+                return
+            path = self._artifacts.get(role)
+            if path is None:
+                return
+            if role == "gbm":
+                import joblib
+                loaded = joblib.load(path)
+            else:
+                from tensorflow.keras.models import load_model
+                loaded = load_model(path)
+            setattr(self, attribute, loaded)
+            self._artifacts.pop(role, None)
+            print(f"Loaded {self.model_name} {role} from {path}")
+            
     def get_important_features(self, threshold=0.01):
-        return self.feature_importances[
-            self.feature_importances > threshold
-        ].index.tolist()
+        if threshold not in self._important_cache:
+            self._important_cache[threshold] = self.feature_importances[
+                self.feature_importances > threshold
+            ].index.tolist()
+        return self._important_cache[threshold]
     
-    def train_lstm(self, X_train, y_train, X_val, y_val):
+    def _prepare_scoring(self):
+        """Cache the LSTM input columns as schema positions once per fit/load"""
+        self._important_cache = {}
+        self.important_features = self.get_important_features(threshold=0.01)
+        if self.feature_schema is not None:
+            index = self.feature_schema.index
+            self.important_positions = np.array(
+                [index[name] for name in self.important_features],
+                dtype=np.intp
+            )
+        self._buffers = threading.local()
+        
+    def _sequence_buffer(self, n_rows):
+        """Per-thread reusable (rows, features, 1) LSTM input buffer"""
+        buffer = getattr(self._buffers, "seq", None)
+        if buffer is None or buffer.shape[0] < n_rows:
+            capacity = max(n_rows, 2 * buffer.shape[0] if buffer is not None else 64)
+            buffer = np.empty((capacity, len(self.important_positions), 1), dtype=np.float32)
+            self._buffers.seq = buffer
+        return buffer[:n_rows]
+        
+    def train_lstm(self, X_train, y_train, X_val, y_val, epochs=None):
+        """Fit the LSTM with early stopping; returns the number of epochs run"""
+        from tensorflow.keras.models import Sequential
+        from tensorflow.keras.layers import LSTM, Dense, Dropout
+        from tensorflow.keras.callbacks import EarlyStopping
         X_train_seq = X_train.values.reshape((X_train.shape[0], X_train.shape[1], 1))
         X_val_seq = X_val.values.reshape((X_val.shape[0], X_val.shape[1], 1))
         
+        units_1, units_2 = self.params["lstm_units"]
+        dropout = self.params["lstm_dropout"]
         self.lstm = Sequential([
-            LSTM(128, input_shape=(X_train_seq.shape[1], 1), return_sequences=True),
-            Dropout(0.3),
-            LSTM(64),
-            Dropout(0.2),
+            LSTM(units_1, input_shape=(X_train_seq.shape[1], 1), return_sequences=True),
+            Dropout(dropout),
+            LSTM(units_2),
+            Dropout(dropout - 0.1),
             Dense(32, activation='relu'),
             Dense(1, activation='sigmoid')
         ])
@@ -78,15 +203,27 @@ class HybridModel:
             metrics=['accuracy']
         )
         
-        self.lstm.fit(
+        history = self.lstm.fit(
             X_train_seq, y_train,
             validation_data=(X_val_seq, y_val),
-            epochs=50,
+            epochs=epochs or self.params["lstm_epochs"],
             batch_size=32,
-            verbose=1
+            verbose=1,
+            callbacks=[EarlyStopping(
+                monitor="val_loss",
+                patience=Config.LSTM_PATIENCE,
+                restore_best_weights=True
+            )]
         )
+        return len(history.epoch)
     
     def predict_proba(self, X):
+        if self.lite is not None:
+            return self.lite.predict_proba(self.feature_schema.to_array(X))
+        if self.feature_schema is not None and self.important_positions is not None:
+            return self.predict_proba_array(self.feature_schema.to_array(X))
+            
+        # Models saved before feature schemas existed
         important_features = self.get_important_features(threshold=0.01)
         X_important = X[important_features]
         
@@ -95,46 +232,148 @@ class HybridModel:
         gbm_proba = self.gbm.predict_proba(X)[:, 1]
         lstm_proba = self.lstm.predict(X_seq).flatten()
         
-        hybrid_proba = (0.6 * gbm_proba) + (0.4 * lstm_proba)
+        hybrid_proba = (self.gbm_weight * gbm_proba) + ((1 - self.gbm_weight) * lstm_proba)
         
         return hybrid_proba
     
+    def predict_proba_array(self, X):
+        """
+        Score a contiguous float32 matrix whose columns follow feature_schema
+        
+        The LSTM input is gathered into a reused buffer via the cached
+        important-feature positions; small batches go through
+        predict_on_batch to skip Keras' per-call predict pipeline.
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        n_rows = X.shape[0]
+        if n_rows == 0:
+            return np.empty(0, dtype=np.float64)
+            
+        X_seq = self._sequence_buffer(n_rows)
+        np.take(X, self.important_positions, axis=1, out=X_seq[:, :, 0])
+        
+        gbm_proba = self.gbm.predict_proba(X)[:, 1]
+        if n_rows <= Config.LSTM_DIRECT_BATCH:
+            lstm_proba = np.asarray(self.lstm.predict_on_batch(X_seq)).reshape(-1)
+        else:
+            lstm_proba = self.lstm.predict(X_seq, batch_size=Config.LSTM_DIRECT_BATCH, verbose=0).reshape(-1)
+            
+        return (self.gbm_weight * gbm_proba) + ((1 - self.gbm_weight) * lstm_proba)
+        
     def predict(self, X, threshold=0.5):
         proba = self.predict_proba(X)
         return (proba >= threshold).astype(int)
     
     def evaluate(self, X, y):
+        from sklearn.metrics import accuracy_score
         predictions = self.predict(X)
         return accuracy_score(y, predictions)
     
     def save(self, version="v1"):
+        import joblib
         model_dir = f"{Config.MODEL_PATH}{self.model_name}/{version}/"
         os.makedirs(model_dir, exist_ok=True)
         
         joblib.dump(self.gbm, f"{model_dir}gbm_model.pkl")
         self.lstm.save(f"{model_dir}lstm_model.keras")
         self.feature_importances.to_csv(f"{model_dir}feature_importances.csv")
+        if self.feature_schema is not None:
+            self.feature_schema.save(f"{model_dir}feature_schema.json")
+            try:
+                self.export_lite(version)
+            except ValueError as e:
+                print(f"Lite export skipped: {str(e)}")
         
         print(f"Model saved to {model_dir}")
+        
+    def artifact_paths(self, version="v1"):
+        """Role -> path of every artifact saved for a version"""
+        model_dir = f"{Config.MODEL_PATH}{self.model_name}/{version}/"
+        return {
+            role: f"{model_dir}{name}"
+            for role, name in self.ARTIFACT_FILES.items()
+            if os.path.exists(f"{model_dir}{name}")
+        }
     
-    def load(self, version="v1"):
+    def export_lite(self, version="v1", sample=None, tolerance=None):
+        """
+        Export both halves to lite.npz for TensorFlow-free scoring
+        
+        When a sample frame is given, the lite predictions are checked
+        against the full model and a ValueError is raised if any differs
+        by more than `tolerance`.
+        """
         model_dir = f"{Config.MODEL_PATH}{self.model_name}/{version}/"
+        os.makedirs(model_dir, exist_ok=True)
+        path = f"{model_dir}lite.npz"
+        export_lite(self, path)
+        
+        if sample is not None:
+            tolerance = Config.LITE_PARITY_TOLERANCE if tolerance is None else tolerance
+            expected = self.predict_proba(sample)
+            actual = LiteHybridModel.load(path).predict_proba(self.feature_schema.to_array(sample))
+            max_error = float(np.max(np.abs(expected - actual))) if len(expected) else 0.0
+            if max_error > tolerance:
+                raise ValueError(f"Lite export differs from full model by {max_error:.2e} (tolerance {tolerance:.0e})")
+        return path
         
-        self.gbm = joblib.load(f"{model_dir}gbm_model.pkl")
-        self.lstm = load_model(f"{model_dir}lstm_model.keras")
+    def load(self, version="v1", runtime="full", lazy=False):
+        """
+        Load a saved version
+        
+        runtime="full" restores the scikit-learn GBM and Keras LSTM;
+        runtime="lite" loads lite.npz and scores with NumPy only, without
+        importing TensorFlow; runtime="shared" does the same from a packed
+        copy mapped read-only (see ModelRegistry.share_model).
+        """
+        model_dir = f"{Config.MODEL_PATH}{self.model_name}/{version}/"
+        self.load_artifacts(self.artifact_paths(version), runtime=runtime, lazy=lazy)
+        print(f"Model loaded from {model_dir} ({runtime} runtime)")
+        return self
+        
+    def load_artifacts(self, paths, runtime="full", lazy=False):
+        """
+        Load from explicit artifact paths (e.g. the registry's content store)
+        
+        With lazy=True the full runtime reads the GBM and the LSTM only
+        when each half is first used.
+        """
+        schema_path = paths.get("feature_schema")
+        self.feature_schema = FeatureSchema.load(schema_path) if schema_path else None
         self.feature_importances = pd.read_csv(
-            f"{model_dir}feature_importances.csv", 
-            index_col=0,
-            squeeze=True
-        )
+            paths["feature_importances"], 
+            index_col=0
+        ).squeeze("columns")
+        self._important_cache = {}
         
-        print(f"Model loaded from {model_dir}")
+        if runtime == "lite":
+            if self.feature_schema is None or "lite" not in paths:
+                raise ValueError(f"No lite export for {self.model_name}; lite runtime unavailable")
+            self.lite = LiteHybridModel.load(paths["lite"])
+            self.gbm_weight = self.lite.gbm_weight
+        elif runtime == "shared":
+            if self.feature_schema is None or not paths.get("shared"):
+                raise ValueError(f"No shared pack for {self.model_name}; shared runtime unavailable")
+            self.lite = LiteHybridModel.attach(paths["shared"])
+            self.gbm_weight = self.lite.gbm_weight
+        elif runtime == "full":
+            self.gbm = None
+            self.lstm = None
+            self._artifacts = {"gbm": paths["gbm"], "lstm": paths["lstm"]}
+            if not lazy:
+                self._load_half("gbm")
+                self._load_half("lstm")
+            self.lite = None
+            self._prepare_scoring()
+        else:
+            raise ValueError(f"Unknown runtime: {runtime}")
         return self
     
     def feature_importance_plot(self):
         if self.feature_importances is None:
             return None
         
+        import plotly.graph_objects as go
         top_features = self.feature_importances.head(15)
         
         fig = go.Figure()
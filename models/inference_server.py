@@ -0,0 +1,248 @@
+import json
+import time
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+import pandas as pd
+from config import Config
+
+class InferenceServer:
+    """
+    Long-lived scoring service that keeps a loaded model resident
+    
+    Concurrent requests are queued and grouped into micro-batches: the
+    worker waits at most `max_wait_ms` after the first queued request,
+    or until `max_batch` rows are pending, then scores everything with
+    a single predict_proba call. Keras pays a large fixed cost per
+    predict call, so one batch of many fixtures is much cheaper than
+    many calls of one fixture.
+    
+    Each request is checked against the model's feature schema when it
+    is submitted, so a malformed request fails on its own instead of
+    inside a shared batch; if a batch still fails, its requests are
+    re-scored one by one.
+    """
+    
+    def __init__(self, model, max_batch=None, max_wait_ms=None, stats_window=10000):
+        self.model = model
+        self.max_batch = max_batch or Config.INFERENCE_MAX_BATCH
+        self.max_wait = (max_wait_ms if max_wait_ms is not None else Config.INFERENCE_MAX_WAIT_MS) / 1000.0
+        self.requests = queue.Queue()
+        self.latencies = deque(maxlen=stats_window)
+        self.batch_sizes = deque(maxlen=stats_window)
+        self.rows_scored = 0
+        self.started_at = None
+        self.worker = None
+        self.running = False
+        self.lock = threading.Lock()
+        
+    def start(self):
+        if self.running:
+            return self
+        self.running = True
+        self.started_at = time.perf_counter()
+        self.worker = threading.Thread(target=self._run, name="inference-batcher", daemon=True)
+        self.worker.start()
+        return self
+        
+    def stop(self, timeout=5):
+        with self.lock:
+            self.running = False
+        self.requests.put(None)
+        if self.worker:
+            self.worker.join(timeout)
+        # Requests still queued will never be scored
+        while True:
+            try:
+                item = self.requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[1].cancel()
+            
+    def submit(self, X):
+        """
+        Queue rows for scoring and return a Future of their probabilities
+        
+        The Future fails with RuntimeError when the server is not running,
+        instead of waiting on a queue nothing reads.
+        """
+        if isinstance(X, dict):
+            X = pd.DataFrame([X])
+        elif isinstance(X, list):
+            X = pd.DataFrame(X)
+        future = Future()
+        schema = getattr(self.model, "feature_schema", None)
+        if schema is not None:
+            try:
+                X = schema.to_array(X)
+            except Exception as e:
+                future.set_exception(e)
+                return future
+        # Checked under the lock so that stop() cannot drain the queue in between
+        with self.lock:
+            if not self.running:
+                future.set_exception(RuntimeError("Inference server is not running"))
+                return future
+            self.requests.put((X, future, time.perf_counter()))
+        return future
+        
+    def predict_proba(self, X, timeout=None):
+        """Blocking in-process API: score X as part of the next micro-batch"""
+        return self.submit(X).result(timeout)
+        
+    def _collect_batch(self):
+        first = self.requests.get()
+        if first is None:
+            return []
+        batch = [first]
+        rows = len(first[0])
+        deadline = time.perf_counter() + self.max_wait
+        while rows < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self.requests.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                self.running = False
+                break
+            batch.append(item)
+            rows += len(item[0])
+        return batch
+        
+    def _run(self):
+        while self.running:
+            batch = self._collect_batch()
+            if not batch:
+                continue
+            self._score(batch)
+            
+    def _score(self, batch):
+        frames = [X for X, _, _ in batch]
+        try:
+            if isinstance(frames[0], pd.DataFrame):
+                combined = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+            else:
+                combined = np.vstack(frames)
+            proba = np.asarray(self.model.predict_proba(combined))
+        except Exception:
+            self._score_individually(batch)
+            return
+            
+        finished = time.perf_counter()
+        offset = 0
+        for X, future, queued_at in batch:
+            future.set_result(proba[offset:offset + len(X)])
+            offset += len(X)
+            
+        with self.lock:
+            self.latencies.extend(finished - queued_at for _, _, queued_at in batch)
+            self.batch_sizes.append(offset)
+            self.rows_scored += offset
+            
+    def _score_individually(self, batch):
+        """Fallback after a failed batch: one bad request only fails itself"""
+        for X, future, queued_at in batch:
+            try:
+                future.set_result(np.asarray(self.model.predict_proba(X)))
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            with self.lock:
+                self.latencies.append(time.perf_counter() - queued_at)
+                self.batch_sizes.append(len(X))
+                self.rows_scored += len(X)
+                
+    def stats(self):
+        """Latency percentiles (ms), throughput (rows/s) and batching summary"""
+        with self.lock:
+            latencies = np.array(self.latencies) * 1000.0
+            batch_sizes = np.array(self.batch_sizes)
+            rows_scored = self.rows_scored
+        elapsed = time.perf_counter() - self.started_at if self.started_at else 0.0
+        return {
+            "requests": len(latencies),
+            "batches": len(batch_sizes),
+            "mean_batch_size": float(batch_sizes.mean()) if len(batch_sizes) else 0.0,
+            "p50_ms": float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+            "p99_ms": float(np.percentile(latencies, 99)) if len(latencies) else 0.0,
+            "throughput_rows_per_s": rows_scored / elapsed if elapsed > 0 else 0.0
+        }
+
+def _make_handler(server):
+    class InferenceRequestHandler(BaseHTTPRequestHandler):
+        def _send_json(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            
+        def do_GET(self):
+            if self.path == "/stats":
+                self._send_json(200, server.stats())
+            else:
+                self._send_json(404, {"error": "not found"})
+                
+        def do_POST(self):
+            if self.path != "/predict":
+                self._send_json(404, {"error": "not found"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                rows = json.loads(self.rfile.read(length))["rows"]
+                proba = server.predict_proba(rows, timeout=Config.INFERENCE_REQUEST_TIMEOUT)
+                self._send_json(200, {"probabilities": proba.tolist()})
+            except Exception as e:
+                self._send_json(400, {"error": str(e)})
+                
+        def log_message(self, format, *args):
+            pass
+            
+    return InferenceRequestHandler
+
+def serve_http(server, host=None, port=None):
+    """
+    Expose an InferenceServer over HTTP
+    
+    POST /predict with {"rows": [{feature: value, ...}, ...]} returns
+    {"probabilities": [...]}; GET /stats returns latency and throughput.
+    
+    Returns:
+        ThreadingHTTPServer: Running HTTP server (call shutdown() to stop)
+    """
+    server.start()
+    httpd = ThreadingHTTPServer(
+        (host or Config.INFERENCE_HOST, port or Config.INFERENCE_PORT),
+        _make_handler(server)
+    )
+    threading.Thread(target=httpd.serve_forever, name="inference-http", daemon=True).start()
+    return httpd
+
+def run_inference_server(model_name="dc_btts_predictor", version="latest"):
+    """Load a registered model and serve it until interrupted"""
+    from .model_registry import ModelRegistry
+    model = ModelRegistry().load_model(model_name, version)
+    if model is None:
+        raise RuntimeError(f"Could not load model {model_name} ({version})")
+        
+    server = InferenceServer(model)
+    httpd = serve_http(server)
+    print(f"Inference server listening on {Config.INFERENCE_HOST}:{Config.INFERENCE_PORT}")
+    try:
+        while True:
+            time.sleep(60)
+            print(f"Inference stats: {server.stats()}")
+    except KeyboardInterrupt:
+        httpd.shutdown()
+        server.stop()
+
+if __name__ == "__main__":
+    run_inference_server()
@@ -0,0 +1,247 @@
+"""
+Pure-NumPy inference runtime for HybridModel
+
+The GBM trees are flattened into concatenated node arrays and the LSTM
+stack is evaluated from its saved weights, so a worker can score with
+only NumPy loaded - no TensorFlow, no scikit-learn.
+
+The same arrays can also be packed into one flat file that worker
+processes memory-map read-only (pack_arrays / map_arrays), so every
+worker scores from the same physical pages instead of its own copy.
+"""
+import os
+import json
+import tempfile
+import numpy as np
+
+# Byte alignment of each array inside a packed file
+_ALIGN = 64
+
+def _sigmoid(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+def flatten_gbm(gbm):
+    """
+    Flatten a fitted binary GradientBoostingClassifier into node arrays
+    
+    Returns:
+        dict: Concatenated node arrays plus tree root offsets, learning
+            rate and the initial raw (log-odds) prediction
+    """
+    if gbm.init not in (None, "zero") or gbm.n_classes_ != 2:
+        raise ValueError("Lite export supports binary GBMs with the default prior init only")
+        
+    lefts, rights, features, thresholds, values, roots = [], [], [], [], [], []
+    offset = 0
+    for estimator in gbm.estimators_[:, 0]:
+        tree = estimator.tree_
+        left = tree.children_left.astype(np.int64)
+        right = tree.children_right.astype(np.int64)
+        # Re-base child pointers onto the concatenated arrays; leaves point at themselves
+        leaf = left == -1
+        node_ids = np.arange(tree.node_count, dtype=np.int64) + offset
+        lefts.append(np.where(leaf, node_ids, left + offset))
+        rights.append(np.where(leaf, node_ids, right + offset))
+        features.append(np.where(leaf, 0, tree.feature).astype(np.int64))
+        thresholds.append(tree.threshold.astype(np.float64))
+        values.append(tree.value[:, 0, 0].astype(np.float64))
+        roots.append(offset)
+        offset += tree.node_count
+        
+    if gbm.init == "zero":
+        init_raw = 0.0
+    else:
+        prior = float(np.clip(gbm.init_.class_prior_[1], 1e-12, 1 - 1e-12))
+        init_raw = np.log(prior / (1.0 - prior))
+        
+    return {
+        "gbm_left": np.concatenate(lefts),
+        "gbm_right": np.concatenate(rights),
+        "gbm_feature": np.concatenate(features),
+        "gbm_threshold": np.concatenate(thresholds),
+        "gbm_value": np.concatenate(values),
+        "gbm_roots": np.array(roots, dtype=np.int64),
+        "gbm_max_depth": np.array(max(e.tree_.max_depth for e in gbm.estimators_[:, 0])),
+        "gbm_learning_rate": np.array(gbm.learning_rate, dtype=np.float64),
+        "gbm_init_raw": np.array(init_raw, dtype=np.float64)
+    }
+
+def flatten_lstm(lstm):
+    """Collect weights of the Sequential LSTM/Dense stack, skipping Dropout"""
+    arrays = {}
+    layers = []
+    for layer in lstm.layers:
+        kind = type(layer).__name__
+        if kind == "Dropout":
+            continue
+        if kind not in ("LSTM", "Dense"):
+            raise ValueError(f"Lite export does not support layer type {kind}")
+        config = layer.get_config()
+        if kind == "LSTM" and (config.get("activation") != "tanh" or config.get("recurrent_activation") != "sigmoid"):
+            raise ValueError("Lite export supports standard tanh/sigmoid LSTM cells only")
+        index = len(layers)
+        names = ("kernel", "recurrent", "bias") if kind == "LSTM" else ("kernel", "bias")
+        for name, weights in zip(names, layer.get_weights()):
+            arrays[f"lstm_{index}_{name}"] = weights.astype(np.float32)
+        layers.append(f"{kind}:{config.get('activation', '')}:{int(config.get('return_sequences', False))}")
+    arrays["lstm_layers"] = np.array(layers)
+    return arrays
+
+def pack_arrays(arrays, path):
+    """
+    Write arrays back to back into one flat file for memory mapping
+    
+    Each array starts on a 64-byte boundary; names, dtypes, shapes and
+    offsets go to a JSON index next to it (path + ".json"). Both files
+    are written to unique temporaries and renamed into place, index
+    first, so once the data file exists its index does too and a
+    concurrent reader that checks for the data file sees either nothing
+    or a complete pack.
+    
+    Args:
+        arrays (dict): Name -> np.ndarray (as in a lite.npz export)
+        path (str): Destination file
+    """
+    layout = {}
+    offset = 0
+    contiguous = {}
+    for name, values in arrays.items():
+        values = np.ascontiguousarray(values)
+        offset = -(-offset // _ALIGN) * _ALIGN
+        layout[name] = {"offset": offset, "dtype": values.dtype.str, "shape": list(values.shape)}
+        contiguous[name] = values
+        offset += values.nbytes
+        
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fd, temp = tempfile.mkstemp(dir=directory or None, suffix=".tmp")
+    with os.fdopen(fd, "wb") as handle:
+        handle.truncate(max(offset, 1))
+        for name, values in contiguous.items():
+            handle.seek(layout[name]["offset"])
+            handle.write(values.tobytes())
+    fd, temp_index = tempfile.mkstemp(dir=directory or None, suffix=".json.tmp")
+    with os.fdopen(fd, "w") as handle:
+        json.dump(layout, handle)
+    # Concurrent packers write identical content, so either winner is fine
+    os.replace(temp_index, f"{path}.json")
+    os.replace(temp, path)
+
+def map_arrays(path):
+    """
+    Read-only views of a pack_arrays file, backed by one shared mapping
+    
+    Returns:
+        dict: Name -> np.ndarray view (no data is copied)
+    """
+    with open(f"{path}.json") as handle:
+        layout = json.load(handle)
+    buffer = np.memmap(path, dtype=np.uint8, mode="r")
+    arrays = {}
+    for name, spec in layout.items():
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"], dtype=np.int64))
+        start = spec["offset"]
+        arrays[name] = buffer[start:start + count * dtype.itemsize].view(dtype).reshape(spec["shape"])
+    return arrays
+
+class LiteHybridModel:
+    """NumPy-only HybridModel predictor loaded from a lite.npz export"""
+    
+    def __init__(self, arrays):
+        self.arrays = arrays
+        self.gbm_weight = float(arrays["gbm_weight"])
+        self.lstm_positions = arrays["lstm_positions"]
+        self.layers = [str(spec).split(":") for spec in arrays["lstm_layers"]]
+        
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            return cls({key: data[key] for key in data.files})
+            
+    @classmethod
+    def attach(cls, path):
+        """Score from a packed file mapped read-only (see pack_arrays)"""
+        return cls(map_arrays(path))
+        
+    def gbm_predict_proba(self, X):
+        a = self.arrays
+        # sklearn trees compare float32 features against float64 thresholds
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(a["gbm_roots"], (X.shape[0], len(a["gbm_roots"]))).copy()
+        for _ in range(int(a["gbm_max_depth"])):
+            go_left = X[rows, a["gbm_feature"][nodes]] <= a["gbm_threshold"][nodes]
+            nodes = np.where(go_left, a["gbm_left"][nodes], a["gbm_right"][nodes])
+        raw = a["gbm_init_raw"] + a["gbm_learning_rate"] * a["gbm_value"][nodes].sum(axis=1)
+        return _sigmoid(raw)
+        
+    def lstm_predict_proba(self, X_seq):
+        a = self.arrays
+        out = np.asarray(X_seq, dtype=np.float32)
+        for index, (kind, activation, return_sequences) in enumerate(self.layers):
+            if kind == "LSTM":
+                out = self._lstm_forward(
+                    out,
+                    a[f"lstm_{index}_kernel"],
+                    a[f"lstm_{index}_recurrent"],
+                    a[f"lstm_{index}_bias"],
+                    return_sequences == "1"
+                )
+            else:
+                out = out @ a[f"lstm_{index}_kernel"] + a[f"lstm_{index}_bias"]
+                if activation == "relu":
+                    out = np.maximum(out, 0.0)
+                elif activation == "sigmoid":
+                    out = _sigmoid(out)
+        return out.reshape(-1)
+        
+    @staticmethod
+    def _lstm_forward(x, kernel, recurrent, bias, return_sequences):
+        # Keras gate order: input, forget, cell, output
+        batch, steps, _ = x.shape
+        units = recurrent.shape[0]
+        h = np.zeros((batch, units), dtype=np.float32)
+        c = np.zeros((batch, units), dtype=np.float32)
+        projected = x @ kernel + bias
+        outputs = np.empty((batch, steps, units), dtype=np.float32) if return_sequences else None
+        for t in range(steps):
+            z = projected[:, t, :] + h @ recurrent
+            i = _sigmoid(z[:, :units])
+            f = _sigmoid(z[:, units:2 * units])
+            g = np.tanh(z[:, 2 * units:3 * units])
+            o = _sigmoid(z[:, 3 * units:])
+            c = f * c + i * g
+            h = o * np.tanh(c)
+            if return_sequences:
+                outputs[:, t, :] = h
+        return outputs if return_sequences else h
+        
+    def predict_proba(self, X):
+        """Blend of GBM and LSTM probabilities for a 2-D schema-ordered array"""
+        X = np.asarray(X, dtype=np.float32)
+        X_seq = X[:, self.lstm_positions][:, :, None]
+        gbm_proba = self.gbm_predict_proba(X)
+        lstm_proba = self.lstm_predict_proba(X_seq)
+        return self.gbm_weight * gbm_proba + (1.0 - self.gbm_weight) * lstm_proba
+
+def export_lite(model, path):
+    """
+    Write a fitted HybridModel's GBM and LSTM as a single NumPy archive
+    
+    Args:
+        model (HybridModel): Fitted model with a feature schema
+        path (str): Destination .npz path
+    """
+    if model.feature_schema is None:
+        raise ValueError("Lite export needs a model trained with a feature schema")
+    important = model.get_important_features(threshold=0.01)
+    index = model.feature_schema.index
+    
+    arrays = {}
+    arrays.update(flatten_gbm(model.gbm))
+    arrays.update(flatten_lstm(model.lstm))
+    arrays["lstm_positions"] = np.array([index[name] for name in important], dtype=np.int64)
+    arrays["gbm_weight"] = np.array(model.gbm_weight, dtype=np.float64)
+    np.savez_compressed(path, **arrays)
@@ -1,13 +1,166 @@
 import os
+import json
+import shutil
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
 from config import Config
-import joblib
 import pandas as pd
 
+# Metrics where a lower value is better; everything else is maximised
+LOWER_IS_BETTER = {"log_loss", "val_log_loss", "loss", "val_loss", "brier", "mae"}
+
+def file_digest(path, chunk_size=1 << 20):
+    """sha256 hex digest of a file"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+class ModelCache:
+    """
+    LRU of loaded models bounded by an estimate of their memory use
+    
+    A model's size is taken as the total size of its artifact files,
+    which tracks the in-memory footprint of the GBM trees and LSTM
+    weights closely enough for eviction decisions.
+    
+    Args:
+        max_mb (int): Budget in megabytes (Config.MODEL_CACHE_MAX_MB)
+    """
+    
+    def __init__(self, max_mb=None):
+        self.max_bytes = (max_mb or Config.MODEL_CACHE_MAX_MB) * 1024 * 1024
+        self.entries = OrderedDict()
+        self.used = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+            
+    def put(self, key, model, size):
+        with self.lock:
+            if key in self.entries:
+                self.used -= self.entries.pop(key)[1]
+            self.entries[key] = (model, size)
+            self.used += size
+            # Always keep the newest entry, even if it alone exceeds the budget
+            while self.used > self.max_bytes and len(self.entries) > 1:
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.used -= evicted_size
+                self.evictions += 1
+                
+    def discard(self, model_name, version):
+        """Drop every cached runtime of a version"""
+        with self.lock:
+            for key in [key for key in self.entries if key[:2] == (model_name, version)]:
+                self.used -= self.entries.pop(key)[1]
+                
+    def stats(self):
+        return {
+            "entries": len(self.entries),
+            "used_mb": self.used / (1024 * 1024),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+_model_cache = None
+
+def get_model_cache():
+    """Process-wide cache of loaded models"""
+    global _model_cache
+    if _model_cache is None:
+        _model_cache = ModelCache()
+    return _model_cache
+
 class ModelRegistry:
-    def __init__(self):
+    """
+    Model versions indexed by a persistent manifest
+    
+    Saved artifacts are moved into a content-addressed store
+    (Config.MODEL_ARTIFACT_PATH, named by sha256) so identical files are
+    kept once, and each version's artifact paths and metrics are recorded
+    in a SQLite manifest. The manifest is read once into in-memory
+    indexes, so resolving "latest", a given version or the best version
+    by a metric never touches the filesystem. Loaded models are shared
+    through a process-wide LRU cache.
+    """
+    
+    def __init__(self, manifest_path=None, cache=None):
         self.models = {}
         self.model_versions = {}
         self.performance_history = {}
+        self.cache = cache or get_model_cache()
+        
+        self.manifest_path = manifest_path or Config.MODEL_MANIFEST
+        directory = os.path.dirname(self.manifest_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.manifest_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS versions ("
+            "model_name TEXT NOT NULL, "
+            "version TEXT NOT NULL, "
+            "created_at TEXT NOT NULL, "
+            "artifacts TEXT NOT NULL, "
+            "metrics TEXT NOT NULL, "
+            "PRIMARY KEY (model_name, version))"
+        )
+        self.conn.commit()
+        
+        # index[model][version] = {"artifacts", "metrics", "created_at"}
+        self.index = {}
+        self.latest = {}
+        self.best = {}
+        rows = self.conn.execute(
+            "SELECT model_name, version, created_at, artifacts, metrics FROM versions ORDER BY rowid"
+        ).fetchall()
+        for model_name, version, created_at, artifacts, metrics in rows:
+            self._index(model_name, version, created_at, json.loads(artifacts), json.loads(metrics))
+            
+    def _index(self, model_name, version, created_at, artifacts, metrics):
+        self.index.setdefault(model_name, {})[version] = {
+            "artifacts": artifacts,
+            "metrics": metrics,
+            "created_at": created_at
+        }
+        self.latest[model_name] = version
+        self._update_best(model_name, version, metrics)
+        
+    def _update_best(self, model_name, version, metrics):
+        best = self.best.setdefault(model_name, {})
+        for metric, value in metrics.items():
+            current = best.get(metric)
+            if current is None or self._better(metric, value, current[0]):
+                best[metric] = (value, version)
+            elif current[1] == version and value != current[0]:
+                # The leader got worse; rescan this metric across versions
+                candidates = [
+                    (entry["metrics"][metric], name)
+                    for name, entry in self.index[model_name].items()
+                    if metric in entry["metrics"]
+                ]
+                pick = min if metric in LOWER_IS_BETTER else max
+                best[metric] = pick(candidates, key=lambda candidate: candidate[0])
+                
+    @staticmethod
+    def _better(metric, value, current):
+        return value < current if metric in LOWER_IS_BETTER else value > current
         
     def register_model(self, model_name, model, version="v1"):
         self.models[model_name] = model
@@ -19,50 +172,171 @@ class ModelRegistry:
         if model is None:
             print(f"Model {model_name} not found in registry")
         return model
-    
-    def load_model(self, model_name, version="latest"):
-        if version == "latest":
-            model_dir = f"{Config.MODEL_PATH}{model_name}/"
-            if not os.path.exists(model_dir):
-                print(f"Model directory not found: {model_dir}")
-                return None
+        
+    def versions(self, model_name):
+        """Recorded versions of a model, oldest first"""
+        return list(self.index.get(model_name, {}))
+        
+    def resolve_version(self, model_name, version="latest"):
+        """Concrete version name for "latest" or an explicit version"""
+        if version != "latest":
+            return version
+        if model_name in self.latest:
+            return self.latest[model_name]
             
-            versions = [d for d in os.listdir(model_dir) if os.path.isdir(os.path.join(model_dir, d))]
-            if not versions:
-                print(f"No versions found for model {model_name}")
-                return None
-                
-            version = sorted(versions)[-1]
+        # Versions saved before the manifest existed: newest directory wins
+        model_dir = f"{Config.MODEL_PATH}{model_name}/"
+        if not os.path.exists(model_dir):
+            return None
+        versions = [d for d in os.listdir(model_dir) if os.path.isdir(os.path.join(model_dir, d))]
+        if not versions:
+            return None
+        return max(versions, key=lambda d: os.path.getmtime(os.path.join(model_dir, d)))
         
-        model_path = f"{Config.MODEL_PATH}{model_name}/{version}/"
+    def artifact_paths(self, model_name, version):
+        """Role -> artifact path for a version (manifest first, then its directory)"""
+        entry = self.index.get(model_name, {}).get(version)
+        if entry is not None:
+            return dict(entry["artifacts"])
+        from .hybrid_model import HybridModel
+        return HybridModel(model_name).artifact_paths(version)
+        
+    def share_model(self, model_name, version="latest"):
+        """
+        Pack a version's lite export for memory-mapped serving
         
-        if not os.path.exists(model_path):
-            print(f"Model path not found: {model_path}")
+        The pack is named by the lite artifact's content hash under
+        Config.MODEL_SHARED_PATH. The first caller writes it; later
+        callers (and other processes) find it and return immediately.
+        
+        Returns:
+            str: Path of the packed file, or None without a lite export
+        """
+        resolved = self.resolve_version(model_name, version)
+        paths = self.artifact_paths(model_name, resolved) if resolved else {}
+        if "lite" not in paths:
+            print(f"No lite export for {model_name} {resolved}; cannot share")
             return None
             
-        from .hybrid_model import HybridModel
-        model = HybridModel(model_name)
-        model.load(version)
+        name = os.path.splitext(os.path.basename(paths["lite"]))[0]
+        if name == "lite":
+            name = file_digest(paths["lite"])
+        path = os.path.join(Config.MODEL_SHARED_PATH, f"{name}.bin")
+        if not os.path.exists(path):
+            from .lite_runtime import LiteHybridModel, pack_arrays
+            pack_arrays(LiteHybridModel.load(paths["lite"]).arrays, path)
+            print(f"Shared {model_name} {resolved} at {path}")
+        return path
         
-        self.register_model(model_name, model, version)
+    def load_model(self, model_name, version="latest", runtime=None, lazy=None):
+        resolved = self.resolve_version(model_name, version)
+        if resolved is None:
+            print(f"No versions found for model {model_name}")
+            return None
+        runtime = runtime or Config.MODEL_RUNTIME
+        lazy = Config.MODEL_LAZY_LOAD if lazy is None else lazy
+        
+        key = (model_name, resolved, runtime)
+        model = self.cache.get(key)
+        if model is None:
+            paths = self.artifact_paths(model_name, resolved)
+            if "feature_importances" not in paths:
+                print(f"Model {model_name} version {resolved} not found")
+                return None
+            if runtime == "shared":
+                paths["shared"] = self.share_model(model_name, resolved)
+                
+            from .hybrid_model import HybridModel
+            model = HybridModel(model_name).load_artifacts(paths, runtime=runtime, lazy=lazy)
+            # Mapped packs live in the page cache, not in this process
+            roles = {"lite": ["lite"], "shared": []}.get(runtime, ["gbm", "lstm"])
+            size = sum(os.path.getsize(paths[role]) for role in roles if role in paths)
+            self.cache.put(key, model, size)
+            print(f"Model {model_name} {resolved} loaded ({runtime} runtime)")
+            
+        self.register_model(model_name, model, resolved)
         return model
-    
-    def save_model(self, model_name, model, version="v1"):
+        
+    def _store_artifact(self, path):
+        """Move a file into the content-addressed store; returns its new path"""
+        digest = file_digest(path)
+        extension = os.path.splitext(path)[1]
+        target_dir = os.path.join(Config.MODEL_ARTIFACT_PATH, digest[:2])
+        target = os.path.join(target_dir, f"{digest}{extension}")
+        if os.path.exists(target):
+            os.remove(path)
+        else:
+            os.makedirs(target_dir, exist_ok=True)
+            shutil.move(path, target)
+        return target
+        
+    def save_model(self, model_name, model, version="v1", metrics=None):
+        """
+        Save a model version into the artifact store and manifest
+        
+        Args:
+            model_name (str): Registry name
+            model (HybridModel): Trained model
+            version (str): Version label (re-saving a label replaces it)
+            metrics (dict): Extra metrics to record alongside the numeric
+                values of model.training_report
+        """
         model.save(version)
-        self.register_model(model_name, model, version)
-    
-    def track_performance(self, model_name, metrics):
-        if model_name not in self.performance_history:
-            self.performance_history[model_name] = []
+        # save() stages under the model's own name, which may differ from the registry name
+        model_dir = f"{Config.MODEL_PATH}{model.model_name}/{version}/"
+        artifacts = {
+            role: self._store_artifact(path)
+            for role, path in model.artifact_paths(version).items()
+        }
+        shutil.rmtree(model_dir, ignore_errors=True)
+        
+        recorded = {
+            name: float(value)
+            for name, value in {**(getattr(model, "training_report", None) or {}), **(metrics or {})}.items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        }
+        created_at = pd.Timestamp.now().isoformat()
+        with self.lock:
+            self.conn.execute("DELETE FROM versions WHERE model_name = ? AND version = ?", (model_name, version))
+            self.conn.execute(
+                "INSERT INTO versions (model_name, version, created_at, artifacts, metrics) VALUES (?, ?, ?, ?, ?)",
+                (model_name, version, created_at, json.dumps(artifacts), json.dumps(recorded))
+            )
+            self.conn.commit()
+            self.index.get(model_name, {}).pop(version, None)
+            self._index(model_name, version, created_at, artifacts, recorded)
             
-        self.performance_history[model_name].append({
+        self.cache.discard(model_name, version)
+        self.register_model(model_name, model, version)
+        
+    def track_performance(self, model_name, metrics, version=None):
+        """Record live metrics for a version (default: the registered one)"""
+        version = version or self.model_versions.get(model_name)
+        self.performance_history.setdefault(model_name, []).append({
             "timestamp": pd.Timestamp.now(),
+            "version": version,
             **metrics
         })
         
+        entry = self.index.get(model_name, {}).get(version)
+        if entry is None:
+            return
+        numeric = {
+            name: float(value) for name, value in metrics.items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        }
+        with self.lock:
+            entry["metrics"].update(numeric)
+            self.conn.execute(
+                "UPDATE versions SET metrics = ? WHERE model_name = ? AND version = ?",
+                (json.dumps(entry["metrics"]), model_name, version)
+            )
+            self.conn.commit()
+            self._update_best(model_name, version, numeric)
+            
     def get_performance_history(self, model_name):
         return self.performance_history.get(model_name, [])
-    
+        
     def compare_models(self, model_name):
         history = self.get_performance_history(model_name)
         if not history:
@@ -70,14 +344,10 @@ class ModelRegistry:
             
         df = pd.DataFrame(history)
         df.set_index("timestamp", inplace=True)
-        df["version"] = df.index.map(lambda x: self.model_versions.get(model_name, "unknown"))
         return df
-    
-    def get_best_model(self, model_name, metric="accuracy"):
-        history = self.get_performance_history(model_name)
-        if not history:
+        
+    def get_best_model(self, model_name, metric="val_accuracy"):
+        best = self.best.get(model_name, {}).get(metric)
+        if best is None:
             return None
-            
-        best_performance = max(history, key=lambda x: x.get(metric, 0))
-        best_version = self.model_versions.get(model_name, "unknown")
-        return self.load_model(model_name, best_version)
+        return self.load_model(model_name, best[1])
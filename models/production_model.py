@@ -0,0 +1,177 @@
+import time
+import threading
+from collections import deque
+from datetime import datetime
+import numpy as np
+from config import Config
+from .feature_schema import DEFAULT_FEATURE_SCHEMA
+
+class ModelVersion:
+    """
+    One promoted model plus its live scoring latencies
+    
+    Attribute access falls through to the wrapped model, so a version can
+    be passed anywhere a model is expected; predict_proba is timed.
+    """
+    
+    def __init__(self, model, version):
+        self.model = model
+        self.version = version
+        self.latencies = deque(maxlen=Config.MODEL_LATENCY_WINDOW)
+        
+    def __getattr__(self, name):
+        if name == "model":
+            raise AttributeError(name)
+        return getattr(self.model, name)
+        
+    def predict_proba(self, X):
+        started = time.perf_counter()
+        proba = self.model.predict_proba(X)
+        self.latencies.append(time.perf_counter() - started)
+        return proba
+        
+    def latency_stats(self):
+        """Scoring latency percentiles in ms"""
+        latencies = np.array(self.latencies) * 1000.0
+        return {
+            "version": self.version,
+            "calls": len(latencies),
+            "p50_ms": float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+            "p99_ms": float(np.percentile(latencies, 99)) if len(latencies) else 0.0
+        }
+
+class ProductionModel:
+    """
+    Versioned slot holding the model that serves predictions
+    
+    Readers take the current ModelVersion with acquire() and keep using
+    that reference for the whole batch, so a promotion never changes the
+    model under an in-flight batch. promote() warms a new model on a
+    canary batch (forcing lazy loads and Keras graph tracing) and then
+    swaps it in with a single reference assignment. While a production
+    model exists, warmup runs on a background thread and scoring carries
+    on with the old version; the very first promotion is synchronous
+    since there is nothing to fall back on. Candidate models can be
+    attached for shadow scoring (see ShadowScorer); they never serve.
+    
+    Args:
+        name (str): Model name (for logging)
+    """
+    
+    def __init__(self, name):
+        self.name = name
+        self.current = None
+        self.previous = None
+        self.promotions = []
+        self.candidates = {}
+        self.lock = threading.Lock()
+        self._next_version = 0
+        
+    def acquire(self):
+        """The serving ModelVersion (None before the first promotion)"""
+        return self.current
+        
+    def add_candidate(self, label, model):
+        """Shadow-score a model next to production under a label"""
+        with self.lock:
+            # Replace rather than mutate, so readers can iterate a snapshot
+            self.candidates = {**self.candidates, label: ModelVersion(model, label)}
+            
+    def remove_candidate(self, label):
+        with self.lock:
+            self.candidates = {name: c for name, c in self.candidates.items() if name != label}
+            
+    def promote(self, model, canary=None, background=None):
+        """
+        Warm a model on a canary batch and make it the serving version
+        
+        Args:
+            model: Trained model with predict_proba
+            canary (pd.DataFrame): Rows to warm and time both versions on
+            background (bool): Warm on a background thread (defaults to
+                True whenever a production model already exists)
+                
+        Returns:
+            threading.Thread or None: The warmup thread when backgrounded
+        """
+        with self.lock:
+            self._next_version += 1
+            candidate = ModelVersion(model, self._next_version)
+        if background is None:
+            background = self.current is not None
+        if not background:
+            self._warm_and_swap(candidate, canary)
+            return None
+        thread = threading.Thread(
+            target=self._warm_and_swap,
+            args=(candidate, canary),
+            name=f"promote-{self.name}-v{candidate.version}",
+            daemon=True
+        )
+        thread.start()
+        return thread
+        
+    def _canary_ms(self, model, canary):
+        schema = getattr(model, "feature_schema", None) or DEFAULT_FEATURE_SCHEMA
+        features = schema.select(canary)
+        started = time.perf_counter()
+        model.predict_proba(features)
+        return (time.perf_counter() - started) * 1000.0
+        
+    def _warm_and_swap(self, candidate, canary):
+        started = time.perf_counter()
+        record = {"version": candidate.version, "started_at": datetime.now()}
+        try:
+            if canary is not None and len(canary):
+                # The first call pays for lazy loading and tracing; the second is steady state
+                self._canary_ms(candidate.model, canary)
+                record["canary_ms_new"] = self._canary_ms(candidate.model, canary)
+                incumbent = self.current
+                if incumbent is not None:
+                    record["canary_ms_old"] = self._canary_ms(incumbent.model, canary)
+        except Exception as e:
+            record["status"] = "failed"
+            record["error"] = str(e)
+            print(f"Promotion of {self.name} v{candidate.version} failed during warmup: {str(e)}")
+            self.promotions.append(record)
+            return
+        record["warmup_s"] = time.perf_counter() - started
+        
+        with self.lock:
+            incumbent = self.current
+            # A slower, older warmup must not replace a newer promotion
+            if incumbent is not None and incumbent.version > candidate.version:
+                record["status"] = "superseded"
+            else:
+                self.previous = incumbent
+                self.current = candidate
+                record["status"] = "promoted"
+                record["previous"] = incumbent.version if incumbent else None
+                if incumbent is not None:
+                    record["live_before"] = incumbent.latency_stats()
+            record["promoted_at"] = datetime.now()
+            self.promotions.append(record)
+            
+        if record["status"] == "promoted":
+            before = record.get("canary_ms_old")
+            after = record.get("canary_ms_new")
+            timing = f", canary {before:.1f}ms -> {after:.1f}ms" if before is not None and after is not None else ""
+            print(f"Promoted {self.name} v{candidate.version} after {record['warmup_s']:.2f}s warmup{timing}")
+            
+    def rollback(self):
+        """Swap the previous version back in"""
+        with self.lock:
+            if self.previous is None:
+                return False
+            self.current, self.previous = self.previous, self.current
+        print(f"Rolled {self.name} back to v{self.current.version}")
+        return True
+        
+    def stats(self):
+        """Live latency of the serving and previous versions plus the last promotion"""
+        current, previous = self.current, self.previous
+        return {
+            "current": current.latency_stats() if current else None,
+            "previous": previous.latency_stats() if previous else None,
+            "last_promotion": self.promotions[-1] if self.promotions else None
+        }
@@ -0,0 +1,81 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from .feature_schema import DEFAULT_FEATURE_SCHEMA
+
+def positive_proba(proba):
+    """Probability of the positive class from a 1-D or (n, 2) predict_proba"""
+    proba = np.asarray(proba, dtype=float)
+    return proba[:, 1] if proba.ndim == 2 else proba.reshape(-1)
+
+class ShadowScorer:
+    """
+    Scores candidate models alongside production without slowing it down
+    
+    The production scores are logged as they were served. Candidates are
+    scored on a single background thread: the feature matrix is built
+    once per feature schema and shared by every candidate using it, and
+    each candidate scores the whole batch in one call. All outputs go to
+    a ShadowLog for online evaluation once results settle.
+    
+    Args:
+        log (ShadowLog): Destination log
+    """
+    
+    def __init__(self, log):
+        self.log = log
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shadow")
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.failures = 0
+        
+    def submit(self, production, candidates, data, predictions):
+        """
+        Log the served scores and queue the candidates for the same fixtures
+        
+        Args:
+            production (ModelVersion): Version that produced predictions
+            candidates (dict): Label -> ModelVersion
+            data (pd.DataFrame): Rows the production model was scored on
+            predictions (pd.DataFrame): match_id, prediction_prob and
+                bookmaker_odds, aligned with data
+                
+        Returns:
+            concurrent.futures.Future or None: Completion of the shadow pass
+        """
+        if predictions.empty:
+            return None
+        match_ids = predictions["match_id"].tolist()
+        odds = predictions["bookmaker_odds"].to_numpy(dtype=float)
+        self.log.record(
+            f"v{production.version}", match_ids, predictions["prediction_prob"], odds, production=True
+        )
+        if not candidates:
+            return None
+        with self.lock:
+            self.pending += 1
+        return self.executor.submit(self._score, dict(candidates), data, match_ids, odds)
+        
+    def _score(self, candidates, data, match_ids, odds):
+        try:
+            matrices = {}
+            for label, candidate in candidates.items():
+                schema = getattr(candidate, "feature_schema", None)
+                try:
+                    if schema is None:
+                        proba = candidate.predict_proba(DEFAULT_FEATURE_SCHEMA.select(data))
+                    else:
+                        if schema.fingerprint not in matrices:
+                            matrices[schema.fingerprint] = schema.to_array(data)
+                        proba = candidate.predict_proba(matrices[schema.fingerprint])
+                except Exception as e:
+                    print(f"Shadow scoring failed for {label}: {str(e)}")
+                    self.failures += 1
+                    continue
+                self.log.record(label, match_ids, positive_proba(proba), odds)
+        finally:
+            with self.lock:
+                self.pending -= 1
+                
+    def stop(self, wait=True):
+        self.executor.shutdown(wait=wait)
@@ -0,0 +1,96 @@
+import random
+from config import Config
+from .hybrid_model import HybridModel
+
+def sample_candidates(n_candidates, search_space=None, seed=42):
+    """
+    Draw hyperparameter candidates from the search space
+    
+    The current production parameters are always the first candidate so
+    the search can only match or beat them.
+    """
+    search_space = search_space or Config.HYBRID_SEARCH_SPACE
+    rng = random.Random(seed)
+    candidates = [dict(Config.HYBRID_PARAMS)]
+    seen = {tuple(sorted(candidates[0].items()))}
+    attempts = 0
+    while len(candidates) < n_candidates and attempts < n_candidates * 20:
+        attempts += 1
+        params = dict(Config.HYBRID_PARAMS)
+        params.update({name: rng.choice(values) for name, values in search_space.items()})
+        key = tuple(sorted(params.items()))
+        if key not in seen:
+            seen.add(key)
+            candidates.append(params)
+    return candidates
+
+def successive_halving(data, target=Config.TARGET, n_candidates=None, eta=None,
+                       min_budget=None, search_space=None, model_name="dc_btts_predictor"):
+    """
+    Successive-halving search over HybridModel hyperparameters and blend weight
+    
+    Every candidate first trains on a small slice of the estimator/epoch
+    budget. Only the best 1/eta by validation log-loss move on to the next
+    rung, which gets eta times the budget, until the survivors train at
+    the full budget. Early stopping applies inside every run.
+    
+    Args:
+        data (pd.DataFrame): Training frame including the target column
+        target (str): Target column name
+        n_candidates (int): Number of hyperparameter sets to try
+        eta (int): Reduction factor between rungs
+        min_budget (float): Budget fraction of the first rung
+        search_space (dict): Parameter name -> list of values
+        
+    Returns:
+        tuple: (best fitted HybridModel, report dict). Compute is in units
+            of one full-budget fit of Config.HYBRID_PARAMS, the schedule
+            the trainer ran before the search: compute_used is the search
+            total and compute_vs_fixed its ratio to that single fit.
+            exhaustive_cost / compute_saved_vs_exhaustive compare against
+            training every candidate at the full budget instead.
+    """
+    n_candidates = n_candidates or Config.SEARCH_CANDIDATES
+    eta = eta or Config.SEARCH_ETA
+    candidates = sample_candidates(n_candidates, search_space)
+    survivors = candidates
+    budget = min_budget or 1.0 / (eta ** 2)
+    
+    compute_used = 0.0
+    rungs = []
+    while True:
+        scored = []
+        for params in survivors:
+            model = HybridModel(model_name, params=params)
+            model.train(data, target=target, budget=budget)
+            compute_used += model.training_report["compute_fraction"]
+            scored.append((model.training_report["val_log_loss"], model, params))
+            
+        scored.sort(key=lambda item: item[0])
+        rungs.append({
+            "budget": budget,
+            "candidates": len(scored),
+            "best_log_loss": scored[0][0]
+        })
+        print(f"Successive halving rung: budget {budget:.0%}, {len(scored)} candidates, best log-loss {scored[0][0]:.4f}")
+        
+        if budget >= 1.0:
+            break
+        survivors = [params for _, _, params in scored[:max(1, len(scored) // eta)]]
+        budget = 1.0 if len(survivors) == 1 else min(1.0, budget * eta)
+        
+    best_log_loss, best_model, best_params = scored[0]
+    # Baseline: the current schedule, one full-budget fit of the default params
+    fixed_cost = 1.0
+    exhaustive_cost = float(len(candidates))
+    report = {
+        "best_params": best_params,
+        "best_log_loss": best_log_loss,
+        "rungs": rungs,
+        "compute_used": compute_used,
+        "fixed_cost": fixed_cost,
+        "compute_vs_fixed": compute_used / fixed_cost,
+        "exhaustive_cost": exhaustive_cost,
+        "compute_saved_vs_exhaustive": 1.0 - compute_used / exhaustive_cost
+    }
+    return best_model, report
@@ -1,18 +1,44 @@
+import time
 import requests
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from requests.adapters import HTTPAdapter
 from config import Config
 
+_shared_session = None
+
+def get_shared_session():
+    """
+    Return the process-wide keep-alive HTTP session used by all bookmaker clients
+    
+    Returns:
+        requests.Session: Session with a pooled HTTP adapter mounted
+    """
+    global _shared_session
+    if _shared_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=Config.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=Config.HTTP_POOL_MAXSIZE
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _shared_session = session
+    return _shared_session
+
 class HollywoodbetsClient:
-    def __init__(self, api_key):
+    def __init__(self, api_key, session=None, timeout=10):
         self.api_key = api_key
         self.base_url = "https://api.hollywoodbets.com/v1"
+        self.session = session or get_shared_session()
+        self.timeout = timeout
         
     def get_dc_btts_odds(self):
         headers = {"Authorization": f"Bearer {self.api_key}"}
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/events?market=DC_BTTS",
             headers=headers,
-            timeout=10
+            timeout=self.timeout
         )
         response.raise_for_status()
         
@@ -26,16 +52,18 @@ class HollywoodbetsClient:
         } for e in events])
 
 class BetwayClient:
-    def __init__(self, api_key):
+    def __init__(self, api_key, session=None, timeout=10):
         self.api_key = api_key
         self.base_url = "https://api.betway.com/sports"
+        self.session = session or get_shared_session()
+        self.timeout = timeout
         
     def get_dc_btts_odds(self):
         headers = {"x-api-key": self.api_key}
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/events?market=double_chance_btts",
             headers=headers,
-            timeout=10
+            timeout=self.timeout
         )
         response.raise_for_status()
         
@@ -47,3 +75,87 @@ class BetwayClient:
             "bookmaker": "Betway",
             "dc_btts_odds": e["odds"]["double_chance_btts"]
         } for e in events])
+
+# Bookmaker name -> (client class, Config attribute holding the API key)
+CLIENT_REGISTRY = {
+    "Hollywoodbets": (HollywoodbetsClient, "HOLLYWOODBETS_API_KEY"),
+    "Betway": (BetwayClient, "BETWAY_API_KEY")
+}
+
+def create_client(bookmaker, session=None, timeout=None):
+    """
+    Build a client for a bookmaker on the shared connection pool
+    
+    Args:
+        bookmaker (str): Bookmaker name from Config.BOOKMAKERS
+        session (requests.Session): Optional session override
+        timeout (float): Per-request timeout in seconds
+        
+    Returns:
+        object: Client exposing get_dc_btts_odds()
+        
+    Raises:
+        ValueError: No client is registered for the bookmaker
+    """
+    if bookmaker not in CLIENT_REGISTRY:
+        raise ValueError(f"No API client for bookmaker {bookmaker}")
+    client_class, key_attr = CLIENT_REGISTRY[bookmaker]
+    return client_class(
+        getattr(Config, key_attr),
+        session=session,
+        timeout=timeout or Config.SOURCE_TIMEOUT
+    )
+
+def collect_odds_concurrently(clients, timeout=None, max_workers=None, on_result=None):
+    """
+    Fetch DC_BTTS odds from several bookmakers in parallel
+    
+    Every source runs on its own worker thread. Results are handed to
+    `on_result` in completion order so callers can merge partial data
+    as it arrives. Sources that fail or do not finish before the
+    deadline are reported in the errors dict instead of raising.
+    
+    Args:
+        clients (dict): Bookmaker name -> client instance
+        timeout (float): Seconds to wait for all sources before giving up
+        max_workers (int): Thread pool size (defaults to one per source)
+        on_result (callable): Called as on_result(bookmaker, df, elapsed)
+        
+    Returns:
+        tuple: (results dict of bookmaker -> DataFrame, errors dict of bookmaker -> message)
+    """
+    results = {}
+    errors = {}
+    if not clients:
+        return results, errors
+        
+    timeout = timeout or Config.SOURCE_TIMEOUT
+    max_workers = max_workers or min(len(clients), Config.MAX_COLLECTION_WORKERS)
+    started = time.perf_counter()
+    
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="odds")
+    futures = {
+        executor.submit(client.get_dc_btts_odds): bookmaker
+        for bookmaker, client in clients.items()
+    }
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            bookmaker = futures[future]
+            try:
+                data = future.result()
+            except Exception as e:
+                errors[bookmaker] = str(e)
+                continue
+            results[bookmaker] = data
+            if on_result:
+                on_result(bookmaker, data, time.perf_counter() - started)
+    except FuturesTimeoutError:
+        for future, bookmaker in futures.items():
+            if bookmaker not in results and bookmaker not in errors:
+                future.cancel()
+                errors[bookmaker] = f"Timed out after {timeout}s"
+    finally:
+        # Don't block on stragglers; their sockets time out on their own
+        executor.shutdown(wait=False, cancel_futures=True)
+        
+    return results, errors
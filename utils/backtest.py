@@ -0,0 +1,242 @@
+import os
+import numpy as np
+import pandas as pd
+from config import Config
+from models.feature_schema import DEFAULT_FEATURE_SCHEMA
+from .data_utils import create_features
+from .value_engine import find_value
+from .staking import size_stakes
+from .cross_validation import spawn_pool
+
+def load_history(bookmakers=None):
+    """
+    Load the *_historical.csv files DataCollectorAgent falls back to
+    
+    Args:
+        bookmakers (list): Bookmaker names (defaults to Config.BOOKMAKERS)
+        
+    Returns:
+        pd.DataFrame: All bookmakers' rows with a bookmaker column
+    """
+    frames = []
+    for bookmaker in bookmakers or Config.BOOKMAKERS:
+        path = f"{Config.DATA_PATH}{bookmaker.lower()}_historical.csv"
+        if not os.path.exists(path):
+            print(f"No historical data available for {bookmaker}")
+            continue
+        frame = pd.read_csv(path)
+        if "bookmaker" not in frame.columns:
+            frame["bookmaker"] = bookmaker
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+def prepare_fixtures(history, target=Config.TARGET):
+    """
+    One row per fixture with features, result, season and best price
+    
+    The best price is the highest dc_btts_odds any bookmaker offered.
+    Seasons run July to June unless the file has a season column.
+    """
+    time_column = Config.CV_TIME_COLUMN
+    season_column = Config.BACKTEST_SEASON_COLUMN
+    
+    fixtures = history.drop_duplicates("match_id").copy()
+    if not set(Config.ENGINEERED_FEATURES).issubset(fixtures.columns):
+        fixtures = create_features(fixtures)
+    best = history.groupby("match_id")["dc_btts_odds"].max()
+    fixtures["bookmaker_odds"] = fixtures["match_id"].map(best)
+    
+    fixtures[time_column] = pd.to_datetime(fixtures[time_column])
+    if season_column not in fixtures.columns:
+        dates = fixtures[time_column]
+        fixtures[season_column] = dates.dt.year - (dates.dt.month < 7)
+    fixtures = fixtures.dropna(subset=[target, "bookmaker_odds"])
+    return fixtures.sort_values(time_column, kind="stable").reset_index(drop=True)
+
+def run_season(fixtures, season, target=Config.TARGET, thresholds=None, bankroll=None,
+               retrain_freq=None, min_train_rows=None):
+    """
+    Walk-forward backtest of one season
+    
+    At the start of every retrain period a fresh HybridModel is fitted on
+    all fixtures played before it (earlier seasons included) and scores
+    the period's fixtures. Value detection and staking then run once over
+    the whole season, with each match day staked as its own slate.
+    
+    Args:
+        fixtures (pd.DataFrame): Output of prepare_fixtures (may end at
+            this season; later rows are never used)
+        season: Season label to test
+        target (str): Target column name
+        thresholds (list): Value thresholds (defaults to
+            [Config.VALUE_THRESHOLD])
+        bankroll (float): Season starting bankroll
+        retrain_freq (str): Pandas period alias between retrains
+        min_train_rows (int): Skip periods with less history than this
+        
+    Returns:
+        pd.DataFrame: One row per staked selection with season, match
+            date, odds, stake, won and pnl
+    """
+    from models.hybrid_model import HybridModel
+    
+    time_column = Config.CV_TIME_COLUMN
+    bankroll = Config.BANKROLL if bankroll is None else bankroll
+    retrain_freq = retrain_freq or Config.BACKTEST_RETRAIN_FREQ
+    min_train_rows = min_train_rows or Config.BACKTEST_MIN_TRAIN_ROWS
+    
+    in_season = fixtures[Config.BACKTEST_SEASON_COLUMN] == season
+    season_rows = fixtures[in_season]
+    periods = season_rows[time_column].dt.to_period(retrain_freq)
+    
+    columns = [c for c in ["match_id", "home_team", "away_team"] if c in season_rows.columns]
+    columns += [time_column, "bookmaker_odds", target]
+    
+    scored = []
+    for period in periods.unique():
+        train = fixtures[fixtures[time_column] < period.start_time]
+        if len(train) < min_train_rows:
+            continue
+        test = season_rows[periods == period]
+        
+        model = HybridModel()
+        model.train(DEFAULT_FEATURE_SCHEMA.select(train).assign(**{target: train[target]}), target=target)
+        predictions = test[columns].copy()
+        predictions["prediction_prob"] = model.predict_proba(DEFAULT_FEATURE_SCHEMA.select(test))
+        scored.append(predictions)
+        
+    if not scored:
+        return pd.DataFrame()
+    predictions = pd.concat(scored)
+    predictions["confidence"] = np.maximum(predictions["prediction_prob"], 1 - predictions["prediction_prob"])
+    predictions["prediction"] = predictions["prediction_prob"] >= 0.5
+    
+    value = find_value(predictions, thresholds=thresholds, bet_types=["UNDERVALUE"])
+    value[time_column] = predictions.loc[value.index, time_column]
+    value["prediction_prob"] = predictions.loc[value.index, "prediction_prob"]
+    # One slate per match day, whatever the kickoff times
+    value["match_day"] = value[time_column].dt.normalize()
+    bets = size_stakes(value, bankroll=bankroll, slate_column="match_day")
+    bets = bets[bets["stake"] > 0]
+    
+    won = predictions.loc[bets.index, target].to_numpy() == 1
+    bets["season"] = season
+    bets["won"] = won
+    bets["pnl"] = np.where(won, bets["stake"] * (bets["bookmaker_odds"] - 1), -bets["stake"])
+    return bets.sort_values(time_column, kind="stable").reset_index(drop=True)
+
+def performance_metrics(stake, pnl, won, bankroll):
+    """
+    ROI, hit rate and drawdown of a chronological sequence of bets
+    
+    Args:
+        stake (np.ndarray): Stake per bet
+        pnl (np.ndarray): Profit or loss per bet
+        won (np.ndarray): Whether each bet won
+        bankroll (float): Starting bankroll
+        
+    Returns:
+        dict: bets, staked, profit, roi, hit_rate, max_drawdown and
+            final_bankroll
+    """
+    stake = np.asarray(stake, dtype=float)
+    pnl = np.asarray(pnl, dtype=float)
+    won = np.asarray(won, dtype=bool)
+    
+    staked = stake.sum()
+    equity = bankroll + np.cumsum(pnl)
+    peak = np.maximum.accumulate(np.concatenate([[bankroll], equity]))[1:]
+    drawdown = (peak - equity) / peak if len(equity) else np.zeros(1)
+    return {
+        "bets": int(len(stake)),
+        "staked": float(staked),
+        "profit": float(pnl.sum()),
+        "roi": float(pnl.sum() / staked) if staked > 0 else 0.0,
+        "hit_rate": float(won.mean()) if len(won) else 0.0,
+        "max_drawdown": float(drawdown.max()),
+        "final_bankroll": float(equity[-1]) if len(equity) else float(bankroll)
+    }
+
+def backtest(history=None, seasons=None, target=Config.TARGET, thresholds=None, bankroll=None,
+             n_workers=None, threads_per_season=None):
+    """
+    Walk-forward backtest over every season, one process per season
+    
+    Seasons are independent (each starts from the same bankroll), so they
+    run in parallel; every worker only receives fixtures up to the end of
+    its own season.
+    
+    Args:
+        history (pd.DataFrame): Raw historical rows (defaults to load_history())
+        seasons (list): Seasons to test (defaults to all but the first,
+            which only serves as training history)
+        target (str): Target column name
+        thresholds (list): Value thresholds
+        bankroll (float): Starting bankroll per season
+        n_workers (int): Worker processes (defaults to min(seasons, cores))
+        threads_per_season (int): CPU threads each worker may use
+        
+    Returns:
+        tuple: (bets DataFrame, summary dict with "overall" and per-season
+            metrics)
+    """
+    history = load_history() if history is None else history
+    bankroll = Config.BANKROLL if bankroll is None else bankroll
+    if history.empty:
+        return pd.DataFrame(), {"overall": performance_metrics([], [], [], bankroll), "seasons": {}}
+        
+    fixtures = prepare_fixtures(history, target)
+    season_column = Config.BACKTEST_SEASON_COLUMN
+    all_seasons = sorted(fixtures[season_column].unique())
+    seasons = seasons or all_seasons[1:]
+    
+    cores = os.cpu_count() or 1
+    n_workers = n_workers or Config.BACKTEST_WORKERS or max(1, min(len(seasons), cores))
+    threads_per_season = threads_per_season or max(1, cores // n_workers)
+    
+    with spawn_pool(n_workers, threads_per_season) as executor:
+        futures = [
+            executor.submit(
+                run_season,
+                fixtures[fixtures[season_column] <= season],
+                season,
+                target,
+                thresholds,
+                bankroll
+            )
+            for season in seasons
+        ]
+        results = [future.result() for future in futures]
+        
+    results = [bets for bets in results if not bets.empty]
+    bets = pd.concat(results, ignore_index=True) if results else pd.DataFrame(columns=["season", "stake", "pnl", "won"])
+    
+    summary = {
+        "overall": performance_metrics(bets["stake"], bets["pnl"], bets["won"], bankroll),
+        "seasons": {}
+    }
+    for season, season_bets in bets.groupby("season", sort=True):
+        summary["seasons"][season] = performance_metrics(
+            season_bets["stake"], season_bets["pnl"], season_bets["won"], bankroll
+        )
+    return bets, summary
+
+def run_backtest():
+    """Backtest the historical files and print the results"""
+    bets, summary = backtest()
+    for season, metrics in summary["seasons"].items():
+        print(
+            f"Season {season}: {metrics['bets']} bets, ROI {metrics['roi']:.2%}, "
+            f"hit rate {metrics['hit_rate']:.2%}, max drawdown {metrics['max_drawdown']:.2%}"
+        )
+    overall = summary["overall"]
+    print(
+        f"Overall: {overall['bets']} bets, staked {overall['staked']:.2f}, "
+        f"profit {overall['profit']:.2f}, ROI {overall['roi']:.2%}"
+    )
+    return bets, summary
+
+if __name__ == "__main__":
+    run_backtest()
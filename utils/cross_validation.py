@@ -0,0 +1,137 @@
+import os
+import shutil
+import tempfile
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import KFold, TimeSeriesSplit
+from config import Config
+
+# Thread pools that would otherwise each grab every core in every worker
+_THREAD_ENV_VARS = [
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "TF_NUM_INTRAOP_THREADS",
+    "TF_NUM_INTEROP_THREADS"
+]
+
+def make_splitter(splitter="kfold", n_splits=5):
+    """
+    Build a fold splitter
+    
+    Args:
+        splitter (str): "kfold" for shuffled KFold, "time_series" for
+            expanding-window splits that never train on the future
+        n_splits (int): Number of folds
+        
+    Returns:
+        object: scikit-learn splitter
+    """
+    if splitter == "kfold":
+        return KFold(n_splits=n_splits, shuffle=True, random_state=42)
+    if splitter == "time_series":
+        return TimeSeriesSplit(n_splits=n_splits)
+    raise ValueError(f"Unknown splitter: {splitter}")
+
+def _limit_worker_threads(threads):
+    """
+    Pool initializer: cap every thread pool in this worker at `threads`
+    
+    TensorFlow is only imported later by the fold, so the environment
+    variables still take effect for it; BLAS and OpenMP are already loaded
+    with numpy by now and are limited at runtime through threadpoolctl.
+    """
+    for var in _THREAD_ENV_VARS:
+        os.environ[var] = str(threads)
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(threads)
+    except ImportError:
+        pass
+
+@contextmanager
+def spawn_pool(n_workers, threads_per_worker):
+    """
+    Process pool whose workers each use at most `threads_per_worker` threads
+    
+    Workers are spawned fresh and apply the limits themselves in the pool
+    initializer, so the parent's environment is never modified and other
+    threads in the parent are unaffected.
+    """
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_limit_worker_threads,
+        initargs=(threads_per_worker,)
+    ) as executor:
+        yield executor
+
+def _run_fold(X_path, y_path, columns, target, train_index, test_index):
+    """Train a fresh HybridModel on one fold, reading data through memmaps"""
+    from models.hybrid_model import HybridModel
+    from utils.data_utils import calculate_accuracy
+    
+    X = np.load(X_path, mmap_mode="r")
+    y = np.load(y_path, mmap_mode="r")
+    
+    train = pd.DataFrame(X[train_index], columns=columns)
+    train[target] = y[train_index]
+    X_test = pd.DataFrame(X[test_index], columns=columns)
+    
+    model = HybridModel()
+    model.train(train, target=target)
+    preds = model.predict(X_test)
+    return calculate_accuracy(y[test_index], preds)
+
+def parallel_cross_validate(data, target=Config.TARGET, n_splits=None, splitter="kfold",
+                            n_workers=None, threads_per_fold=None, time_column=None):
+    """
+    Cross-validate HybridModel with one process per fold
+    
+    The feature matrix and target are written once to .npy files and each
+    worker memory-maps them, so only fold indices are pickled. BLAS,
+    OpenMP and TensorFlow thread pools in every worker are capped at
+    `threads_per_fold` so that folds do not oversubscribe the cores.
+    
+    Args:
+        data (pd.DataFrame): Numeric features plus the target column
+        target (str): Target column name
+        n_splits (int): Number of folds
+        splitter (str): "kfold" or "time_series"
+        n_workers (int): Worker processes (defaults to min(folds, cores))
+        threads_per_fold (int): CPU threads each worker may use
+        time_column (str): Column to order rows by for time-series splits
+        
+    Returns:
+        list: Accuracy of each fold, in fold order
+    """
+    n_splits = n_splits or Config.CV_FOLDS
+    cores = os.cpu_count() or 1
+    n_workers = n_workers or Config.CV_WORKERS or min(n_splits, cores)
+    threads_per_fold = threads_per_fold or max(1, cores // n_workers)
+    
+    if splitter == "time_series" and time_column and time_column in data.columns:
+        data = data.sort_values(time_column)
+        
+    X = data.drop(columns=[target]).select_dtypes("number")
+    y = data[target].to_numpy()
+    folds = list(make_splitter(splitter, n_splits).split(X))
+    
+    workdir = tempfile.mkdtemp(prefix="cv_")
+    X_path = os.path.join(workdir, "X.npy")
+    y_path = os.path.join(workdir, "y.npy")
+    np.save(X_path, np.ascontiguousarray(X.to_numpy(dtype=np.float32)))
+    np.save(y_path, y)
+    
+    try:
+        with spawn_pool(n_workers, threads_per_fold) as executor:
+            futures = [
+                executor.submit(_run_fold, X_path, y_path, list(X.columns), target, train_index, test_index)
+                for train_index, test_index in folds
+            ]
+            return [future.result() for future in futures]
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
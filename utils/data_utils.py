@@ -3,8 +3,9 @@ import numpy as np
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import MinMaxScaler
 from config import Config
+from models.feature_schema import DEFAULT_FEATURE_SCHEMA
 
-def preprocess_data(raw_data, target_column=Config.TARGET):
+def preprocess_data(raw_data, target_column=Config.TARGET, feature_store=None):
     data = raw_data.copy()
     data.fillna({
         'player_form': data['player_form'].median(),
@@ -17,9 +18,12 @@ def preprocess_data(raw_data, target_column=Config.TARGET):
         'pitch_condition': 1.0
     }, inplace=True)
     
-    data = create_features(data)
+    if feature_store is not None:
+        data = feature_store.compute(data, create_features)
+    else:
+        data = create_features(data)
     
-    X = data[Config.REQUIRED_FEATURES]
+    X = DEFAULT_FEATURE_SCHEMA.select(data)
     y = data[target_column]
     
     X_train, X_test, y_train, y_test = train_test_split(
@@ -32,6 +36,40 @@ def preprocess_data(raw_data, target_column=Config.TARGET):
     
     return X_train, X_test, y_train, y_test, scaler
 
+def preprocess_prediction_data(raw_data, feature_store=None):
+    """
+    Fill and engineer the features of upcoming fixtures for scoring
+    
+    Same cleaning and feature code as preprocess_data, but every row is
+    kept (no split, no target) so predictions line up with the fixtures.
+    
+    Args:
+        raw_data (pd.DataFrame): Latest processed fixtures (may be None)
+        feature_store (FeatureStore): Optional cache of engineered rows
+        
+    Returns:
+        pd.DataFrame: Fixtures with engineered features (empty if no data)
+    """
+    if raw_data is None or raw_data.empty:
+        return pd.DataFrame()
+    data = raw_data.copy()
+    defaults = {
+        'team_form': 0.5,
+        'coach_form': 0.5,
+        'injuries': 0,
+        'home_away': 0,
+        'transfers': 0,
+        'weather': 1.0,
+        'pitch_condition': 1.0
+    }
+    if 'player_form' in data.columns:
+        defaults['player_form'] = data['player_form'].median()
+    data.fillna({k: v for k, v in defaults.items() if k in data.columns}, inplace=True)
+    
+    if feature_store is not None:
+        return feature_store.compute(data, create_features)
+    return create_features(data)
+
 def create_features(data):
     data['form_differential'] = data['home_form'] - data['away_form']
     data['injury_impact'] = data['home_injuries'] * 0.8 + data['away_injuries'] * 0.2
@@ -46,14 +84,6 @@ def create_features(data):
     data['weather_impact'] = data['weather'].map(weather_impact).fillna(0.8)
     data['pitch_impact'] = data['pitch_condition'] / 10.0
     
-    Config.REQUIRED_FEATURES.extend([
-        'form_differential',
-        'injury_impact',
-        'coach_exp_diff',
-        'weather_impact',
-        'pitch_impact'
-    ])
-    
     return data
 
 def calculate_accuracy(y_true, y_pred):
@@ -68,3 +98,54 @@ def calculate_injury_impact(home_injuries, away_injuries):
     home_impact = min(len(home_injuries) * 0.1, 1.0)
     away_impact = min(len(away_injuries) * 0.1, 1.0)
     return home_impact, away_impact
+
+def flatten_nested(column, field=None):
+    """
+    Flatten a column of nested lists into a flat value array plus offsets
+    
+    Row i owns values[offsets[i]:offsets[i + 1]]. Lists, tuples and
+    NumPy arrays (as produced by Parquet/Arrow readers) count as lists;
+    missing or other cells are treated as empty lists.
+    
+    Args:
+        column (iterable): Cells holding lists (e.g. of player dicts)
+        field (str): Key to extract from each item, or None to only count items
+        
+    Returns:
+        tuple: (values float64 array or None, offsets int64 array of len(column) + 1)
+    """
+    cells = [v if isinstance(v, (list, tuple, np.ndarray)) else () for v in column]
+    lengths = np.fromiter((len(v) for v in cells), dtype=np.int64, count=len(cells))
+    offsets = np.zeros(len(cells) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    
+    if field is None:
+        return None, offsets
+        
+    values = np.fromiter(
+        (item[field] for cell in cells for item in cell),
+        dtype=np.float64,
+        count=int(offsets[-1])
+    )
+    return values, offsets
+
+def segment_mean(values, offsets, default=0.5):
+    """Mean of each offsets segment, with `default` for empty segments"""
+    counts = np.diff(offsets)
+    segment_ids = np.repeat(np.arange(len(counts)), counts)
+    sums = np.bincount(segment_ids, weights=values, minlength=len(counts))
+    return np.where(counts > 0, sums / np.maximum(counts, 1), default)
+
+def form_index_columns(home_players, away_players):
+    """Columnar equivalent of calculate_form_index over whole columns"""
+    home_values, home_offsets = flatten_nested(home_players, "form")
+    away_values, away_offsets = flatten_nested(away_players, "form")
+    return segment_mean(home_values, home_offsets), segment_mean(away_values, away_offsets)
+
+def injury_impact_columns(home_injuries, away_injuries):
+    """Columnar equivalent of calculate_injury_impact over whole columns"""
+    _, home_offsets = flatten_nested(home_injuries)
+    _, away_offsets = flatten_nested(away_injuries)
+    home_impact = np.minimum(np.diff(home_offsets) * 0.1, 1.0)
+    away_impact = np.minimum(np.diff(away_offsets) * 0.1, 1.0)
+    return home_impact, away_impact
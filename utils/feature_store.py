@@ -0,0 +1,211 @@
+import os
+import json
+import pickle
+import sqlite3
+import hashlib
+import threading
+import numpy as np
+import pandas as pd
+from config import Config
+from models.feature_schema import DEFAULT_FEATURE_SCHEMA
+
+class FeatureStore:
+    """
+    Persistent SQLite store of engineered feature rows keyed by match_id
+    and feature version
+    
+    The feature version combines Config.FEATURE_VERSION, the feature
+    schema fingerprint and the feature function's name and code, so
+    changing feature code or the schema never serves stale rows, and
+    different feature functions never overwrite each other. Each entry
+    remembers a hash of the input row it was computed from, so a fixture
+    is only re-engineered when its inputs change. Columns listed
+    in Config.FEATURE_STORE_IGNORED_COLUMNS (odds, bookmaker) are left out
+    of the hash because they move every poll without affecting features;
+    they are not stored either, and rows served from the store carry the
+    current input's values for them.
+    """
+    
+    def __init__(self, path=None, ignore_columns=None):
+        self.path = path or f"{Config.DATA_PATH}feature_store.sqlite"
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            
+        self.ignore_columns = set(
+            Config.FEATURE_STORE_IGNORED_COLUMNS if ignore_columns is None else ignore_columns
+        )
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(features)")]
+        if columns and "feature_version" not in columns:
+            # Stores from before versioned keys are only a cache; rebuild them
+            self.conn.execute("DROP TABLE features")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS features ("
+            "match_id TEXT NOT NULL, "
+            "feature_version TEXT NOT NULL, "
+            "row_hash TEXT NOT NULL, "
+            "payload BLOB NOT NULL, "
+            "updated_at TEXT NOT NULL, "
+            "PRIMARY KEY (match_id, feature_version))"
+        )
+        self.conn.commit()
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+    def row_hashes(self, df):
+        """Stable content hash of every input row, ignoring volatile columns"""
+        columns = sorted(c for c in df.columns if c not in self.ignore_columns)
+        return [
+            hashlib.sha1(json.dumps(record, sort_keys=True, default=str).encode()).hexdigest()
+            for record in df[columns].to_dict("records")
+        ]
+        
+    @staticmethod
+    def feature_version(feature_fn):
+        """Identity of a feature function's output: config version, schema and code"""
+        function = getattr(feature_fn, "__func__", feature_fn)
+        code = getattr(function, "__code__", None)
+        payload = json.dumps([
+            Config.FEATURE_VERSION,
+            DEFAULT_FEATURE_SCHEMA.fingerprint,
+            getattr(function, "__module__", ""),
+            getattr(function, "__qualname__", repr(function)),
+            code.co_code.hex() if code else "",
+            repr(code.co_consts) if code else ""
+        ])
+        return hashlib.sha1(payload.encode()).hexdigest()[:16]
+        
+    def compute(self, df, feature_fn):
+        """
+        Return engineered features for df, recomputing only new or changed rows
+        
+        Args:
+            df (pd.DataFrame): Raw input rows with a match_id column
+            feature_fn (callable): Maps a raw frame to a feature frame with the same index
+            
+        Returns:
+            pd.DataFrame: Feature rows in the same order and index as df
+        """
+        if df is None or df.empty:
+            return pd.DataFrame()
+            
+        version = self.feature_version(feature_fn)
+        keys = df["match_id"].astype(str).tolist()
+        hashes = self.row_hashes(df)
+        cached = self.fetch(keys, version)
+        
+        hit_mask = np.array([
+            key in cached and cached[key][0] == row_hash
+            for key, row_hash in zip(keys, hashes)
+        ], dtype=bool)
+        
+        records = [None] * len(df)
+        columns = None
+        # Volatile inputs passed through to the output are stored blank
+        passthrough = self.ignore_columns & set(df.columns)
+        
+        stale_positions = np.flatnonzero(~hit_mask)
+        if len(stale_positions):
+            fresh = feature_fn(df.iloc[stale_positions].copy())
+            columns = list(fresh.columns)
+            fresh_records = fresh.to_dict("records")
+            self.write([
+                (keys[pos], hashes[pos], {
+                    name: None if name in passthrough else value
+                    for name, value in record.items()
+                })
+                for pos, record in zip(stale_positions, fresh_records)
+            ], version)
+            for pos, record in zip(stale_positions, fresh_records):
+                records[pos] = record
+                
+        for pos in np.flatnonzero(hit_mask):
+            records[pos] = cached[keys[pos]][1]
+            if columns is None:
+                columns = list(records[pos].keys())
+                
+        with self.lock:
+            self.hits += int(hit_mask.sum())
+            self.misses += int(len(stale_positions))
+            
+        result = pd.DataFrame(records, index=df.index, columns=columns)
+        hit_positions = np.flatnonzero(hit_mask)
+        if len(hit_positions):
+            for name in passthrough & set(result.columns):
+                values = result[name].to_numpy(dtype=object)
+                values[hit_positions] = df[name].iloc[hit_positions].to_numpy(dtype=object)
+                result[name] = pd.Series(values, index=result.index).infer_objects()
+        return result
+        
+    def fetch(self, keys, version, chunk_size=500):
+        """Load (row_hash, feature record) for the given match ids at one feature version"""
+        found = {}
+        unique_keys = list(dict.fromkeys(keys))
+        with self.lock:
+            for start in range(0, len(unique_keys), chunk_size):
+                chunk = unique_keys[start:start + chunk_size]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self.conn.execute(
+                    f"SELECT match_id, row_hash, payload FROM features "
+                    f"WHERE feature_version = ? AND match_id IN ({placeholders})",
+                    [version] + chunk
+                ).fetchall()
+                for match_id, row_hash, payload in rows:
+                    found[match_id] = (row_hash, pickle.loads(payload))
+        return found
+        
+    def write(self, entries, version):
+        """Upsert (match_id, row_hash, feature record) entries at one feature version"""
+        now = pd.Timestamp.now().isoformat()
+        with self.lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO features (match_id, feature_version, row_hash, payload, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(key, version, row_hash, pickle.dumps(record), now) for key, row_hash, record in entries]
+            )
+            self.conn.commit()
+            
+    def evict(self, match_ids):
+        """Drop settled fixtures from the store (every feature version)"""
+        keys = [str(m) for m in match_ids]
+        if not keys:
+            return 0
+        with self.lock:
+            cursor = self.conn.executemany(
+                "DELETE FROM features WHERE match_id = ?",
+                [(key,) for key in keys]
+            )
+            self.conn.commit()
+            removed = cursor.rowcount
+            self.evictions += removed
+        return removed
+        
+    def stats(self):
+        total = self.hits + self.misses
+        with self.lock:
+            size = self.conn.execute("SELECT COUNT(*) FROM features").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "size": size
+        }
+        
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+_feature_store = None
+
+def get_feature_store():
+    """Process-wide feature store shared by the agents"""
+    global _feature_store
+    if _feature_store is None:
+        _feature_store = FeatureStore()
+    return _feature_store
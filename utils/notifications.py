@@ -0,0 +1,285 @@
+import time
+import json
+import queue
+import atexit
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from config import Config
+
+def bot_base_url(api_url):
+    """
+    Bot API base URL in the form telegram.Bot expects
+    
+    python-telegram-bot appends the token straight onto base_url, so the
+    URL must end in "/bot" ("https://api.telegram.org/bot"). A server root
+    such as "http://127.0.0.1:8081" gets the suffix added.
+    """
+    api_url = api_url.rstrip("/")
+    return api_url if api_url.endswith("/bot") else f"{api_url}/bot"
+
+class ChartRenderer:
+    """
+    Renders Plotly figures to images through one long-lived Kaleido scope
+    
+    Figures are keyed by a hash of their JSON spec, so an unchanged chart
+    is never rendered twice. When Kaleido's scope API is unavailable,
+    rendering falls back to plotly.io.to_image.
+    """
+    
+    def __init__(self, cache_size=None):
+        self.cache_size = cache_size or Config.CHART_CACHE_SIZE
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+        self.scope = None
+        self.hits = 0
+        self.renders = 0
+        
+    def _scope(self):
+        if self.scope is None:
+            try:
+                from kaleido.scopes.plotly import PlotlyScope
+                self.scope = PlotlyScope()
+            except ImportError:
+                self.scope = False
+        return self.scope
+        
+    def render(self, figure, format="png", width=None, height=None):
+        """
+        Image bytes for a figure (go.Figure or its JSON string)
+        
+        Returns:
+            bytes: Encoded image
+        """
+        spec = figure if isinstance(figure, str) else figure.to_json()
+        key = hashlib.sha1(f"{format}:{width}:{height}:{spec}".encode()).hexdigest()
+        with self.lock:
+            image = self.cache.get(key)
+            if image is not None:
+                self.cache.move_to_end(key)
+                self.hits += 1
+                return image
+                
+            scope = self._scope()
+            if scope:
+                image = scope.transform(json.loads(spec), format=format, width=width, height=height)
+            else:
+                import plotly.io as pio
+                image = pio.to_image(pio.from_json(spec), format=format, width=width, height=height)
+            self.renders += 1
+            
+            self.cache[key] = image
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+            return image
+
+class TelegramNotifier:
+    """
+    Outbound Telegram queue delivered by a background worker
+    
+    Callers enqueue and return immediately; when the queue is full the
+    item is dropped and counted rather than blocking. The worker gathers what
+    arrives within Config.TELEGRAM_BATCH_WINDOW, merges consecutive text
+    messages, renders queued charts and sends photos as media groups of
+    up to ten, spacing sends by Config.TELEGRAM_MIN_INTERVAL. Rate-limit
+    replies are honoured and network errors are retried with exponential
+    backoff.
+    
+    Args:
+        bot (telegram.Bot): Bot to send with (built from Config when omitted)
+        chat_id (str): Destination chat
+        renderer (ChartRenderer): Renderer for queued figures
+    """
+    
+    MAX_MESSAGE_LENGTH = 4096
+    MAX_MEDIA_GROUP = 10
+    
+    def __init__(self, bot=None, chat_id=None, renderer=None):
+        if bot is None:
+            import telegram
+            kwargs = {"base_url": bot_base_url(Config.TELEGRAM_API_URL)} if Config.TELEGRAM_API_URL else {}
+            bot = telegram.Bot(token=Config.TELEGRAM_TOKEN, **kwargs)
+        self.bot = bot
+        self.chat_id = chat_id or Config.TELEGRAM_CHAT_ID
+        self.renderer = renderer or get_chart_renderer()
+        self.outbox = queue.Queue(maxsize=Config.TELEGRAM_QUEUE_SIZE)
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.last_send = 0.0
+        self.sent = 0
+        self.failed = 0
+        self.retries = 0
+        self.dropped = 0
+        
+    def start(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self._run, name="telegram-notifier", daemon=True)
+            self.thread.start()
+        return self
+        
+    def stop(self, timeout=30):
+        """Deliver what is queued, then stop the worker"""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout)
+            
+    def _enqueue(self, kind, payload):
+        self.start()
+        try:
+            self.outbox.put_nowait((kind, payload))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            print(f"Telegram queue full - dropped {kind}")
+            return False
+            
+    def send_message(self, text):
+        return self._enqueue("text", text)
+        
+    def send_photo(self, photo):
+        """Queue image bytes (or an open file)"""
+        return self._enqueue("photo", photo)
+        
+    def send_chart(self, figure):
+        """Queue a Plotly figure; it is rendered on the worker, not the caller"""
+        return self._enqueue("chart", figure if isinstance(figure, str) else figure.to_json())
+        
+    def stats(self):
+        return {
+            "queued": self.outbox.qsize(),
+            "sent": self.sent,
+            "failed": self.failed,
+            "retries": self.retries,
+            "dropped": self.dropped,
+            "renders": self.renderer.renders,
+            "render_cache_hits": self.renderer.hits
+        }
+        
+    def _next_batch(self):
+        try:
+            batch = [self.outbox.get(timeout=0.5)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + Config.TELEGRAM_BATCH_WINDOW
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.outbox.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+        
+    def _split(self, text):
+        """Pieces of at most MAX_MESSAGE_LENGTH, broken at line ends where possible"""
+        pieces = []
+        while len(text) > self.MAX_MESSAGE_LENGTH:
+            cut = text.rfind("\n", 0, self.MAX_MESSAGE_LENGTH)
+            if cut <= 0:
+                cut = self.MAX_MESSAGE_LENGTH
+            pieces.append(text[:cut])
+            text = text[cut:].lstrip("\n")
+        if text:
+            pieces.append(text)
+        return pieces
+        
+    def _plan(self, batch):
+        """Turn queued items into send operations: merged texts, then photo groups"""
+        texts, photos = [], []
+        for kind, payload in batch:
+            if kind == "text":
+                texts.extend(self._split(payload))
+                continue
+            # A failed render drops that image only, never the batch's texts
+            try:
+                if kind == "chart":
+                    photos.append(self.renderer.render(payload))
+                else:
+                    photos.append(payload.read() if hasattr(payload, "read") else payload)
+            except Exception as e:
+                print(f"Telegram render error: {str(e)}")
+                self.failed += 1
+                
+        operations = []
+        message = ""
+        for text in texts:
+            if message and len(message) + len(text) + 2 > self.MAX_MESSAGE_LENGTH:
+                operations.append(("text", message))
+                message = ""
+            message = f"{message}\n\n{text}" if message else text
+        if message:
+            operations.append(("text", message))
+        for start in range(0, len(photos), self.MAX_MEDIA_GROUP):
+            operations.append(("photos", photos[start:start + self.MAX_MEDIA_GROUP]))
+        return operations
+        
+    async def _deliver(self, kind, payload):
+        from telegram import InputMediaPhoto
+        from telegram.error import RetryAfter, TimedOut, NetworkError, TelegramError
+        
+        for attempt in range(Config.TELEGRAM_MAX_RETRIES + 1):
+            wait = self.last_send + Config.TELEGRAM_MIN_INTERVAL - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                if kind == "text":
+                    await self.bot.send_message(chat_id=self.chat_id, text=payload)
+                elif len(payload) == 1:
+                    await self.bot.send_photo(chat_id=self.chat_id, photo=payload[0])
+                else:
+                    await self.bot.send_media_group(
+                        chat_id=self.chat_id,
+                        media=[InputMediaPhoto(photo) for photo in payload]
+                    )
+                self.last_send = time.monotonic()
+                self.sent += 1
+                return True
+            except RetryAfter as e:
+                self.retries += 1
+                await asyncio.sleep(float(e.retry_after))
+            except (TimedOut, NetworkError):
+                self.retries += 1
+                await asyncio.sleep(Config.TELEGRAM_BACKOFF * 2 ** attempt)
+            except TelegramError as e:
+                print(f"Telegram error: {str(e)}")
+                break
+        self.failed += 1
+        return False
+        
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self.bot.initialize())
+            while not (self.stop_event.is_set() and self.outbox.empty()):
+                batch = self._next_batch()
+                if not batch:
+                    continue
+                for kind, payload in self._plan(batch):
+                    loop.run_until_complete(self._deliver(kind, payload))
+        finally:
+            try:
+                loop.run_until_complete(self.bot.shutdown())
+            except Exception:
+                pass
+            loop.close()
+
+_chart_renderer = None
+_telegram_notifier = None
+
+def get_chart_renderer():
+    """Process-wide chart renderer"""
+    global _chart_renderer
+    if _chart_renderer is None:
+        _chart_renderer = ChartRenderer()
+    return _chart_renderer
+
+def get_telegram_notifier():
+    """Process-wide Telegram queue, flushed at interpreter exit"""
+    global _telegram_notifier
+    if _telegram_notifier is None:
+        _telegram_notifier = TelegramNotifier()
+        atexit.register(_telegram_notifier.stop)
+    return _telegram_notifier
@@ -0,0 +1,107 @@
+import threading
+from collections import deque
+import pandas as pd
+from config import Config
+
+class OddsBook:
+    """
+    In-memory best-price index across bookmakers
+    
+    Prices are indexed by (match_id, market) and then bookmaker. Each
+    fixture keeps its current best price cached, so best-price lookups are
+    O(1); an update is O(1) unless it lowers the current best price, in
+    which case only that fixture's bookmakers are rescanned. Every
+    fixture also keeps a short price history in a fixed-size ring buffer.
+    """
+    
+    def __init__(self, history_size=None):
+        self.history_size = history_size or Config.ODDS_HISTORY_SIZE
+        self.prices = {}
+        self.best = {}
+        self.history = {}
+        self.lock = threading.RLock()
+        
+    def update(self, match_id, bookmaker, price, market=Config.TARGET, timestamp=None):
+        """
+        Set a bookmaker's price for a fixture
+        
+        Returns:
+            float: The bookmaker's previous price, or None if it is new
+        """
+        key = (match_id, market)
+        price = float(price)
+        with self.lock:
+            quotes = self.prices.setdefault(key, {})
+            old_price = quotes.get(bookmaker)
+            if old_price == price:
+                return old_price
+            quotes[bookmaker] = price
+            
+            best_price, best_bookmaker = self.best.get(key, (None, None))
+            if best_price is None or price >= best_price:
+                self.best[key] = (price, bookmaker)
+            elif bookmaker == best_bookmaker:
+                # The best price drifted down; rescan this fixture only
+                book = max(quotes, key=quotes.get)
+                self.best[key] = (quotes[book], book)
+                
+            ring = self.history.get(key)
+            if ring is None:
+                ring = self.history[key] = deque(maxlen=self.history_size)
+            ring.append((timestamp or pd.Timestamp.now(), bookmaker, price))
+        return old_price
+        
+    def update_frame(self, odds, market=Config.TARGET, price_column="dc_btts_odds", bookmaker=None):
+        """Apply every row of a bookmaker odds frame; returns the number of rows"""
+        if odds is None or odds.empty:
+            return 0
+        bookmakers = odds["bookmaker"].tolist() if "bookmaker" in odds else [bookmaker] * len(odds)
+        timestamp = pd.Timestamp.now()
+        for match_id, book, price in zip(odds["match_id"].tolist(), bookmakers, odds[price_column].tolist()):
+            self.update(match_id, book, price, market, timestamp)
+        return len(odds)
+        
+    def price(self, match_id, bookmaker, market=Config.TARGET):
+        with self.lock:
+            return self.prices.get((match_id, market), {}).get(bookmaker)
+            
+    def best_price(self, match_id, market=Config.TARGET):
+        """(price, bookmaker) of the best available price, or (None, None)"""
+        with self.lock:
+            return self.best.get((match_id, market), (None, None))
+            
+    def best_prices(self, match_ids, market=Config.TARGET):
+        """match_id -> best price for the requested fixtures that have quotes"""
+        with self.lock:
+            best = self.best
+            return {
+                match_id: best[(match_id, market)][0]
+                for match_id in match_ids
+                if (match_id, market) in best
+            }
+            
+    def best_prices_frame(self, market=Config.TARGET):
+        """Best price and bookmaker for every fixture in a market"""
+        with self.lock:
+            rows = [
+                (match_id, price, bookmaker)
+                for (match_id, key_market), (price, bookmaker) in self.best.items()
+                if key_market == market
+            ]
+        return pd.DataFrame(rows, columns=["match_id", "bookmaker_odds", "best_bookmaker"])
+        
+    def price_history(self, match_id, market=Config.TARGET):
+        """Recent (timestamp, bookmaker, price) updates, oldest first"""
+        with self.lock:
+            return list(self.history.get((match_id, market), ()))
+            
+    def remove(self, match_id, market=Config.TARGET):
+        """Forget a settled fixture"""
+        key = (match_id, market)
+        with self.lock:
+            self.prices.pop(key, None)
+            self.best.pop(key, None)
+            self.history.pop(key, None)
+            
+    def __len__(self):
+        return len(self.prices)
@@ -0,0 +1,247 @@
+import json
+import time
+import queue
+import threading
+from collections import deque
+import numpy as np
+import pandas as pd
+from config import Config
+from .odds_book import OddsBook
+
+class OddsChangeTracker:
+    """
+    Change-data-capture over odds snapshots
+    
+    Remembers the last price seen for every (match_id, bookmaker) in an
+    OddsBook and turns each new snapshot into delta records for prices
+    that actually moved. Pass the conductor's odds book to keep batch and
+    streaming prices in one index.
+    """
+    
+    def __init__(self, book=None):
+        self.book = book if book is not None else OddsBook()
+        
+    def diff(self, snapshot, bookmaker=None, timestamp=None):
+        """
+        Compare a snapshot against the last known prices
+        
+        Args:
+            snapshot (pd.DataFrame): Frame with match_id, dc_btts_odds and
+                optionally bookmaker columns
+            bookmaker (str): Bookmaker name when the frame has no bookmaker column
+            timestamp (pd.Timestamp): Observation time (defaults to now)
+            
+        Returns:
+            list: Delta dicts with match_id, bookmaker, old_price, new_price,
+                timestamp and received_at (perf_counter, for latency)
+        """
+        if snapshot is None or snapshot.empty:
+            return []
+        timestamp = timestamp or pd.Timestamp.now()
+        received_at = time.perf_counter()
+        
+        match_ids = snapshot["match_id"].tolist()
+        prices = snapshot["dc_btts_odds"].to_numpy(dtype=float)
+        bookmakers = snapshot["bookmaker"].tolist() if "bookmaker" in snapshot else [bookmaker] * len(snapshot)
+        
+        deltas = []
+        for match_id, book, price in zip(match_ids, bookmakers, prices):
+            old_price = self.book.update(match_id, book, price, timestamp=timestamp)
+            if old_price is not None and old_price == price:
+                continue
+            deltas.append({
+                "match_id": match_id,
+                "bookmaker": book,
+                "old_price": old_price,
+                "new_price": price,
+                "timestamp": timestamp,
+                "received_at": received_at
+            })
+        return deltas
+        
+    def best_prices(self, match_ids=None):
+        """Highest current price per match across bookmakers"""
+        if match_ids is None:
+            frame = self.book.best_prices_frame()
+            return dict(zip(frame["match_id"], frame["bookmaker_odds"]))
+        return self.book.best_prices(match_ids)
+
+class ReplaySource:
+    """
+    Replays recorded odds snapshots from JSON
+    
+    The file holds a list of {"timestamp", "bookmaker", "odds": [{"match_id",
+    "dc_btts_odds", ...}, ...]} records. Each call to get_dc_btts_odds()
+    returns the next snapshot for this source's bookmaker, so a replay
+    source can stand in for an API client.
+    """
+    
+    def __init__(self, path, bookmaker=None):
+        with open(path) as f:
+            records = json.load(f)
+        if bookmaker is not None:
+            records = [r for r in records if r["bookmaker"] == bookmaker]
+        self.bookmaker = bookmaker
+        self.snapshots = [
+            (pd.Timestamp(r["timestamp"]), r["bookmaker"], pd.DataFrame(r["odds"]))
+            for r in records
+        ]
+        self.position = 0
+        
+    def __len__(self):
+        return len(self.snapshots)
+        
+    def exhausted(self):
+        return self.position >= len(self.snapshots)
+        
+    def next_snapshot(self):
+        timestamp, bookmaker, frame = self.snapshots[self.position]
+        self.position += 1
+        frame = frame.copy()
+        frame["bookmaker"] = bookmaker
+        return timestamp, frame
+        
+    def get_dc_btts_odds(self):
+        return self.next_snapshot()[1]
+
+class OddsStream:
+    """
+    Polls each source on its own thread and queues only the odds deltas
+    
+    Sources are bookmaker name -> object with get_dc_btts_odds() (the API
+    clients or a ReplaySource). Deltas land on `self.deltas`, an in-process
+    queue consumed by StreamingPipeline.
+    """
+    
+    def __init__(self, sources, poll_interval=None, tracker=None, max_queue=None):
+        self.sources = sources
+        self.poll_interval = Config.STREAM_POLL_INTERVAL if poll_interval is None else poll_interval
+        self.tracker = tracker or OddsChangeTracker()
+        self.deltas = queue.Queue(maxsize=max_queue or Config.STREAM_MAX_QUEUE)
+        self.stop_event = threading.Event()
+        self.threads = []
+        self.errors = {}
+        
+    def start(self):
+        for bookmaker, source in self.sources.items():
+            thread = threading.Thread(
+                target=self._poll,
+                args=(bookmaker, source),
+                name=f"odds-stream-{bookmaker}",
+                daemon=True
+            )
+            thread.start()
+            self.threads.append(thread)
+        return self
+        
+    def stop(self, timeout=5):
+        self.stop_event.set()
+        for thread in self.threads:
+            thread.join(timeout)
+            
+    def running(self):
+        return any(thread.is_alive() for thread in self.threads)
+        
+    def _poll(self, bookmaker, source):
+        while not self.stop_event.is_set():
+            if isinstance(source, ReplaySource):
+                if source.exhausted():
+                    return
+                timestamp, snapshot = source.next_snapshot()
+            else:
+                timestamp = None
+                try:
+                    snapshot = source.get_dc_btts_odds()
+                except Exception as e:
+                    self.errors[bookmaker] = str(e)
+                    self.stop_event.wait(self.poll_interval)
+                    continue
+                    
+            for delta in self.tracker.diff(snapshot, bookmaker, timestamp):
+                self.deltas.put(delta)
+            if self.poll_interval:
+                self.stop_event.wait(self.poll_interval)
+                
+    def drain(self, max_items=None, timeout=None):
+        """Block for the first delta (up to timeout), then take what is queued"""
+        max_items = max_items or Config.STREAM_BATCH_SIZE
+        try:
+            batch = [self.deltas.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while len(batch) < max_items:
+            try:
+                batch.append(self.deltas.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+class StreamingPipeline:
+    """
+    Re-scores and re-evaluates value only for fixtures whose price moved
+    
+    Args:
+        stream (OddsStream): Source of odds deltas
+        prediction_agent (PredictionEngineAgent): Applies deltas to the
+            current predictions
+        value_agent (ValueIdentifierAgent): Finds value bets among the
+            updated rows
+    """
+    
+    def __init__(self, stream, prediction_agent, value_agent, stats_window=100000):
+        self.stream = stream
+        self.prediction_agent = prediction_agent
+        self.value_agent = value_agent
+        self.latencies = deque(maxlen=stats_window)
+        self.events = 0
+        self.started_at = None
+        self.value_bets = {}
+        
+    def process(self, deltas):
+        updated = self.prediction_agent.apply_odds_deltas(deltas, self.stream.tracker)
+        if updated is not None and not updated.empty:
+            for bet in self.value_agent.find_value_bets(updated).to_dict("records"):
+                self.value_bets[bet["match_id"]] = bet
+        finished = time.perf_counter()
+        self.latencies.extend(finished - delta["received_at"] for delta in deltas)
+        self.events += len(deltas)
+        
+    def run(self, until_idle=True, idle_timeout=1.0):
+        """
+        Consume deltas until the stream stops (and the queue is empty)
+        
+        Returns:
+            dict: Throughput and end-to-end latency statistics
+        """
+        self.started_at = time.perf_counter()
+        self.stream.start()
+        try:
+            while True:
+                deltas = self.stream.drain(timeout=idle_timeout)
+                if deltas:
+                    self.process(deltas)
+                elif until_idle and not self.stream.running():
+                    break
+        finally:
+            self.stream.stop()
+        return self.stats()
+        
+    def stats(self):
+        elapsed = time.perf_counter() - self.started_at if self.started_at else 0.0
+        latencies = np.array(self.latencies) * 1000.0
+        return {
+            "events": self.events,
+            "events_per_s": self.events / elapsed if elapsed > 0 else 0.0,
+            "p50_latency_ms": float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+            "p99_latency_ms": float(np.percentile(latencies, 99)) if len(latencies) else 0.0,
+            "value_bets": len(self.value_bets)
+        }
+
+def replay(path, prediction_agent, value_agent):
+    """Replay a recorded JSON file through the streaming pipeline as fast as possible"""
+    with open(path) as f:
+        bookmakers = sorted({r["bookmaker"] for r in json.load(f)})
+    sources = {bookmaker: ReplaySource(path, bookmaker) for bookmaker in bookmakers}
+    tracker = OddsChangeTracker(prediction_agent.conductor.odds_book)
+    stream = OddsStream(sources, poll_interval=0, tracker=tracker)
+    return StreamingPipeline(stream, prediction_agent, value_agent).run()
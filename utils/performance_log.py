@@ -0,0 +1,187 @@
+import os
+import glob
+import threading
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from config import Config
+
+_COLUMNS = {
+    "timestamp": "datetime64[ns]",
+    "agent": "U64",
+    "win": bool,
+    "confidence": float,
+    "cost": float,
+    "stake": float,
+    "profit": float
+}
+
+class PerformanceLog:
+    """
+    Append-only columnar log of settled bets
+    
+    Events go into fixed-size chunks of NumPy arrays; a full chunk is
+    sealed and, when a segment directory is configured, written to disk as
+    an .npz segment and dropped from memory. Running totals (bets, wins,
+    staked, profit, cost) are updated on every append, so summary() is O(1).
+    Timestamps are appended in order, so frames never need re-sorting.
+    
+    Args:
+        segment_dir (str): Directory for persisted segments (None keeps
+            everything in memory); existing segments are picked up
+        chunk_size (int): Rows per chunk / segment
+    """
+    
+    def __init__(self, segment_dir=None, chunk_size=None):
+        self.segment_dir = segment_dir
+        self.chunk_size = chunk_size or Config.PERFORMANCE_CHUNK_SIZE
+        self.sealed = []
+        self.sealed_sizes = []
+        self.lock = threading.RLock()
+        
+        self.total = 0
+        self.wins = 0
+        self.profit = 0.0
+        self.cost = 0.0
+        self.staked = 0.0
+        self._new_chunk()
+        
+        if segment_dir:
+            os.makedirs(segment_dir, exist_ok=True)
+            for path in sorted(glob.glob(os.path.join(segment_dir, "segment_*.npz"))):
+                with np.load(path) as segment:
+                    chunk = self._read_segment(segment)
+                    self._accumulate(chunk["win"], chunk["profit"], chunk["cost"], chunk["stake"])
+                    self.sealed_sizes.append(len(segment["win"]))
+                self.sealed.append(path)
+                
+    def _new_chunk(self):
+        self.active = {
+            name: np.zeros(self.chunk_size, dtype=dtype) for name, dtype in _COLUMNS.items()
+        }
+        self.active_size = 0
+        
+    @staticmethod
+    def _read_segment(segment):
+        # Segments written before stakes were logged have no stake column
+        size = len(segment["win"])
+        return {
+            name: segment[name] if name in segment.files else np.zeros(size, dtype=dtype)
+            for name, dtype in _COLUMNS.items()
+        }
+        
+    def _accumulate(self, win, profit, cost, stake):
+        self.total += len(win)
+        self.wins += int(np.count_nonzero(win))
+        self.profit += float(np.sum(profit))
+        self.cost += float(np.sum(cost))
+        self.staked += float(np.sum(stake))
+        
+    def __len__(self):
+        return self.total
+        
+    def append(self, agent, result, confidence, cost=0.0, profit=0.0, timestamp=None, stake=0.0):
+        """Log one settled bet ("win" or "loss")"""
+        self.extend(agent, [result], [confidence], cost, [profit], timestamp, [stake])
+        
+    def extend(self, agent, results, confidences, cost=0.0, profits=None, timestamp=None, stakes=None):
+        """
+        Log a batch of settled bets from one agent
+        
+        Args:
+            agent (str): Agent id
+            results (array-like): "win" / "loss" per bet
+            confidences (array-like): Prediction confidence per bet
+            cost (float): Agent cost at the time of logging
+            profits (array-like): Profit or loss per bet (default 0)
+            timestamp (datetime): Event time (defaults to now)
+            stakes (array-like): Amount staked per bet (default 0)
+        """
+        win = np.asarray(results) == "win"
+        n = len(win)
+        if n == 0:
+            return
+        confidences = np.asarray(confidences, dtype=float)
+        profits = np.zeros(n) if profits is None else np.asarray(profits, dtype=float)
+        stakes = np.zeros(n) if stakes is None else np.asarray(stakes, dtype=float)
+        timestamp = np.datetime64(timestamp or datetime.now(), "ns")
+        
+        with self.lock:
+            start = 0
+            while start < n:
+                take = min(n - start, self.chunk_size - self.active_size)
+                rows = slice(self.active_size, self.active_size + take)
+                batch = slice(start, start + take)
+                self.active["timestamp"][rows] = timestamp
+                self.active["agent"][rows] = agent
+                self.active["win"][rows] = win[batch]
+                self.active["confidence"][rows] = confidences[batch]
+                self.active["cost"][rows] = cost
+                self.active["stake"][rows] = stakes[batch]
+                self.active["profit"][rows] = profits[batch]
+                self.active_size += take
+                start += take
+                if self.active_size == self.chunk_size:
+                    self._seal()
+            self._accumulate(win, profits, np.full(n, cost), stakes)
+            
+    def _seal(self):
+        chunk = {name: values[:self.active_size] for name, values in self.active.items()}
+        if self.segment_dir:
+            path = os.path.join(self.segment_dir, f"segment_{len(self.sealed):06d}.npz")
+            np.savez(path, **chunk)
+            self.sealed.append(path)
+        else:
+            self.sealed.append(chunk)
+        self.sealed_sizes.append(self.active_size)
+        self._new_chunk()
+        
+    def flush(self):
+        """Seal the current partial chunk (persisting it if configured)"""
+        with self.lock:
+            if self.active_size:
+                self._seal()
+                
+    def summary(self):
+        """Running totals without touching the stored events"""
+        with self.lock:
+            return {
+                "bets": self.total,
+                "wins": self.wins,
+                "win_rate": self.wins / self.total if self.total else 0.0,
+                "staked": self.staked,
+                "profit": self.profit,
+                "cost": self.cost
+            }
+            
+    def to_frame(self, start=0):
+        """
+        Events from row `start` onwards as a DataFrame in logging order
+        
+        Columns: timestamp, agent, result ("win" / "loss"), confidence,
+        cost, stake and profit. Sealed chunks that end before `start` are not
+        read at all.
+        """
+        with self.lock:
+            sealed = list(zip(self.sealed, self.sealed_sizes))
+            active = {name: values[:self.active_size].copy() for name, values in self.active.items()}
+            
+        parts = []
+        offset = 0
+        for chunk, size in sealed + [(active, len(active["win"]))]:
+            skip = max(0, start - offset)
+            offset += size
+            if skip >= size:
+                continue
+            if isinstance(chunk, str):
+                with np.load(chunk) as segment:
+                    chunk = self._read_segment(segment)
+            parts.append({name: values[skip:] for name, values in chunk.items()})
+        if not parts:
+            parts.append({name: values[:0] for name, values in active.items()})
+        
+        frame = pd.DataFrame({
+            name: np.concatenate([part[name] for part in parts]) for name in _COLUMNS
+        })
+        frame.insert(2, "result", np.where(frame.pop("win"), "win", "loss"))
+        return frame
@@ -0,0 +1,203 @@
+import threading
+import numpy as np
+import pandas as pd
+
+# Match outcomes that count as "double chance" for the DC_BTTS market
+DOUBLE_CHANCE_RESULTS = ["home_win", "away_win", "draw"]
+
+_COLUMNS = {
+    "timestamp": "datetime64[ns]",
+    "match_id": object,
+    "prediction": bool,
+    "confidence": float,
+    "stake": float,
+    "bookmaker_odds": float,
+    "verified": bool,
+    "correct": bool,
+    "actual": object,
+    "both_scored": bool
+}
+
+class MatchIndexedLog:
+    """
+    Append-only columnar log whose open rows are indexed by match_id
+    
+    Each column is a NumPy array grown by doubling; subclasses declare
+    them in COLUMNS (timestamp and match_id are always present). Open
+    rows are kept per match_id, so settling a batch of results only
+    touches the rows for those matches instead of rescanning the log.
+    """
+    
+    COLUMNS = {"timestamp": "datetime64[ns]", "match_id": object}
+    
+    def __init__(self, capacity=1024):
+        self.columns = {
+            name: np.zeros(capacity, dtype=dtype) for name, dtype in self.COLUMNS.items()
+        }
+        self.size = 0
+        self.open_by_match = {}
+        self.lock = threading.RLock()
+        
+    def __len__(self):
+        return self.size
+        
+    def _reserve(self, n):
+        capacity = len(self.columns["match_id"])
+        if self.size + n <= capacity:
+            return
+        while capacity < self.size + n:
+            capacity *= 2
+        for name, values in self.columns.items():
+            grown = np.zeros(capacity, dtype=values.dtype)
+            grown[:self.size] = values[:self.size]
+            self.columns[name] = grown
+            
+    def _append(self, match_ids, values):
+        """
+        Append open rows stamped now; call with the lock held
+        
+        Args:
+            match_ids (list): Fixture id per row
+            values (dict): Column name -> scalar or per-row values
+            
+        Returns:
+            np.ndarray: Row ids of the new entries
+        """
+        n = len(match_ids)
+        timestamp = np.datetime64(pd.Timestamp.now().to_datetime64(), "ns")
+        self._reserve(n)
+        rows = np.arange(self.size, self.size + n)
+        self.columns["timestamp"][rows] = timestamp
+        self.columns["match_id"][rows] = match_ids
+        for name, column in values.items():
+            self.columns[name][rows] = column
+        self.size += n
+        for row, match_id in zip(rows.tolist(), match_ids):
+            self.open_by_match.setdefault(match_id, []).append(row)
+        return rows
+        
+    def _take_open(self, results):
+        """
+        Close the open rows of every fixture in a results batch
+        
+        Call with the lock held; results must be de-duplicated by match_id.
+        
+        Returns:
+            tuple: (row ids, position of each row's result in results)
+        """
+        rows, positions = [], []
+        for position, match_id in enumerate(results["match_id"].tolist()):
+            open_rows = self.open_by_match.pop(match_id, None)
+            if open_rows:
+                rows.extend(open_rows)
+                positions.extend([position] * len(open_rows))
+        return np.asarray(rows, dtype=np.int64), np.asarray(positions, dtype=np.int64)
+        
+    @staticmethod
+    def outcomes(results, positions=None):
+        """(actual result, both_scored, DC_BTTS hit) per results row or position"""
+        actual = results["result"].to_numpy(dtype=object)
+        both_scored = results["both_scored"].to_numpy(dtype=bool)
+        if positions is not None:
+            actual, both_scored = actual[positions], both_scored[positions]
+        return actual, both_scored, np.isin(actual, DOUBLE_CHANCE_RESULTS) & both_scored
+        
+    def to_frame(self, rows=None):
+        """Columns of the given rows (default: all) as a DataFrame"""
+        with self.lock:
+            if rows is None:
+                rows = slice(0, self.size)
+            frame = pd.DataFrame({name: values[rows] for name, values in self.columns.items()})
+        return frame
+
+class PredictionLedger(MatchIndexedLog):
+    """
+    Append-only columnar log of predictions awaiting settlement
+    
+    Unsettled rows are indexed by match_id (plus a set of unsettled row
+    ids), so settling a batch of results only touches the rows for those
+    matches.
+    """
+    
+    COLUMNS = _COLUMNS
+    
+    def __init__(self, capacity=1024):
+        super().__init__(capacity)
+        self.unsettled = set()
+        
+    def record_frame(self, predictions):
+        """
+        Append a batch of predictions
+        
+        Args:
+            predictions (pd.DataFrame): match_id, prediction and confidence,
+                optionally stake and bookmaker_odds
+                
+        Returns:
+            np.ndarray: Row ids of the new entries
+        """
+        n = len(predictions)
+        if n == 0:
+            return np.arange(0)
+        values = {
+            "prediction": predictions["prediction"].to_numpy(dtype=bool),
+            "confidence": predictions["confidence"].to_numpy(dtype=float)
+        }
+        for name in ["stake", "bookmaker_odds"]:
+            if name in predictions.columns:
+                values[name] = predictions[name].to_numpy(dtype=float)
+            else:
+                values[name] = 0.0 if name == "stake" else np.nan
+        with self.lock:
+            rows = self._append(predictions["match_id"].tolist(), values)
+            self.unsettled.update(rows.tolist())
+        return rows
+        
+    def record(self, match_id, prediction, confidence, stake=0.0, bookmaker_odds=np.nan):
+        """Append a single prediction; returns its row id"""
+        return int(self.record_frame(pd.DataFrame({
+            "match_id": [match_id],
+            "prediction": [prediction],
+            "confidence": [confidence],
+            "stake": [stake],
+            "bookmaker_odds": [bookmaker_odds]
+        }))[0])
+        
+    def set_stakes(self, rows, stakes):
+        """Fill in the stakes sized after the predictions were recorded"""
+        rows = np.asarray(rows, dtype=np.int64)
+        with self.lock:
+            self.columns["stake"][rows] = np.asarray(stakes, dtype=float)
+            
+    def unsettled_match_ids(self):
+        with self.lock:
+            return list(self.open_by_match)
+            
+    def settle(self, results):
+        """
+        Settle every open prediction covered by a batch of results
+        
+        Args:
+            results (pd.DataFrame): match_id, result and both_scored
+            
+        Returns:
+            pd.DataFrame: The newly settled rows (see to_frame)
+        """
+        if results is None or results.empty:
+            return self.to_frame(np.arange(0))
+        results = results.drop_duplicates("match_id", keep="last")
+        
+        with self.lock:
+            rows, positions = self._take_open(results)
+            if not len(rows):
+                return self.to_frame(np.arange(0))
+                
+            actual, both_scored, hit = self.outcomes(results, positions)
+            prediction = self.columns["prediction"][rows]
+            
+            self.columns["actual"][rows] = actual
+            self.columns["both_scored"][rows] = both_scored
+            self.columns["correct"][rows] = np.where(hit, prediction, ~prediction)
+            self.columns["verified"][rows] = True
+            self.unsettled.difference_update(rows.tolist())
+        return self.to_frame(rows)
@@ -0,0 +1,114 @@
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime, date
+import numpy as np
+import pandas as pd
+from config import Config
+
+def _to_json(value):
+    """json.dumps fallback for the pandas / NumPy values found in reports"""
+    if isinstance(value, (pd.Timestamp, datetime, date)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, pd.DataFrame):
+        return value.to_dict("records")
+    if hasattr(value, "to_plotly_json"):
+        return value.to_plotly_json()
+    return str(value)
+
+class ReportStore:
+    """
+    Versioned SQLite (WAL) store of published reports
+    
+    The pipeline publishes reports; the dashboard process polls for the
+    latest version. Polling first checks SQLite's `PRAGMA data_version`,
+    which only changes when another connection commits, so an unchanged
+    store is detected without reading the table, and the decoded latest
+    report is cached so every client shares one decode per version.
+    """
+    
+    def __init__(self, path=None):
+        self.path = path or Config.REPORT_STORE_PATH
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS reports ("
+            "version INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "created_at TEXT NOT NULL, "
+            "payload TEXT NOT NULL)"
+        )
+        self.conn.commit()
+        
+        self._data_version = None
+        self._version = None
+        self._cached = (None, None)
+        
+    def publish(self, report):
+        """Store a report; returns its version"""
+        payload = json.dumps(report, default=_to_json)
+        with self.lock:
+            cursor = self.conn.execute(
+                "INSERT INTO reports (created_at, payload) VALUES (?, ?)",
+                (datetime.now().isoformat(), payload)
+            )
+            self.conn.commit()
+            # Prune old versions; readers only ever want the latest
+            self.conn.execute(
+                "DELETE FROM reports WHERE version <= ?",
+                (cursor.lastrowid - Config.REPORT_STORE_KEEP,)
+            )
+            self.conn.commit()
+            # data_version does not move for this connection's own commits
+            self._version = cursor.lastrowid
+            return cursor.lastrowid
+            
+    def latest_version(self):
+        """Newest version, or None while the store is empty"""
+        with self.lock:
+            data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self._data_version or self._version is None:
+                row = self.conn.execute("SELECT MAX(version) FROM reports").fetchone()
+                self._version = row[0]
+                self._data_version = data_version
+            return self._version
+            
+    def latest(self):
+        """(version, report) of the newest report, or (None, None)"""
+        version = self.latest_version()
+        if version is None:
+            return None, None
+        cached_version, report = self._cached
+        if cached_version == version:
+            return version, report
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT payload FROM reports WHERE version = ?", (version,)
+            ).fetchone()
+        if row is None:
+            return None, None
+        report = json.loads(row[0])
+        self._cached = (version, report)
+        return version, report
+        
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+_report_store = None
+
+def get_report_store():
+    """Process-wide report store"""
+    global _report_store
+    if _report_store is None:
+        _report_store = ReportStore()
+    return _report_store
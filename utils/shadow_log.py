@@ -0,0 +1,192 @@
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from config import Config
+from .prediction_ledger import MatchIndexedLog
+
+_COLUMNS = {
+    "timestamp": "datetime64[ns]",
+    "match_id": object,
+    "model": "U64",
+    "production": bool,
+    "probability": float,
+    "bookmaker_odds": float,
+    "settled": bool,
+    "outcome": bool
+}
+
+class ShadowLog(MatchIndexedLog):
+    """
+    Columnar log of production and candidate scores for online A/B evaluation
+    
+    Every model's probability for every fixture is one row, stored and
+    settled like the prediction ledger. Settling updates per-model
+    running totals (log-loss, Brier score, calibration bins and
+    flat-stake ROI), so metrics() never rescans the log. Candidate scores
+    arrive from a background thread, possibly after their fixture has
+    settled; outcomes of the last Config.SHADOW_OUTCOME_RETENTION settled
+    matches are remembered, so such rows are settled as soon as they are
+    recorded.
+    
+    ROI assumes a one-unit stake on every fixture where the model's
+    probability beats the implied probability by Config.VALUE_THRESHOLD.
+    """
+    
+    COLUMNS = _COLUMNS
+    
+    def __init__(self, capacity=1024, calibration_bins=None, outcome_retention=None):
+        super().__init__(capacity)
+        self.bins = calibration_bins or Config.SHADOW_CALIBRATION_BINS
+        self.outcome_retention = outcome_retention or Config.SHADOW_OUTCOME_RETENTION
+        self.totals = {}
+        self.outcome_by_match = OrderedDict()
+        
+    def record(self, model, match_ids, probabilities, bookmaker_odds=None, production=False):
+        """
+        Append one model's scores for a batch of fixtures
+        
+        Args:
+            model (str): Model label (e.g. "v3" or a candidate name)
+            match_ids (array-like): Fixture ids
+            probabilities (array-like): Probability of the target outcome
+            bookmaker_odds (array-like): Best available price per fixture
+            production (bool): Whether these are the served scores
+        """
+        match_ids = list(match_ids)
+        n = len(match_ids)
+        if n == 0:
+            return
+        odds = np.full(n, np.nan) if bookmaker_odds is None else np.asarray(bookmaker_odds, dtype=float)
+        with self.lock:
+            rows = self._append(match_ids, {
+                "model": model,
+                "production": production,
+                "probability": np.asarray(probabilities, dtype=float),
+                "bookmaker_odds": odds
+            })
+            # Fixtures that settled before these scores arrived
+            late = [
+                (row, self.outcome_by_match[match_id])
+                for row, match_id in zip(rows.tolist(), match_ids)
+                if match_id in self.outcome_by_match
+            ]
+            if late:
+                for match_id in set(match_ids) & self.outcome_by_match.keys():
+                    self.open_by_match.pop(match_id, None)
+                late_rows, outcome = (np.asarray(values) for values in zip(*late))
+                self._close(late_rows, outcome.astype(bool))
+                
+    def settle(self, results):
+        """
+        Settle every open row covered by a batch of results
+        
+        Args:
+            results (pd.DataFrame): match_id, result and both_scored
+            
+        Returns:
+            int: Number of rows settled
+        """
+        if results is None or results.empty:
+            return 0
+        results = results.drop_duplicates("match_id", keep="last")
+        _, _, hit = self.outcomes(results)
+        
+        with self.lock:
+            self.outcome_by_match.update(zip(results["match_id"].tolist(), hit.tolist()))
+            while len(self.outcome_by_match) > self.outcome_retention:
+                self.outcome_by_match.popitem(last=False)
+            rows, positions = self._take_open(results)
+            if not len(rows):
+                return 0
+            self._close(rows, hit[positions])
+        return len(rows)
+        
+    def _close(self, rows, outcome):
+        self.columns["outcome"][rows] = outcome
+        self.columns["settled"][rows] = True
+        self._accumulate(rows, outcome)
+        
+    def _accumulate(self, rows, outcome):
+        labels = self.columns["model"][rows]
+        probability = self.columns["probability"][rows]
+        odds = self.columns["bookmaker_odds"][rows]
+        production = self.columns["production"][rows]
+        
+        clipped = np.clip(probability, 1e-12, 1 - 1e-12)
+        log_loss = -np.where(outcome, np.log(clipped), np.log(1 - clipped))
+        brier = (probability - outcome) ** 2
+        bins = np.minimum((probability * self.bins).astype(int), self.bins - 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bet = np.nan_to_num(probability - 1 / odds, nan=-np.inf) > Config.VALUE_THRESHOLD
+        pnl = np.where(bet, np.where(outcome, odds - 1, -1.0), 0.0)
+        
+        names, codes = np.unique(labels, return_inverse=True)
+        for code, name in enumerate(names):
+            mask = codes == code
+            totals = self.totals.setdefault(str(name), {
+                "production": False,
+                "settled": 0,
+                "log_loss": 0.0,
+                "brier": 0.0,
+                "bets": 0,
+                "pnl": 0.0,
+                "bin_count": np.zeros(self.bins),
+                "bin_prob": np.zeros(self.bins),
+                "bin_hits": np.zeros(self.bins)
+            })
+            totals["production"] = totals["production"] or bool(production[mask].any())
+            totals["settled"] += int(mask.sum())
+            totals["log_loss"] += float(log_loss[mask].sum())
+            totals["brier"] += float(brier[mask].sum())
+            totals["bets"] += int(bet[mask].sum())
+            totals["pnl"] += float(pnl[mask].sum())
+            totals["bin_count"] += np.bincount(bins[mask], minlength=self.bins)
+            totals["bin_prob"] += np.bincount(bins[mask], weights=probability[mask], minlength=self.bins)
+            totals["bin_hits"] += np.bincount(bins[mask], weights=outcome[mask], minlength=self.bins)
+            
+    def metrics(self):
+        """
+        Online evaluation of every model with settled rows
+        
+        Returns:
+            pd.DataFrame: One row per model with settled, log_loss, brier,
+                ece (expected calibration error), bets, profit and roi
+        """
+        with self.lock:
+            rows = []
+            for name, totals in self.totals.items():
+                settled = totals["settled"]
+                count = totals["bin_count"]
+                filled = count > 0
+                gap = np.abs(totals["bin_prob"][filled] - totals["bin_hits"][filled])
+                rows.append({
+                    "model": name,
+                    "production": totals["production"],
+                    "settled": settled,
+                    "log_loss": totals["log_loss"] / settled,
+                    "brier": totals["brier"] / settled,
+                    "ece": float(gap.sum() / settled),
+                    "bets": totals["bets"],
+                    "profit": totals["pnl"],
+                    "roi": totals["pnl"] / totals["bets"] if totals["bets"] else 0.0
+                })
+        return pd.DataFrame(rows, columns=[
+            "model", "production", "settled", "log_loss", "brier", "ece", "bets", "profit", "roi"
+        ])
+        
+    def calibration(self, model):
+        """Per-bin mean predicted probability, observed rate and count for one model"""
+        with self.lock:
+            totals = self.totals.get(model)
+            if totals is None:
+                return pd.DataFrame(columns=["bin", "predicted", "observed", "count"])
+            count = totals["bin_count"].copy()
+            with np.errstate(divide="ignore", invalid="ignore"):
+                predicted = totals["bin_prob"] / count
+                observed = totals["bin_hits"] / count
+        return pd.DataFrame({
+            "bin": np.arange(self.bins) / self.bins,
+            "predicted": predicted,
+            "observed": observed,
+            "count": count.astype(int)
+        })
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+from config import Config
+
+VALUE_COLUMNS = [
+    "match_id",
+    "home_team",
+    "away_team",
+    "prediction",
+    "confidence",
+    "bookmaker_odds"
+]
+
+def find_value(predictions, thresholds=None, bet_types=None):
+    """
+    Columnar value detection over a predictions frame
+    
+    Value is prediction_prob minus the bookmaker's implied probability,
+    taken from the value_score column when PredictionEngineAgent has
+    already computed it. A single pass evaluates every threshold: each
+    selected row is tagged with the highest threshold its |value_score|
+    exceeds.
+    
+    Args:
+        predictions (pd.DataFrame): prediction_prob and bookmaker_odds
+            (or value_score) plus the VALUE_COLUMNS present
+        thresholds (list): Minimum |value_score| levels (defaults to
+            [Config.VALUE_THRESHOLD])
+        bet_types (list): Keep only these of "UNDERVALUE" / "OVERVALUE"
+        
+    Returns:
+        pd.DataFrame: One row per value selection with value_score,
+            bet_type and threshold columns
+    """
+    thresholds = np.sort(np.asarray(thresholds or [Config.VALUE_THRESHOLD], dtype=float))
+    columns = [c for c in VALUE_COLUMNS if c in predictions.columns]
+    if predictions.empty:
+        return pd.DataFrame(columns=columns + ["value_score", "bet_type", "threshold"])
+        
+    if "value_score" in predictions.columns:
+        value = predictions["value_score"].to_numpy(dtype=float)
+    else:
+        value = (
+            predictions["prediction_prob"].to_numpy(dtype=float)
+            - 1.0 / predictions["bookmaker_odds"].to_numpy(dtype=float)
+        )
+        
+    # Number of thresholds strictly below |value|; 0 means no value
+    tier = np.searchsorted(thresholds, np.abs(value), side="left")
+    mask = (tier > 0) & np.isfinite(value)
+    undervalue = value > 0
+    if bet_types is not None:
+        wanted = set(bet_types)
+        if "UNDERVALUE" not in wanted:
+            mask &= ~undervalue
+        if "OVERVALUE" not in wanted:
+            mask &= undervalue
+            
+    selected = predictions.loc[mask, columns].copy()
+    selected["value_score"] = value[mask]
+    selected["bet_type"] = np.where(undervalue[mask], "UNDERVALUE", "OVERVALUE")
+    selected["threshold"] = thresholds[tier[mask] - 1]
+    return selected
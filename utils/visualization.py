@@ -1,43 +1,231 @@
+import threading
+import weakref
 import plotly.graph_objects as go
 import plotly.express as px
 import numpy as np
 import pandas as pd
 from config import Config
 
-def create_performance_history(performance_log):
+WIN_COLOR = '#2EFE2E'
+LOSS_COLOR = '#FE2E2E'
+
+def performance_frame(performance_log):
     """
-    Create a performance history line chart with win/loss indicators
+    Performance events as a time-ordered DataFrame
     
     Args:
-        performance_log (list): List of performance records from conductor
-        
+        performance_log (PerformanceLog or list): Conductor performance log,
+            or a list of performance record dicts
+            
     Returns:
-        plotly.graph_objs._figure.Figure: Performance history figure
+        pd.DataFrame: timestamp, result, confidence, cost (and profit) columns
     """
-    if not performance_log:
-        return create_empty_plot("No performance data available")
-    
-    # Create DataFrame from performance log
+    if hasattr(performance_log, "to_frame"):
+        # Append-only log: already in time order
+        return performance_log.to_frame()
     df = pd.DataFrame(performance_log)
     df['timestamp'] = pd.to_datetime(df['timestamp'])
-    df.sort_values('timestamp', inplace=True)
+    return df.sort_values('timestamp')
+
+def lttb(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling
     
-    # Calculate cumulative win rate
-    df['win'] = df['result'] == 'win'
-    df['cumulative_wins'] = df['win'].cumsum()
-    df['total_bets'] = np.arange(1, len(df) + 1)
-    df['win_rate'] = df['cumulative_wins'] / df['total_bets']
+    Keeps the first and last points and, from each of n_out - 2 equal
+    buckets in between, the point forming the largest triangle with the
+    previously kept point and the next bucket's average. The visual
+    shape of the series survives with a fixed number of points.
     
-    # Create colors based on win/loss
-    colors = ['#2EFE2E' if res == 'win' else '#FE2E2E' for res in df['result']]
+    Args:
+        x (np.ndarray): Ascending numeric x values
+        y (np.ndarray): y values
+        n_out (int): Number of points to keep
+        
+    Returns:
+        np.ndarray: Ascending indices of the kept points
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    x = x - x[0]
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    
+    # Bucket averages from prefix sums; the last bucket looks ahead to the final point
+    counts = np.diff(edges)
+    sum_x = np.concatenate([[0.0], np.cumsum(x)])
+    sum_y = np.concatenate([[0.0], np.cumsum(y)])
+    avg_x = (sum_x[edges[1:]] - sum_x[edges[:-1]]) / counts
+    avg_y = (sum_y[edges[1:]] - sum_y[edges[:-1]]) / counts
+    next_x = np.append(avg_x[1:], x[-1])
+    next_y = np.append(avg_y[1:], y[-1])
+    
+    selected = np.empty(n_out, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs(
+            (x[a] - next_x[i]) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (next_y[i] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+def result_colors(win):
+    """Marker color per bet, vectorized"""
+    return np.where(win, WIN_COLOR, LOSS_COLOR)
+
+def result_labels(win):
+    return np.where(win, "WIN", "LOSS")
+
+class PerformanceCharts:
+    """
+    Incrementally updated performance history and ROI figures
+    
+    The cumulative series already computed for a performance log are kept
+    between renders, so each render only folds in events logged since the
+    last one. Figures are built once and then only have their trace data
+    replaced, downsampled with LTTB to a fixed point budget so that the
+    payload stays bounded however long the history gets.
     
-    # Create figure
+    Args:
+        performance_log (PerformanceLog or list): Source of events
+        point_budget (int): Max points per trace
+    """
+    
+    def __init__(self, performance_log, point_budget=None):
+        self.performance_log = performance_log
+        self.point_budget = point_budget or Config.CHART_POINT_BUDGET
+        self.rendered = 0
+        self.wins = 0
+        self.profit = 0.0
+        self.series = {
+            "timestamp": np.empty(0, dtype="datetime64[ns]"),
+            "win": np.empty(0, dtype=bool),
+            "confidence": np.empty(0),
+            "profit": np.empty(0),
+            "win_rate": np.empty(0),
+            "cumulative_profit": np.empty(0)
+        }
+        self.figures = {}
+        self.figure_rows = {}
+        self.lock = threading.Lock()
+        
+    def refresh(self):
+        """Fold in events logged since the last refresh"""
+        if hasattr(self.performance_log, "to_frame"):
+            new = self.performance_log.to_frame(start=self.rendered)
+        else:
+            new = performance_frame(self.performance_log).iloc[self.rendered:]
+        if new.empty:
+            return
+            
+        win = (new['result'] == 'win').to_numpy()
+        if 'profit' in new.columns:
+            profit = new['profit'].to_numpy(dtype=float)
+        else:
+            cost = new['cost'].to_numpy(dtype=float)
+            profit = np.where(win, cost * 10, -cost * 10)
+        cumulative_wins = self.wins + np.cumsum(win)
+        total_bets = self.rendered + np.arange(1, len(new) + 1)
+        cumulative_profit = self.profit + np.cumsum(profit)
+        
+        new_series = {
+            "timestamp": new['timestamp'].to_numpy(dtype="datetime64[ns]"),
+            "win": win,
+            "confidence": new['confidence'].to_numpy(dtype=float),
+            "profit": profit,
+            "win_rate": cumulative_wins / total_bets,
+            "cumulative_profit": cumulative_profit
+        }
+        for name, values in new_series.items():
+            self.series[name] = np.concatenate([self.series[name], values])
+        self.rendered += len(new)
+        self.wins = int(cumulative_wins[-1])
+        self.profit = float(cumulative_profit[-1])
+        
+    def sample(self, y):
+        """Indices of the points to draw for series y"""
+        x = self.series["timestamp"].astype(np.int64)
+        return lttb(x, y, self.point_budget)
+        
+    def _render(self, name, build, fill):
+        with self.lock:
+            self.refresh()
+            fig = self.figures.get(name)
+            if fig is None:
+                fig = self.figures[name] = build()
+            if self.figure_rows.get(name) != self.rendered:
+                fill(fig)
+                self.figure_rows[name] = self.rendered
+            return fig
+            
+    def history_figure(self):
+        """Cumulative win rate with per-bet markers"""
+        def fill(fig):
+            idx = self.sample(self.series["win_rate"])
+            x = self.series["timestamp"][idx]
+            win = self.series["win"][idx]
+            confidence = np.round(self.series["confidence"][idx] * 100).astype(int)
+            hover = np.char.add(
+                np.char.add(result_labels(win), " - Confidence: "),
+                np.char.mod("%d%%", confidence)
+            )
+            fig.data[0].update(x=x, y=self.series["win_rate"][idx])
+            fig.data[1].update(x=[x[0], x[-1]])
+            fig.data[2].update(
+                x=x,
+                y=np.full(len(idx), 0.05),
+                marker_color=result_colors(win),
+                hovertext=hover
+            )
+        return self._render("history", _performance_history_shell, fill)
+        
+    def roi_figure(self, initial_budget):
+        """Cumulative ROI against initial_budget with per-bet markers"""
+        def fill(fig):
+            roi = self.series["cumulative_profit"] / initial_budget
+            idx = self.sample(roi)
+            x = self.series["timestamp"][idx]
+            win = self.series["win"][idx]
+            hover = np.char.add(
+                np.char.add(result_labels(win), " - Profit: R"),
+                np.char.mod("%.2f", self.series["profit"][idx])
+            )
+            fig.data[0].update(x=x, y=roi[idx])
+            fig.data[1].update(x=x, y=roi[idx], marker_color=result_colors(win), hovertext=hover)
+            fig.layout.shapes[0].update(x0=x[0], x1=x[-1])
+            
+        # ROI depends on the budget, so each budget gets its own figure
+        return self._render(("roi", initial_budget), _roi_trend_shell, fill)
+
+_chart_cache = weakref.WeakKeyDictionary()
+
+def performance_charts(performance_log):
+    """
+    Chart state for a performance log
+    
+    A PerformanceLog keeps the same PerformanceCharts across calls, so
+    repeated renders are incremental; plain record lists get a fresh one.
+    """
+    if not hasattr(performance_log, "to_frame"):
+        return PerformanceCharts(performance_log)
+    charts = _chart_cache.get(performance_log)
+    if charts is None:
+        charts = _chart_cache[performance_log] = PerformanceCharts(performance_log)
+    return charts
+
+def _performance_history_shell():
     fig = go.Figure()
     
     # Add win rate line
     fig.add_trace(go.Scatter(
-        x=df['timestamp'],
-        y=df['win_rate'],
+        x=[],
+        y=[],
         mode='lines+markers',
         name='Win Rate',
         line=dict(color='#2ECCFA', width=4),
@@ -47,7 +235,7 @@ def create_performance_history(performance_log):
     
     # Add profit threshold
     fig.add_trace(go.Scatter(
-        x=[df['timestamp'].min(), df['timestamp'].max()],
+        x=[],
         y=[0.55, 0.55],
         mode='lines',
         name='Profit Threshold',
@@ -57,19 +245,14 @@ def create_performance_history(performance_log):
     
     # Add individual bet markers
     fig.add_trace(go.Scatter(
-        x=df['timestamp'],
-        y=[0.05] * len(df),
+        x=[],
+        y=[],
         mode='markers',
         name='Bets',
         marker=dict(
-            color=colors,
             size=12,
             line=dict(width=2, color='DarkSlateGrey')
         ),
-        hovertext=df.apply(
-            lambda row: f"{row['result'].upper()} - Confidence: {row['confidence']:.0%}", 
-            axis=1
-        ),
         hoverinfo='text'
     ))
     
@@ -95,6 +278,21 @@ def create_performance_history(performance_log):
     
     return fig
 
+def create_performance_history(performance_log):
+    """
+    Create a performance history line chart with win/loss indicators
+    
+    Args:
+        performance_log (PerformanceLog or list): Performance records from conductor
+        
+    Returns:
+        plotly.graph_objs._figure.Figure: Performance history figure
+    """
+    if not performance_log:
+        return create_empty_plot("No performance data available")
+        
+    return performance_charts(performance_log).history_figure()
+
 def create_value_bets_plot(value_bets):
     """
     Create a scatter plot of value bets showing odds vs confidence
@@ -249,7 +447,7 @@ def create_win_loss_pie(performance_log):
     Create a pie chart showing win/loss distribution
     
     Args:
-        performance_log (list): List of performance records
+        performance_log (PerformanceLog or list): Performance records
         
     Returns:
         plotly.graph_objs._figure.Figure: Win/loss pie chart
@@ -257,9 +455,14 @@ def create_win_loss_pie(performance_log):
     if not performance_log:
         return create_empty_plot("No performance data available")
     
-    df = pd.DataFrame(performance_log)
-    win_count = (df['result'] == 'win').sum()
-    loss_count = (df['result'] == 'loss').sum()
+    if hasattr(performance_log, "summary"):
+        summary = performance_log.summary()
+        win_count = summary["wins"]
+        loss_count = summary["bets"] - summary["wins"]
+    else:
+        df = pd.DataFrame(performance_log)
+        win_count = (df['result'] == 'win').sum()
+        loss_count = (df['result'] == 'loss').sum()
     
     fig = go.Figure()
     
@@ -281,40 +484,13 @@ def create_win_loss_pie(performance_log):
     
     return fig
 
-def create_roi_trend(performance_log, initial_budget):
-    """
-    Create ROI trend chart over time
-    
-    Args:
-        performance_log (list): List of performance records
-        initial_budget (float): Starting budget
-        
-    Returns:
-        plotly.graph_objs._figure.Figure: ROI trend chart
-    """
-    if not performance_log:
-        return create_empty_plot("No performance data available")
-    
-    df = pd.DataFrame(performance_log)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    df.sort_values('timestamp', inplace=True)
-    
-    # Calculate cumulative ROI
-    df['profit'] = df['cost'].apply(
-        lambda cost: cost * 10 if df.loc[df.index[0], 'result'] == 'win' else -cost * 10
-    )
-    df['cumulative_profit'] = df['profit'].cumsum()
-    df['roi'] = df['cumulative_profit'] / initial_budget
-    
-    # Create colors for markers
-    colors = ['#2EFE2E' if res == 'win' else '#FE2E2E' for res in df['result']]
-    
+def _roi_trend_shell():
     fig = go.Figure()
     
     # Add ROI line
     fig.add_trace(go.Scatter(
-        x=df['timestamp'],
-        y=df['roi'],
+        x=[],
+        y=[],
         mode='lines',
         name='ROI',
         line=dict(color='#2ECCFA', width=4),
@@ -323,27 +499,22 @@ def create_roi_trend(performance_log, initial_budget):
     
     # Add markers for individual bets
     fig.add_trace(go.Scatter(
-        x=df['timestamp'],
-        y=df['roi'],
+        x=[],
+        y=[],
         mode='markers',
         name='Bets',
         marker=dict(
-            color=colors,
             size=10,
             line=dict(width=2, color='DarkSlateGrey')
         ),
-        hovertext=df.apply(
-            lambda row: f"{row['result'].upper()} - Profit: R{row['profit']:.2f}", 
-            axis=1
-        ),
         hoverinfo='text'
     ))
     
     # Add break-even line
     fig.add_shape(
         type="line",
-        x0=df['timestamp'].min(),
-        x1=df['timestamp'].max(),
+        x0=0,
+        x1=1,
         y0=0,
         y1=0,
         line=dict(color="white", width=2, dash="dash"),
@@ -370,6 +541,22 @@ def create_roi_trend(performance_log, initial_budget):
     
     return fig
 
+def create_roi_trend(performance_log, initial_budget):
+    """
+    Create ROI trend chart over time
+    
+    Args:
+        performance_log (PerformanceLog or list): Performance records
+        initial_budget (float): Starting budget
+        
+    Returns:
+        plotly.graph_objs._figure.Figure: ROI trend chart
+    """
+    if not performance_log:
+        return create_empty_plot("No performance data available")
+        
+    return performance_charts(performance_log).roi_figure(initial_budget)
+
 def create_empty_plot(message="No data available"):
     """
     Create an empty plot with a message